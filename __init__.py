@@ -17,12 +17,29 @@ if "bpy" in locals():
         importlib.reload(properties)
     if "operators" in locals():
         importlib.reload(operators)
+        importlib.reload(operators.naming)
+        importlib.reload(operators.sdk_range)
+        if hasattr(operators, "symmetry"):
+            importlib.reload(operators.shape_math)
+            importlib.reload(operators.symmetry)
+        if hasattr(operators, "shape_mixer"):
+            importlib.reload(operators.shape_mixer)
+        if hasattr(operators, "mirror_link"):
+            operators.mirror_link.unregister_handler()
+            importlib.reload(operators.mirror_link)
         importlib.reload(operators.utils)
+        importlib.reload(operators.expressions)
         importlib.reload(operators.driver_ops)
         importlib.reload(operators.pose_ops)
         importlib.reload(operators.driver_ops)
         importlib.reload(operators.pose_ops)
         importlib.reload(operators.shape_ops)
+        importlib.reload(operators.validate_ops)
+        importlib.reload(operators.batch_ops)
+        importlib.reload(operators.mirror_ops)
+        importlib.reload(operators.live_ops)
+        importlib.reload(operators.bake_ops)
+        importlib.reload(operators.library_ops)
         importlib.reload(operators.update_ops)
     if "ui" in locals():
         importlib.reload(ui)
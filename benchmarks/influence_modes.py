@@ -0,0 +1,87 @@
+import bpy
+import addon_utils
+import importlib
+import time
+
+# Benchmark: Expression vs F-Curve influence mapping on a rig with many SDK constraints.
+# Run inside Blender with the addon enabled (any install folder / extension name):
+#   blender -b --python benchmarks/influence_modes.py
+
+ADDON_NAME = "Maya-Style Shape Key System"
+
+def _addon_package():
+    """Module name the addon is installed under, looked up by its bl_info name"""
+    for mod in addon_utils.modules():
+        if getattr(mod, "bl_info", {}).get("name") == ADDON_NAME and addon_utils.check(mod.__name__)[1]:
+            return mod.__name__
+    raise RuntimeError(f"Enable the '{ADDON_NAME}' addon before running the benchmark")
+
+set_influence_mapping = importlib.import_module(f"{_addon_package()}.operators.utils").set_influence_mapping
+
+NUM_SDKS = 500
+NUM_FRAMES = 200
+
+# Cleaning
+bpy.ops.object.select_all(action='SELECT')
+bpy.ops.object.delete()
+
+amt = bpy.data.armatures.new("BenchArm")
+obj = bpy.data.objects.new("BenchRig", amt)
+bpy.context.scene.collection.objects.link(obj)
+bpy.context.view_layer.objects.active = obj
+
+bpy.ops.object.mode_set(mode='EDIT')
+drv_b = amt.edit_bones.new("Driver")
+drv_b.head = (0, 0, 0)
+drv_b.tail = (0, 0, 1)
+for i in range(NUM_SDKS):
+    b = amt.edit_bones.new(f"Driven_{i:03d}")
+    b.head = (i * 0.1, 1, 0)
+    b.tail = (i * 0.1, 1, 1)
+bpy.ops.object.mode_set(mode='POSE')
+
+# One shared constant-pose action
+act = bpy.data.actions.new("SDK_ACT_Bench")
+fc = act.fcurves.new('location', index=0)
+fc.keyframe_points.insert(0, 0.0)
+fc.keyframe_points.insert(3, 1.0)
+
+fcurves = []
+for i in range(NUM_SDKS):
+    pb = obj.pose.bones[f"Driven_{i:03d}"]
+    const = pb.constraints.new('ACTION')
+    const.name = "SDK_Bench"
+    const.target = obj
+    const.subtarget = "Driver"
+    const.action = act
+    const.frame_start = 0
+    const.frame_end = 3
+    const.use_eval_time = True
+    const.eval_time = 3.0
+
+    d_fc = const.driver_add("influence")
+    var = d_fc.driver.variables.new()
+    var.name = "var"
+    var.type = 'TRANSFORMS'
+    var.targets[0].id = obj
+    var.targets[0].bone_target = "Driver"
+    var.targets[0].transform_type = 'LOC_X'
+    var.targets[0].transform_space = 'LOCAL_SPACE'
+    fcurves.append(d_fc)
+
+driver_pb = obj.pose.bones["Driver"]
+
+def run(mode):
+    for d_fc in fcurves:
+        set_influence_mapping(d_fc, 0.0, 1.0, mode)
+    bpy.context.view_layer.update()
+
+    start = time.perf_counter()
+    for f in range(NUM_FRAMES):
+        driver_pb.location[0] = (f % 20) / 10.0
+        bpy.context.view_layer.update()
+    return (time.perf_counter() - start) / NUM_FRAMES * 1000.0
+
+for mode in ('EXPRESSION', 'FCURVE'):
+    ms = run(mode)
+    print(f"{mode:<10}: {ms:.3f} ms/update ({NUM_SDKS} SDKs)")
@@ -1,4 +1,5 @@
 import bpy
+from .utils import HAS_NUMPY
 
 from .driver_ops import (
     BSETUP_OT_LoadDriver,
@@ -14,10 +15,16 @@ from .pose_ops import (
     BSETUP_OT_MirrorPoseDriver,
     BSETUP_OT_RemovePoseDriver,
     BSETUP_OT_SelectDrivenBones,
+    BSETUP_OT_ConvertInfluenceMode,
+    BSETUP_OT_CompilePoseStack,
+    BSETUP_OT_DecompilePoseStack,
 )
 
 from .shape_ops import (
     BSETUP_OT_AddComboShape,
+    BSETUP_OT_SculptCombo,
+    BSETUP_OT_CommitCombo,
+    BSETUP_OT_BuildComboLattice,
     BSETUP_OT_CreateNamedShape,
     BSETUP_OT_CreateInBetween,
     BSETUP_OT_SplitShape,
@@ -25,6 +32,38 @@ from .shape_ops import (
     BSETUP_OT_MirrorShapeAndDriver,
 )
 
+from .validate_ops import (
+    BSETUP_OT_ValidateDriverExpressions,
+)
+
+from .batch_ops import (
+    rig_build,
+    BSETUP_OT_BatchBegin,
+    BSETUP_OT_BatchCommit,
+    BSETUP_OT_BatchAbort,
+)
+
+from .mirror_ops import (
+    BSETUP_OT_MirrorRig,
+    BSETUP_OT_MirrorAllShapes,
+    BSETUP_OT_ToggleMirrorLink,
+)
+
+from .live_ops import (
+    BSETUP_OT_LiveSDKSession,
+)
+
+from .bake_ops import (
+    BSETUP_OT_BakeShapeDrivers,
+)
+
+from .library_ops import (
+    BSETUP_OT_ShapeKeyReport,
+    BSETUP_OT_ExportShapeLibrary,
+    BSETUP_OT_ImportShapeLibrary,
+    BSETUP_OT_CleanupShapeKeys,
+)
+
 from .update_ops import (
     BSETUP_OT_CheckForUpdates,
     BSETUP_OT_UpdateAddon,
@@ -39,14 +78,33 @@ classes = (
     BSETUP_OT_RemovePoseDriver,
     BSETUP_OT_MirrorPoseDriver,
     BSETUP_OT_SelectDrivenBones,
+    BSETUP_OT_ConvertInfluenceMode,
+    BSETUP_OT_CompilePoseStack,
+    BSETUP_OT_DecompilePoseStack,
     BSETUP_OT_AddComboShape,
+    BSETUP_OT_SculptCombo,
+    BSETUP_OT_CommitCombo,
+    BSETUP_OT_BuildComboLattice,
     BSETUP_OT_CreateNamedShape,
     BSETUP_OT_CreateInBetween,
     BSETUP_OT_SetChannel,
     BSETUP_OT_MirrorDriver,
     BSETUP_OT_MirrorShapeAndDriver,
+    BSETUP_OT_MirrorRig,
+    BSETUP_OT_MirrorAllShapes,
+    BSETUP_OT_ToggleMirrorLink,
     BSETUP_OT_SplitShape,
     BSETUP_OT_CreateAsymShape,
+    BSETUP_OT_ValidateDriverExpressions,
+    BSETUP_OT_BatchBegin,
+    BSETUP_OT_BatchCommit,
+    BSETUP_OT_BatchAbort,
+    BSETUP_OT_LiveSDKSession,
+    BSETUP_OT_BakeShapeDrivers,
+    BSETUP_OT_ShapeKeyReport,
+    BSETUP_OT_ExportShapeLibrary,
+    BSETUP_OT_ImportShapeLibrary,
+    BSETUP_OT_CleanupShapeKeys,
     BSETUP_OT_CheckForUpdates,
     BSETUP_OT_UpdateAddon,
 )
@@ -58,8 +116,23 @@ def register():
         except ValueError:
             bpy.utils.unregister_class(cls)
             bpy.utils.register_class(cls)
+            
+    from . import batch_ops
+    batch_ops.register_handlers()
+    
+    if HAS_NUMPY:
+        from . import mirror_link
+        mirror_link.register_handler()
 
 def unregister():
+    from . import batch_ops, live_ops
+    batch_ops.unregister_handlers()
+    live_ops.unregister_handler()
+    
+    if HAS_NUMPY:
+        from . import mirror_link
+        mirror_link.unregister_handler()
+        
     for cls in reversed(classes):
         try:
             bpy.utils.unregister_class(cls)
@@ -0,0 +1,173 @@
+import bpy
+from .utils import linear_keyframes, read_keyframes, write_keyframes, HAS_NUMPY
+
+if HAS_NUMPY:
+    import numpy as np
+
+# Key custom properties written by the bake so it can be undone later
+BAKE_MUTED_PROP = "_sdk_bake_muted"       # data paths of the drivers muted by the bake
+BAKE_PREV_ACTION_PROP = "_sdk_bake_prev"  # action assigned to the Key before the bake ("" if none)
+
+
+class BSETUP_OT_BakeShapeDrivers(bpy.types.Operator):
+    """Bake the driven shape key values of the active mesh into one shape key action over a frame range"""
+    bl_idname = "bsetup.bake_shape_drivers"
+    bl_label = "Bake Shape Drivers"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('BAKE', "Bake", "Evaluate the drivers over the frame range and key the values into an action"),
+            ('RESTORE', "Restore", "Unmute the drivers muted by the last bake and reassign the previous action"),
+        ],
+        default='BAKE'
+    )
+
+    frame_start: bpy.props.IntProperty(name="Start Frame", default=1)
+    frame_end: bpy.props.IntProperty(name="End Frame", default=250)
+    frame_step: bpy.props.IntProperty(name="Step", default=1, min=1)
+
+    only_driven: bpy.props.BoolProperty(
+        name="Only Driven Keys",
+        description="Bake only shape keys that have a driver (otherwise every shape key value is keyed)",
+        default=True
+    )
+
+    mute_drivers: bpy.props.BoolProperty(
+        name="Mute Drivers",
+        description="Mute the baked drivers so playback reads the action only",
+        default=True
+    )
+
+    action_name: bpy.props.StringProperty(
+        name="Action Name",
+        description="Name of the baked action. Leave empty for '<Object>_ShapeBake'",
+        default=""
+    )
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or obj.type != 'MESH' or not obj.data.shape_keys:
+            self.report({'ERROR'}, "Select a Mesh Object with Shape Keys")
+            return {'CANCELLED'}
+
+        key = obj.data.shape_keys
+        if self.mode == 'RESTORE':
+            return self.restore(key)
+
+        if not HAS_NUMPY:
+            self.report({'ERROR'}, "Baking requires numpy")
+            return {'CANCELLED'}
+
+        if self.frame_end < self.frame_start:
+            self.report({'ERROR'}, "End Frame is before Start Frame")
+            return {'CANCELLED'}
+
+        key_blocks = key.key_blocks
+        drivers = {fc.data_path: fc for fc in key.animation_data.drivers} if key.animation_data else {}
+        paths = [f'key_blocks["{kb.name}"].value' for kb in key_blocks]
+        baked = [i for i, kb in enumerate(key_blocks)
+                 if kb != key.reference_key and (paths[i] in drivers or not self.only_driven)]
+        if not baked:
+            self.report({'WARNING'}, "No driven shape keys to bake")
+            return {'CANCELLED'}
+
+        # A re-bake evaluates the original setup: drivers muted by the last bake are
+        # unmuted and the action from before the bake is assigned while sampling
+        anim = key.animation_data or key.animation_data_create()
+        baked_action = anim.action
+        if BAKE_PREV_ACTION_PROP in key:
+            source_action = bpy.data.actions.get(key[BAKE_PREV_ACTION_PROP])
+        else:
+            source_action = anim.action
+        remuted = [drivers[p] for p in key.get(BAKE_MUTED_PROP, []) if p in drivers and drivers[p].mute]
+
+        # 1. EVALUATE: one depsgraph evaluation and one foreach_get per frame
+        scene = context.scene
+        frame_orig = scene.frame_current
+        frames = np.arange(self.frame_start, self.frame_end + 1, self.frame_step)
+        values = np.empty((len(frames), len(key_blocks)), dtype=np.float32)
+        try:
+            for fc in remuted:
+                fc.mute = False
+            anim.action = source_action
+            depsgraph = context.evaluated_depsgraph_get()
+            for i, frame in enumerate(frames):
+                scene.frame_set(int(frame))
+                key.evaluated_get(depsgraph).key_blocks.foreach_get("value", values[i])
+        finally:
+            for fc in remuted:
+                fc.mute = True
+            anim.action = baked_action
+            scene.frame_set(frame_orig)
+
+        # 2. WRITE: one F-Curve per key, all keyframes set with foreach_set
+        name = self.action_name or f"{obj.name}_ShapeBake"
+        action = bpy.data.actions.get(name) or bpy.data.actions.new(name)
+
+        if BAKE_PREV_ACTION_PROP not in key:
+            key[BAKE_PREV_ACTION_PROP] = source_action.name if source_action and source_action != action else ""
+        anim.action = action
+
+        # Keys animated in the previous action but not baked keep their animation
+        baked_paths = {paths[i] for i in baked}
+        copied = 0
+        if source_action and source_action != action:
+            for src in source_action.fcurves:
+                if src.data_path in baked_paths or action.fcurves.find(src.data_path, index=src.array_index):
+                    continue
+                fc = action.fcurves.new(src.data_path, index=src.array_index,
+                                        action_group=src.group.name if src.group else "")
+                write_keyframes(fc, read_keyframes(src))
+                fc.extrapolation = src.extrapolation
+                fc.mute = src.mute
+                copied += 1
+
+        for i in baked:
+            fc = action.fcurves.find(paths[i])
+            if fc is None:
+                fc = action.fcurves.new(paths[i], action_group="Shape Keys")
+            write_keyframes(fc, linear_keyframes(np.column_stack((frames, values[:, i]))))
+
+        muted = set(key.get(BAKE_MUTED_PROP, []))
+        if self.mute_drivers:
+            for i in baked:
+                fc = drivers.get(paths[i])
+                if fc and not fc.mute:
+                    fc.mute = True
+                    muted.add(paths[i])
+        key[BAKE_MUTED_PROP] = sorted(muted)
+
+        kept = f", kept {copied} animated F-Curves" if copied else ""
+        self.report({'INFO'}, f"Baked {len(baked)} shape keys over {len(frames)} frames into '{action.name}'{kept}")
+        return {'FINISHED'}
+
+    def restore(self, key):
+        if BAKE_MUTED_PROP not in key and BAKE_PREV_ACTION_PROP not in key:
+            self.report({'WARNING'}, "Shape keys were not baked")
+            return {'CANCELLED'}
+
+        drivers = {fc.data_path: fc for fc in key.animation_data.drivers} if key.animation_data else {}
+        unmuted = 0
+        for path in key.get(BAKE_MUTED_PROP, []):
+            if path in drivers:
+                drivers[path].mute = False
+                unmuted += 1
+
+        if key.animation_data and BAKE_PREV_ACTION_PROP in key:
+            key.animation_data.action = bpy.data.actions.get(key[BAKE_PREV_ACTION_PROP])
+
+        for prop in (BAKE_MUTED_PROP, BAKE_PREV_ACTION_PROP):
+            if prop in key:
+                del key[prop]
+
+        self.report({'INFO'}, f"Restored {unmuted} drivers")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        if self.mode == 'BAKE':
+            self.frame_start = context.scene.frame_start
+            self.frame_end = context.scene.frame_end
+            return context.window_manager.invoke_props_dialog(self)
+        return self.execute(context)
@@ -0,0 +1,93 @@
+import bpy
+from bpy.app.handlers import persistent
+from contextlib import contextmanager
+from .utils import begin_batch, end_batch, batch_active, reset_batch, drop_batch_ids
+
+@contextmanager
+def rig_build(context=None, message="Rig Build", push_undo=True):
+    """Group many addon operations into one transaction.
+
+    Depsgraph updates and debug prints are deferred until the block exits,
+    which then performs a single view layer update and undo push:
+
+        with rig_build():
+            for bone in bones:
+                props.driver_bone = bone
+                bpy.ops.bsetup.add_driver_key()
+    """
+    context = context or bpy.context
+    begin_batch()
+    try:
+        yield
+    finally:
+        end_batch(context, push_undo=push_undo, message=message)
+
+
+class BSETUP_OT_BatchBegin(bpy.types.Operator):
+    """Open a rig build transaction: defer depsgraph updates and debug output of addon operators"""
+    bl_idname = "bsetup.batch_begin"
+    bl_label = "Begin Rig Build"
+    
+    def execute(self, context):
+        begin_batch()
+        return {'FINISHED'}
+
+
+class BSETUP_OT_BatchCommit(bpy.types.Operator):
+    """Close the rig build transaction: one depsgraph update and one undo step"""
+    bl_idname = "bsetup.batch_commit"
+    bl_label = "Commit Rig Build"
+    
+    message: bpy.props.StringProperty(name="Undo Name", default="Rig Build")
+    
+    def execute(self, context):
+        if not batch_active():
+            self.report({'WARNING'}, "No rig build in progress")
+            return {'CANCELLED'}
+            
+        end_batch(context, push_undo=True, message=self.message)
+        return {'FINISHED'}
+
+
+class BSETUP_OT_BatchAbort(bpy.types.Operator):
+    """Close every open rig build transaction without an undo step (operations already done are kept)"""
+    bl_idname = "bsetup.batch_abort"
+    bl_label = "Abort Rig Build"
+    
+    def execute(self, context):
+        if not batch_active():
+            self.report({'WARNING'}, "No rig build in progress")
+            return {'CANCELLED'}
+            
+        end_batch(context, push_undo=False, close_all=True)
+        self.report({'INFO'}, "Rig build closed without undo step")
+        return {'FINISHED'}
+
+
+# A transaction left open by a failed script must not outlive the file it was opened in,
+# and the deferred ID references do not survive undo.
+@persistent
+def _batch_load_post(*args):
+    reset_batch()
+
+@persistent
+def _batch_undo_post(*args):
+    drop_batch_ids()
+
+_HANDLERS = (
+    (bpy.app.handlers.load_post, _batch_load_post),
+    (bpy.app.handlers.undo_post, _batch_undo_post),
+    (bpy.app.handlers.redo_post, _batch_undo_post),
+)
+
+def register_handlers():
+    reset_batch()
+    for handlers, func in _HANDLERS:
+        if func not in handlers:
+            handlers.append(func)
+
+def unregister_handlers():
+    for handlers, func in _HANDLERS:
+        if func in handlers:
+            handlers.remove(func)
+    reset_batch()
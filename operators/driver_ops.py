@@ -1,5 +1,11 @@
 import bpy
-from .utils import flip_name, mirror_shape_driver_logic
+from .utils import (
+    flip_name, mirror_shape_driver_logic, set_influence_mapping, read_influence_mapping,
+    ensure_driver_hub, hub_data_path, copy_driver_to_fcurve, is_multikey_sdk, multikey_frame, multikey_mapping,
+    update_multikey_range, find_action_fcurve, find_keyframe, set_keyframe_value,
+    compose_pose_value, log_debug, request_update, parse_transform_path,
+    read_driver_input, driver_id_string,
+)
 
 class BSETUP_OT_LoadDriver(bpy.types.Operator):
     """Load the selected object/bone as the driver"""
@@ -182,70 +188,14 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
              return {'CANCELLED'}
 
         # Smart Transform Detection (for the INPUT/DRIVER side)
-        target_transform_type = None 
-        target_component = 0
-        is_transform = False
-        
-        if raw_path.startswith("location"):
-            is_transform = True
-            if "[0]" in raw_path: target_transform_type = 'LOC_X'; target_component = 0
-            elif "[1]" in raw_path: target_transform_type = 'LOC_Y'; target_component = 1
-            elif "[2]" in raw_path: target_transform_type = 'LOC_Z'; target_component = 2
-            
-        elif raw_path.startswith("rotation"): # rotation_euler / rotation_quaternion checking
-            is_transform = True
-            if "[0]" in raw_path: target_transform_type = 'ROT_X'; target_component = 0
-            elif "[1]" in raw_path: target_transform_type = 'ROT_Y'; target_component = 1
-            elif "[2]" in raw_path: target_transform_type = 'ROT_Z'; target_component = 2
-            
-        elif raw_path.startswith("scale"):
-            is_transform = True
-            if "[0]" in raw_path: target_transform_type = 'SCALE_X'; target_component = 0
-            elif "[1]" in raw_path: target_transform_type = 'SCALE_Y'; target_component = 1
-            elif "[2]" in raw_path: target_transform_type = 'SCALE_Z'; target_component = 2
+        is_transform, target_transform_type, target_component = parse_transform_path(raw_path)
 
         # 1. FETCH DRIVER VALUE
-        current_driver_val = 0.0
-        
-        if is_transform and target_transform_type:
-            matrix = None
-            rot_mode = 'XYZ' 
-            
-            if driver_obj.type == 'ARMATURE' and props.driver_bone:
-                pb = driver_obj.pose.bones.get(props.driver_bone)
-                if pb:
-                    matrix = pb.matrix_basis 
-                    rot_mode = pb.rotation_mode
-            else:
-                matrix = driver_obj.matrix_basis
-                rot_mode = driver_obj.rotation_mode
-            
-            if matrix:
-                if "LOC" in target_transform_type:
-                    current_driver_val = matrix.to_translation()[target_component]
-                elif "ROT" in target_transform_type:
-                    safe_mode = rot_mode if rot_mode in {'XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX'} else 'XYZ'
-                    euls = matrix.to_euler(safe_mode)
-                    current_driver_val = euls[target_component]
-                elif "SCALE" in target_transform_type:
-                    current_driver_val = matrix.to_scale()[target_component]
-        else:
-            # Fallback
-            try:
-                if driver_obj.type == 'ARMATURE' and props.driver_bone:
-                    pb = driver_obj.pose.bones.get(props.driver_bone)
-                    if pb:
-                        try:
-                            current_driver_val = pb.path_resolve(raw_path)
-                        except:
-                            current_driver_val = driver_obj.path_resolve(raw_path) # Fallback to Obj if bone fails
-                    else:
-                        current_driver_val = driver_obj.path_resolve(raw_path)
-                else:
-                    current_driver_val = driver_obj.path_resolve(raw_path)
-            except:
-                 self.report({'ERROR'}, f"Could not resolve path: {raw_path}")
-                 return {'CANCELLED'}
+        try:
+            current_driver_val = read_driver_input(driver_obj, props.driver_bone, raw_path)
+        except ValueError:
+             self.report({'ERROR'}, f"Could not resolve path: {raw_path}")
+             return {'CANCELLED'}
         
         props.driver_value = float(current_driver_val)
 
@@ -345,26 +295,14 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
             
             self.report({'INFO'}, f"Keyed {count} Pose Bones (Action Stack Manual)")
             
-            # Force update
-            driven_obj.update_tag()
-            if driver_obj: driver_obj.update_tag()
-            context.view_layer.update()
+            # Force update (deferred to the commit inside a rig build transaction)
+            request_update(context, driven_obj, driver_obj)
 
         return {'FINISHED'}
 
     def get_driver_id_string(self, driver_obj, props):
         """Generate a unique ID for the driver source"""
-        # Sanitization Helper
-        def clean(s):
-            return "".join([c if c.isalnum() else "_" for c in s])
-            
-        d_name = clean(driver_obj.name)
-        d_sub = clean(props.driver_bone) if (driver_obj.type == 'ARMATURE' and props.driver_bone) else ""
-        d_path = clean(props.driver_data_path)
-        
-        import re
-        full = f"{d_name}_{d_sub}_{d_path}"
-        return re.sub(r'_+', '_', full).strip('_')
+        return driver_id_string(driver_obj, props)
 
     def _setup_action_driver(self, driven_obj, driven_pb, driver_obj, props, driver_id, driver_val, values_map):
         """Create Action, Constraint, and Keys"""
@@ -379,7 +317,33 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
             constraint_name = f"SDK_{driver_id}"
             action_name = f"SDK_ACT_{driven_pb.name}_{driver_id}"
         
-        print(f"[DEBUG] Starting Action Setup. Action Name: {action_name}")
+        log_debug(f"[DEBUG] Starting Action Setup. Action Name: {action_name}")
+        
+        # MULTI-KEY: Add this pose as a further key of the existing SDK action
+        path_in = props.driver_data_path
+        input_is_transform = path_in.startswith(("location", "rotation", "scale"))
+        input_rest = 1.0 if "scale" in path_in else 0.0
+        multikey = getattr(props, "pose_sdk_mode", 'INFLUENCE') == 'MULTI_KEY'
+        
+        if multikey:
+            existing = driven_pb.constraints.get(constraint_name)
+            if existing and existing.type == 'ACTION' and existing.action:
+                if not is_multikey_sdk(driven_obj, driven_pb, existing):
+                    # Upgrade a rest + target SDK, keeping its recorded pose
+                    inf_fc = driven_obj.animation_data.drivers.find(f'pose.bones["{driven_pb.name}"].constraints["{existing.name}"].influence') if driven_obj.animation_data else None
+                    mapping = read_influence_mapping(inf_fc) if inf_fc else None
+                    if mapping is None:
+                        mapping = (input_rest, driver_val)
+                    self._convert_to_multikey(driven_obj, driven_pb, existing, input_is_transform, *mapping)
+                    
+                self._add_multikey_pose(driven_obj, driven_pb, existing, props, driver_val, input_rest, values_map)
+                return
+        
+        # UPDATE IN PLACE: Re-keying an existing SDK at its target driver value only edits the pose keys
+        existing = driven_pb.constraints.get(constraint_name)
+        if not multikey and existing and self._update_pose_in_place(driven_obj, driven_pb, existing, driver_val, values_map):
+            log_debug(f"[DEBUG] Updated {constraint_name} in place")
+            return
         
         # 2. CREATE ACTION BY RECORDING (Robust Method)
         # Instead of manually creating fcurves which might have wrong paths,
@@ -389,8 +353,9 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
         if bpy.context.object.mode != 'POSE':
              bpy.ops.object.mode_set(mode='POSE')
              
-        # Save current time and action
-        old_frame = bpy.context.scene.frame_current
+        # Save current action
+        # (Keys are inserted at explicit frames, so the scene frame never changes
+        #  and no full depsgraph evaluation is triggered while recording)
         old_action = driven_obj.animation_data.action if driven_obj.animation_data else None
         
         # Clear current action on object to start fresh
@@ -402,8 +367,6 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
         
         try:
             # 2a. Keyframe REST Pose (Frame 0)
-            bpy.context.scene.frame_set(0)
-            
             # Apply identity values
             for (path, idx), val in values_map.items():
                 # Determine Identity Value
@@ -423,14 +386,13 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
                          setattr(driven_pb, path, identity_val)
                 
                 # Insert Keyframe
-                driven_pb.keyframe_insert(data_path=path, index=idx)
+                driven_pb.keyframe_insert(data_path=path, index=idx, frame=0.0)
 
             # 2b. Keyframe POSE Pose (Frame = 3.0 for Influence Driving)
             # We used to use driver_val as frame, but now we standardize on Frame 3.
             # Influence 0 = Frame 0 (Rest), Influence 1 = Frame 3 (Pose)
             # This allows Evaluation Time to be fixed at 3.0 and we drive Influence 0..1
             frame_target = 3.0
-            bpy.context.scene.frame_set(int(frame_target)) 
             
             # Set target values
             for (path, idx), val in values_map.items():
@@ -440,7 +402,7 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
                         prop[idx] = val
                     except:
                          setattr(driven_pb, path, val)
-                 driven_pb.keyframe_insert(data_path=path, index=idx)
+                 driven_pb.keyframe_insert(data_path=path, index=idx, frame=frame_target)
 
             # 2c. Retrieve the created Action
             if driven_obj.animation_data and driven_obj.animation_data.action:
@@ -459,20 +421,16 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
                 for kp in fc.keyframe_points:
                     kp.interpolation = props.driver_interpolation
                     
-            print(f"[DEBUG] Recorded Action: {action.name}, FCurves: {len(action.fcurves)}")
+            log_debug(f"[DEBUG] Recorded Action: {action.name}, FCurves: {len(action.fcurves)}")
             
         except Exception as e:
             print(f"[ERROR] Recording Action Failed: {e}")
             import traceback
             traceback.print_exc()
             # Restore
-            bpy.context.scene.frame_set(old_frame)
             if driven_obj.animation_data: driven_obj.animation_data.action = old_action
             return
 
-        # Restore frame
-        bpy.context.scene.frame_set(old_frame)
-        
         # 3. Constraint - Get or Create
         
         # 3. Constraint - Get or Create
@@ -501,7 +459,7 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
                 bpy.ops.pose.constraint_add(type='ACTION')
                 const = driven_pb.constraints[-1]
                 const.name = constraint_name
-                print(f"[DEBUG] Constraint created via Operator: {const.name}")
+                log_debug(f"[DEBUG] Constraint created via Operator: {const.name}")
             except Exception as e:
                 print(f"[ERROR] Operator constraint creation failed: {e}")
                 # Fallback
@@ -555,7 +513,7 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
         if hasattr(const, "use_bone_object_action"):
             const.use_bone_object_action = False
             
-        print(f"[DEBUG] Assigning action to constraint...")
+        log_debug(f"[DEBUG] Assigning action to constraint...")
         const.action = action # Try direct first
         
         if const.action != action:
@@ -588,7 +546,7 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
                 if bpy.context.object.mode != old_mode:
                      bpy.ops.object.mode_set(mode=old_mode)
 
-        print(f"  - const.action AFTER: {const.action}")
+        log_debug(f"  - const.action AFTER: {const.action}")
         
         # Blender 4.4+ Action Slots
         if hasattr(action, "slots") and hasattr(const, "action_slot"):
@@ -653,7 +611,17 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
         elif is_scale:
             t_type = ['SCALE_X', 'SCALE_Y', 'SCALE_Z'][idx]
             
-        if is_loc or is_rot or is_scale:
+        use_hub = getattr(props, "use_driver_hub", False)
+        hub_path = None
+        if use_hub and (is_loc or is_rot or is_scale):
+            hub_path = ensure_driver_hub(props.driver_target, props.driver_bone, t_type)
+            
+        if hub_path:
+            # Read the shared channel evaluation instead of decomposing the matrix again
+            var.type = 'SINGLE_PROP'
+            var.targets[0].id = props.driver_target
+            var.targets[0].data_path = hub_path
+        elif is_loc or is_rot or is_scale:
             var.type = 'TRANSFORMS'
             
             # Verify target exists
@@ -686,33 +654,129 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
         # 2. Determine Target Value
         driver_target = driver_val
         
-        # 3. Setup Influence Driver with Expression
-        # We use a mathematical expression for all drivers (Loc/Rot/Scale)
-        # Expression: clamp((var - Rest) / (Target - Rest), 0, 1)
-        
-        # Calculate Denominator (Target - Rest)
-        denom = driver_target - driver_rest
-        
-        # Safety: Avoid division by zero
-        # If target and rest are too close, default to 1 unit distance to avoid error
-        if abs(denom) < 0.0001:
-             denom = 1.0
-             
-        # Generate Expression
-        # We use f-string to embed constants. "var" is the dynamic input.
-        # Format: clamp((var - 0.0) / 1.0, 0, 1)
-        expr = f"clamp((var - {driver_rest:.3f}) / {denom:.4f}, 0, 1)"
-        drv.expression = expr
-        
-        # Clear any keyframes (Expression controls it fully)
-        # We enforce NO keyframes for this logical setup
-        while len(d_fc.keyframe_points) > 0:
-             d_fc.keyframe_points.remove(d_fc.keyframe_points[0])
+        # 3. Setup Influence Mapping
+        # EXPRESSION: clamp((var - Rest) / (Target - Rest), 0, 1)
+        # FCURVE: AVERAGE driver with Rest -> 0, Target -> 1 keys (no expression evaluator)
+        mode = props.influence_mode if hasattr(props, "influence_mode") else 'EXPRESSION'
+        set_influence_mapping(d_fc, driver_rest, driver_target, mode)
+        
+        if multikey:
+            self._convert_to_multikey(driven_obj, driven_pb, const, input_is_transform, driver_rest, driver_target)
+
+    def _update_pose_in_place(self, armature, pb, const, driver_val, values_map):
+        """Overwrite the pose keys of an existing rest + pose SDK. Returns False if a rebuild is needed."""
+        if const.type != 'ACTION' or not const.action or is_multikey_sdk(armature, pb, const):
+            return False
+            
+        inf_fc = None
+        if armature.animation_data:
+            inf_fc = armature.animation_data.drivers.find(f'pose.bones["{pb.name}"].constraints["{const.name}"].influence')
+        mapping = read_influence_mapping(inf_fc) if inf_fc else None
+        if mapping is None or abs(mapping[1] - driver_val) > 0.001:
+            # Different target driver value -> different mapping, rebuild
+            return False
+            
+        # Resolve every key first so we never leave a half-updated pose
+        edits = []
+        for (path, idx), base_val in values_map.items():
+            fc = find_action_fcurve(const.action, path, idx)
+            kp = find_keyframe(fc, const.frame_end) if fc else None
+            if kp is None:
+                return False
+            edits.append((fc, kp, compose_pose_value(kp.co[1], base_val, path, idx)))
+            
+        for fc, kp, value in edits:
+            set_keyframe_value(fc, kp, value)
+        return True
+
+    def _convert_to_multikey(self, armature, pb, const, is_transform, rest, target):
+        """Turn an influence-driven SDK (rest/pose at frame_start/frame_end) into a range-mapped multi-key SDK"""
+        old_start, old_end = const.frame_start, const.frame_end
+        inf_fc = None
+        if armature.animation_data:
+            inf_fc = armature.animation_data.drivers.find(f'pose.bones["{pb.name}"].constraints["{const.name}"].influence')
+        
+        # Transform inputs use the constraint's own channel mapping (no driver at all).
+        # Custom properties keep a driver, now on eval_time.
+        const.use_eval_time = not is_transform
+        if not is_transform and inf_fc:
+            eval_fc = const.driver_add("eval_time")
+            for mod in list(eval_fc.modifiers):
+                eval_fc.modifiers.remove(mod)
+            copy_driver_to_fcurve(inf_fc, eval_fc, False, mirror_targets=False)
+        if inf_fc:
+            const.driver_remove("influence")
+        const.influence = 1.0
+        
+        # Re-time the rest/pose keys onto their driver value frames
+        mapping = multikey_mapping(armature, pb, const, fresh=True)
+        frame_map = {old_start: multikey_frame(armature, pb, const, rest, mapping),
+                     old_end: multikey_frame(armature, pb, const, target, mapping)}
+        for fc in const.action.fcurves:
+            for kp in fc.keyframe_points:
+                new_x = frame_map.get(round(kp.co[0]))
+                if new_x is None:
+                    continue
+                dx = new_x - kp.co[0]
+                kp.co[0] += dx
+                kp.handle_left[0] += dx
+                kp.handle_right[0] += dx
+            fc.update()
+            
+        update_multikey_range(armature, pb, const, mapping)
+        log_debug(f"[DEBUG] Converted {const.name} to Multi-Key (Frames {const.frame_start}..{const.frame_end})")
+
+    def _add_multikey_pose(self, armature, pb, const, props, driver_val, driver_rest, values_map):
+        """Key the visible pose at the current driver value into a multi-key SDK action"""
+        action = const.action
+        # Mirrored SDKs have their own (reflected / inverted) range mapping
+        mapping = multikey_mapping(armature, pb, const)
+        frame = multikey_frame(armature, pb, const, driver_val, mapping)
+        
+        for (path, idx), base_val in values_map.items():
+            identity = 1.0 if ("scale" in path or ("quaternion" in path and idx == 0)) else 0.0
+            
+            fc = find_action_fcurve(action, path, idx)
+            if fc is None:
+                # New channel: start from identity at the driver rest
+                fc = action.fcurves.new(f'pose.bones["{pb.name}"].{path}', index=idx, action_group=pb.name)
+                fc.keyframe_points.insert(multikey_frame(armature, pb, const, driver_rest, mapping), identity)
+                
+            # Visible pose = action value at this driver value + base transform offset
+            value = compose_pose_value(fc.evaluate(frame), base_val, path, idx)
+            
+            kp = find_keyframe(fc, frame)
+            if kp:
+                # Re-key: edit in place
+                set_keyframe_value(fc, kp, value)
+            else:
+                kp = fc.keyframe_points.insert(frame, value)
+                kp.interpolation = props.driver_interpolation
+                fc.update()
             
-        # 5. Handle Types (No longer needed for empty curves, but keeping for safety if switched back)
-        # We don't need to set handle types if there are no keyframes.
+        update_multikey_range(armature, pb, const, mapping)
+        log_debug(f"[DEBUG] Added Multi-Key pose to {const.name} at frame {frame:.2f}")
 
 
+    def _driver_matches(self, fcurve, driver_obj, props, is_transform, target_transform_type, raw_path):
+        """True if the driver is the single 'var' driver reading the requested driver channel"""
+        drv = fcurve.driver
+        if drv.type != 'SCRIPTED' or drv.expression != "var" or len(drv.variables) != 1 or drv.variables[0].name != "var":
+            return False
+            
+        var = drv.variables[0]
+        target = var.targets[0]
+        if target.id != driver_obj:
+            return False
+        bone = props.driver_bone if driver_obj.type == 'ARMATURE' else ""
+        
+        if is_transform and target_transform_type and getattr(props, "use_driver_hub", False):
+            return var.type == 'SINGLE_PROP' and target.data_path == hub_data_path(driver_obj, props.driver_bone, target_transform_type)
+        if is_transform and target_transform_type:
+            return (var.type == 'TRANSFORMS' and target.transform_type == target_transform_type
+                    and target.transform_space == 'LOCAL_SPACE' and (not bone or target.bone_target == bone))
+        return var.type == 'SINGLE_PROP' and target.data_path == raw_path and (not bone or target.bone_target == bone)
+
     def _setup_single_driver(self, driver_obj, id_data_owner, data_path, driver_val, driven_val, props, is_transform, target_transform_type, raw_path, array_index=-1):
         """Helper to create/update a driver on a specific path"""
         
@@ -727,6 +791,18 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
         if not anim_data_obj.animation_data:
             anim_data_obj.animation_data_create()
             
+        # UPDATE IN PLACE: An existing key at this driver value only needs its value overwritten,
+        # as long as the driver still reads the requested channel (otherwise rebuild, keys are kept)
+        if id_data_owner == anim_data_obj:
+            existing_fc = anim_data_obj.animation_data.drivers.find(data_path, index=max(array_index, 0))
+            if existing_fc and len(existing_fc.keyframe_points) > 0 and self._driver_matches(
+                    existing_fc, driver_obj, props, is_transform, target_transform_type, raw_path):
+                kp = find_keyframe(existing_fc, driver_val)
+                if kp:
+                    set_keyframe_value(existing_fc, kp, driven_val)
+                    kp.interpolation = props.driver_interpolation
+                    return
+            
         # Find or create fcurve
         fcurve = None
         # Should we search? driver_add usually finds or creates.
@@ -763,7 +839,17 @@ class BSETUP_OT_AddDriverKey(bpy.types.Operator):
         # Determine Default/Rest Value for Auto-Keying (0 for Loc/Rot, 1 for Scale)
         default_rest_val = 1.0 if (target_transform_type and "SCALE" in target_transform_type) else 0.0
         
-        if is_transform and target_transform_type:
+        hub_path = None
+        if is_transform and target_transform_type and getattr(props, "use_driver_hub", False):
+            hub_path = ensure_driver_hub(driver_obj, props.driver_bone, target_transform_type)
+        
+        if hub_path:
+            # Shared per-channel hub property (evaluated once for all consumers)
+            var.type = 'SINGLE_PROP'
+            target = var.targets[0]
+            target.id = driver_obj
+            target.data_path = hub_path
+        elif is_transform and target_transform_type:
             var.type = 'TRANSFORMS'
             target = var.targets[0]
             target.id = driver_obj
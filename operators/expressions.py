@@ -0,0 +1,128 @@
+import ast
+import time
+
+# Pure helpers for Blender's "simple expression" driver fast path.
+# No bpy import here so the rules can be checked outside of Blender.
+
+# Functions understood by Blender's native expression evaluator (BLI_expr_pylike_eval)
+SIMPLE_FUNCTIONS = {
+    "radians", "degrees", "abs", "fabs", "floor", "ceil", "trunc", "round", "int",
+    "sin", "cos", "tan", "asin", "acos", "atan", "atan2", "exp", "log", "sqrt",
+    "pow", "fmod", "min", "max", "clamp", "lerp", "inverse_lerp", "smoothstep",
+}
+
+SIMPLE_CONSTANTS = {"pi", "True", "False", "frame"}
+
+# Rough per-evaluation costs (microseconds) used for the per-frame estimate
+SIMPLE_EVAL_COST_US = 0.2
+PYTHON_EVAL_OVERHEAD_US = 6.0 # GIL acquire + namespace/variable dict setup
+
+# Module aliases that are commonly used in hand-written expressions (math.sin, np.clip ...)
+_MODULE_ALIASES = {"math", "m", "np", "numpy", "bpy.app.driver_namespace"}
+_FUNCTION_RENAMES = {"clip": "clamp", "fmin": "min", "fmax": "max", "power": "pow"}
+
+
+def _is_simple_node(node, variables):
+    """Recursively check an AST node against the simple expression grammar"""
+    if isinstance(node, ast.Expression):
+        return _is_simple_node(node.body, variables)
+    if isinstance(node, ast.Constant):
+        return isinstance(node.value, (int, float, bool))
+    if isinstance(node, ast.Name):
+        return node.id in variables or node.id in SIMPLE_CONSTANTS
+    if isinstance(node, ast.UnaryOp):
+        return isinstance(node.op, (ast.UAdd, ast.USub, ast.Not)) and _is_simple_node(node.operand, variables)
+    if isinstance(node, ast.BinOp):
+        if not isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.Div)):
+            return False
+        return _is_simple_node(node.left, variables) and _is_simple_node(node.right, variables)
+    if isinstance(node, ast.BoolOp):
+        return all(_is_simple_node(v, variables) for v in node.values)
+    if isinstance(node, ast.Compare):
+        if not all(isinstance(op, (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE)) for op in node.ops):
+            return False
+        return _is_simple_node(node.left, variables) and all(_is_simple_node(c, variables) for c in node.comparators)
+    if isinstance(node, ast.IfExp):
+        return all(_is_simple_node(n, variables) for n in (node.test, node.body, node.orelse))
+    if isinstance(node, ast.Call):
+        if node.keywords or not isinstance(node.func, ast.Name):
+            return False
+        if node.func.id not in SIMPLE_FUNCTIONS:
+            return False
+        return all(_is_simple_node(a, variables) for a in node.args)
+    return False
+
+
+def is_simple_expression(expr, variables):
+    """Return True if 'expr' should stay on Blender's native (non-Python) evaluation path"""
+    try:
+        tree = ast.parse(expr.strip(), mode='eval')
+    except SyntaxError:
+        return False
+    return _is_simple_node(tree, set(variables))
+
+
+class _SimpleRewriter(ast.NodeTransformer):
+    """Rewrite common Python-only constructs into their simple-expression equivalent"""
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Pow):
+            # a ** b -> pow(a, b)
+            return ast.copy_location(ast.Call(func=ast.Name(id="pow", ctx=ast.Load()), args=[node.left, node.right], keywords=[]), node)
+        return node
+
+    def visit_Attribute(self, node):
+        self.generic_visit(node)
+        # math.pi -> pi, math.sin -> sin (only when the name is understood natively)
+        name = _FUNCTION_RENAMES.get(node.attr, node.attr)
+        if ast.unparse(node.value) in _MODULE_ALIASES and (name in SIMPLE_FUNCTIONS or name == "pi"):
+            return ast.copy_location(ast.Name(id=name, ctx=ast.Load()), node)
+        return node
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        if isinstance(node.func, ast.Name) and node.func.id in _FUNCTION_RENAMES:
+            node.func = ast.Name(id=_FUNCTION_RENAMES[node.func.id], ctx=ast.Load())
+        return node
+
+
+def simplify_expression(expr, variables):
+    """Try to rewrite 'expr' into simple-expression form.
+
+    Returns the rewritten string, or None if no equivalent simple form was found.
+    """
+    try:
+        tree = ast.parse(expr.strip(), mode='eval')
+    except SyntaxError:
+        return None
+
+    new_tree = ast.fix_missing_locations(_SimpleRewriter().visit(tree))
+    if not _is_simple_node(new_tree, set(variables)):
+        return None
+
+    new_expr = ast.unparse(new_tree)
+    return new_expr if new_expr != expr else None
+
+
+def measure_python_cost(expr, variables, namespace=None, repeat=200):
+    """Measure the Python-side cost of one evaluation (microseconds), or None if it fails"""
+    try:
+        code = compile(expr, "<driver>", 'eval')
+    except SyntaxError:
+        return None
+
+    names = dict(namespace) if namespace else {}
+    names.update({v: 0.0 for v in variables})
+    names.setdefault("frame", 0.0)
+
+    try:
+        eval(code, {}, names)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            eval(code, {}, names)
+        elapsed = time.perf_counter() - start
+    except Exception:
+        return None
+
+    return (elapsed / repeat) * 1e6 + PYTHON_EVAL_OVERHEAD_US
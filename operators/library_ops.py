@@ -0,0 +1,358 @@
+import bpy
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+from .utils import (
+    write_coords, copy_driver_to_fcurve, shape_key_reference_count, repoint_shape_key_references, HAS_NUMPY,
+)
+
+# Sparse shape library (.npz, compressed).
+# Only the moved vertices of each key are stored, CSR style:
+#   names (K,), offsets (K + 1,), indices (nnz,) int32, values (nnz, 3) float32,
+#   slider_min / slider_max (K,), vertex_count, format
+# Offsets are the final (relative key and vertex group applied) deltas from the basis.
+LIBRARY_FORMAT = 1
+
+
+def _mixer(operator, context):
+    obj = context.active_object
+    if not obj or obj.type != 'MESH' or not obj.data.shape_keys:
+        operator.report({'ERROR'}, "Select a Mesh Object with Shape Keys")
+        return None
+    if not HAS_NUMPY:
+        operator.report({'ERROR'}, f"{operator.bl_label} requires numpy")
+        return None
+    from .shape_mixer import ShapeMixer
+    return ShapeMixer(obj)
+
+
+def _megabytes(num_bytes):
+    return num_bytes / (1024 * 1024)
+
+
+class BSETUP_OT_ShapeKeyReport(bpy.types.Operator):
+    """Print per shape key statistics (moved vertices, max displacement, dense vs sparse memory) to the console"""
+    bl_idname = "bsetup.shape_key_report"
+    bl_label = "Shape Key Report"
+
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Vertices moving less than this count as not moved",
+        default=1e-5,
+        min=0.0,
+        precision=6
+    )
+
+    def execute(self, context):
+        mixer = _mixer(self, context)
+        if mixer is None:
+            return {'CANCELLED'}
+        from .shape_math import sparse_shape_stats
+
+        moved, max_disp, dense, sparse = sparse_shape_stats(mixer.deltas, self.tolerance)
+        n = len(mixer.basis)
+        reference = mixer.obj.data.shape_keys.reference_key.name
+        keys = [i for i in range(len(mixer.names)) if mixer.names[i] != reference]
+
+        print(f"[MayaShapeKeys] Shape key report for '{mixer.obj.name}' ({n} vertices, tolerance {self.tolerance:g})")
+        print(f"{'Shape Key':<40} {'Moved':>8} {'%':>7} {'Max Disp':>10} {'Dense KB':>10} {'Sparse KB':>10}")
+        for i in keys:
+            print(f"{mixer.names[i]:<40} {moved[i]:>8} {100.0 * moved[i] / max(n, 1):>6.1f}% "
+                  f"{max_disp[i]:>10.5f} {dense[i] / 1024:>10.1f} {sparse[i] / 1024:>10.1f}")
+
+        total_dense, total_sparse = int(dense[keys].sum()), int(sparse[keys].sum())
+        empty = int((moved[keys] == 0).sum())
+        ratio = total_sparse / total_dense if total_dense else 0.0
+        summary = (f"{len(keys)} keys: {_megabytes(total_dense):.2f} MB dense, {_megabytes(total_sparse):.2f} MB sparse "
+                   f"({100.0 * ratio:.1f}%), {empty} empty")
+        print(f"[MayaShapeKeys] {summary}")
+        self.report({'INFO'}, summary + " (details in the console)")
+        return {'FINISHED'}
+
+
+class BSETUP_OT_ExportShapeLibrary(bpy.types.Operator, ExportHelper):
+    """Export the shape keys of the active mesh as a compressed sparse shape library"""
+    bl_idname = "bsetup.export_shape_library"
+    bl_label = "Export Shape Library"
+
+    filename_ext = ".npz"
+    filter_glob: bpy.props.StringProperty(default="*.npz", options={'HIDDEN'})
+
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Vertex offsets shorter than this are not stored",
+        default=1e-5,
+        min=0.0,
+        precision=6
+    )
+
+    def execute(self, context):
+        mixer = _mixer(self, context)
+        if mixer is None:
+            return {'CANCELLED'}
+        import numpy as np
+        from .shape_math import pack_sparse_shapes
+
+        reference = mixer.obj.data.shape_keys.reference_key.name
+        keys = [i for i, name in enumerate(mixer.names) if name != reference]
+        offsets, indices, values = pack_sparse_shapes(mixer.deltas[keys], self.tolerance)
+
+        np.savez_compressed(
+            self.filepath,
+            format=np.array(LIBRARY_FORMAT),
+            vertex_count=np.array(len(mixer.basis)),
+            names=np.array([mixer.names[i] for i in keys]),
+            offsets=offsets,
+            indices=indices,
+            values=values,
+            slider_min=mixer.slider_min[keys],
+            slider_max=mixer.slider_max[keys],
+        )
+
+        self.report({'INFO'}, f"Exported {len(keys)} shape keys ({len(indices)} moved vertices) to '{self.filepath}'")
+        return {'FINISHED'}
+
+
+class BSETUP_OT_ImportShapeLibrary(bpy.types.Operator, ImportHelper):
+    """Import a sparse shape library onto the active mesh (vertex count must match)"""
+    bl_idname = "bsetup.import_shape_library"
+    bl_label = "Import Shape Library"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filename_ext = ".npz"
+    filter_glob: bpy.props.StringProperty(default="*.npz", options={'HIDDEN'})
+
+    overwrite: bpy.props.BoolProperty(
+        name="Overwrite Existing",
+        description="Replace shape keys that already exist (otherwise they are skipped)",
+        default=True
+    )
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Select a Mesh Object")
+            return {'CANCELLED'}
+        if not HAS_NUMPY:
+            self.report({'ERROR'}, "Import Shape Library requires numpy")
+            return {'CANCELLED'}
+        import numpy as np
+        from .utils import basis_coords
+
+        try:
+            with np.load(self.filepath, allow_pickle=False) as data:
+                lib = {name: data[name] for name in data.files}
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not read shape library: {e}")
+            return {'CANCELLED'}
+
+        if int(lib.get("format", -1)) != LIBRARY_FORMAT:
+            self.report({'ERROR'}, "Not a shape library file (or an unsupported version)")
+            return {'CANCELLED'}
+        if int(lib["vertex_count"]) != len(obj.data.vertices):
+            self.report({'ERROR'}, f"Library is for {int(lib['vertex_count'])} vertices, mesh has {len(obj.data.vertices)}")
+            return {'CANCELLED'}
+
+        if not obj.data.shape_keys:
+            obj.shape_key_add(name="Basis")
+        key_blocks = obj.data.shape_keys.key_blocks
+        basis = basis_coords(obj)
+        offsets, indices, values = lib["offsets"], lib["indices"], lib["values"]
+
+        created = replaced = skipped = 0
+        for k, name in enumerate(lib["names"].tolist()):
+            kb = key_blocks.get(name)
+            if kb is not None and not self.overwrite:
+                skipped += 1
+                continue
+            if kb is None:
+                kb = obj.shape_key_add(name=name, from_mix=False)
+                created += 1
+            else:
+                replaced += 1
+
+            # Stored offsets already include relative key and vertex group
+            co = basis.copy()
+            span = slice(offsets[k], offsets[k + 1])
+            co[indices[span]] += values[span]
+            write_coords(kb, co)
+            kb.relative_key = obj.data.shape_keys.reference_key
+            kb.vertex_group = ""
+            # Each limit is clamped against the other, min again after max for ranges above 1
+            slider_min, slider_max = float(lib["slider_min"][k]), float(lib["slider_max"][k])
+            kb.slider_min = slider_min
+            kb.slider_max = slider_max
+            kb.slider_min = slider_min
+
+        obj.data.update()
+        self.report({'INFO'}, f"Imported shape library: {created} created, {replaced} replaced, {skipped} skipped")
+        return {'FINISHED'}
+
+
+class BSETUP_OT_CleanupShapeKeys(bpy.types.Operator):
+    """Zero sculpting noise, find empty and near-duplicate shape keys and optionally remove or merge them"""
+    bl_idname = "bsetup.cleanup_shape_keys"
+    bl_label = "Clean Up Shape Keys"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    zero_noise: bpy.props.BoolProperty(
+        name="Zero Noise",
+        description="Reset vertex offsets shorter than the noise threshold to the relative key",
+        default=True
+    )
+
+    noise_threshold: bpy.props.FloatProperty(
+        name="Noise Threshold",
+        description="Vertex offsets shorter than this are sculpting noise. Keys with nothing above it are empty",
+        default=1e-4,
+        min=0.0,
+        precision=6
+    )
+
+    duplicate_tolerance: bpy.props.FloatProperty(
+        name="Duplicate Tolerance",
+        description="Keys whose vertex offsets all lie within this distance of another key are duplicates",
+        default=1e-4,
+        min=0.0,
+        precision=6
+    )
+
+    remove_empty: bpy.props.BoolProperty(
+        name="Remove Empty",
+        description="Remove empty keys that no driver and no other key (as relative key) depends on",
+        default=False
+    )
+
+    merge_duplicates: bpy.props.BoolProperty(
+        name="Merge Duplicates",
+        description="Remove duplicates of the first key of each group, re-pointing drivers that read them to that key",
+        default=False
+    )
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or obj.type != 'MESH' or not obj.data.shape_keys:
+            self.report({'ERROR'}, "Select a Mesh Object with Shape Keys")
+            return {'CANCELLED'}
+        if not HAS_NUMPY:
+            self.report({'ERROR'}, "Clean Up Shape Keys requires numpy")
+            return {'CANCELLED'}
+        import numpy as np
+        from .batch_ops import rig_build
+        from .utils import request_update
+        from .shape_mixer import read_key_coords, apply_vertex_groups
+        from .shape_math import zero_noise, moved_mask, find_duplicate_groups
+
+        key_blocks = obj.data.shape_keys.key_blocks
+        names = key_blocks.keys()
+
+        # 1. ANALYSE: all keys in one array
+        coords, relative, reference = read_key_coords(obj)
+        raw = coords - coords[relative]
+        raw[reference] = 0.0
+        cleaned, zeroed = zero_noise(raw, self.noise_threshold)
+        if not self.zero_noise:
+            cleaned, zeroed = raw, np.zeros_like(zeroed)
+
+        effective = apply_vertex_groups(obj, cleaned.copy())
+        empty = ~moved_mask(effective, 0.0).any(axis=1)
+        empty[reference] = False
+        candidates = [k for k in range(len(names)) if k != reference and not empty[k]]
+        groups = find_duplicate_groups(effective, self.duplicate_tolerance, candidates)
+
+        self.removed, self.merged, self.kept = [], [], []
+        with rig_build(context, message="Clean Up Shape Keys", push_undo=False):
+            # 2. ZERO NOISE: keys relative to a cleaned key move with it
+            written = self.write_cleaned(obj, coords, relative, reference, cleaned, zeroed)
+
+            # 3. REMOVE / MERGE (by name, indices shift on removal)
+            used_as_relative = {names[r] for k, r in enumerate(relative) if r != k}
+            if self.remove_empty:
+                for k in np.flatnonzero(empty):
+                    self.remove_key(obj, names[k], used_as_relative)
+            if self.merge_duplicates:
+                for group in groups:
+                    for dup in group[1:]:
+                        self.merge_key(obj, names[dup], names[group[0]], used_as_relative)
+
+            obj.data.update()
+            request_update(context, obj)
+
+        for k in np.flatnonzero(empty):
+            print(f"[MayaShapeKeys] Empty shape key: '{names[k]}'")
+        for group in groups:
+            print(f"[MayaShapeKeys] Duplicate shape keys: {', '.join(repr(names[k]) for k in group)}")
+        for name, reason in self.kept:
+            print(f"[MayaShapeKeys] Cleanup kept '{name}': {reason}")
+
+        msg = (f"{written} keys de-noised ({int(zeroed.sum())} vertices), {int(empty.sum())} empty, "
+               f"{sum(len(g) - 1 for g in groups)} duplicates")
+        if self.remove_empty or self.merge_duplicates:
+            msg += f"; removed {len(self.removed)}, merged {len(self.merged)}, kept {len(self.kept)}"
+        self.report({'INFO'}, msg)
+        return {'FINISHED'}
+
+    def write_cleaned(self, obj, coords, relative, reference, cleaned, zeroed):
+        """Write de-noised keys, rebuilding absolute coordinates along relative key chains"""
+        key_blocks = obj.data.shape_keys.key_blocks
+        new_co, dirty = {reference: coords[reference]}, {reference: False}
+
+        def rebuild(k):
+            chain = []
+            while k not in new_co:
+                chain.append(k)
+                if relative[k] == k or relative[k] in chain:
+                    # Self relative (or a cycle): the key is its own base
+                    new_co[k], dirty[k] = coords[k], False
+                    chain.pop()
+                    break
+                k = relative[k]
+            for k in reversed(chain):
+                r = relative[k]
+                dirty[k] = bool(zeroed[k]) or dirty[r]
+                new_co[k] = new_co[r] + cleaned[k] if dirty[k] else coords[k]
+
+        written = 0
+        for k, kb in enumerate(key_blocks):
+            rebuild(k)
+            if dirty[k]:
+                write_coords(kb, new_co[k])
+                written += 1
+        return written
+
+    def remove_key(self, obj, name, used_as_relative):
+        key = obj.data.shape_keys
+        if name in used_as_relative:
+            self.kept.append((name, "relative key of other keys"))
+            return False
+        refs = shape_key_reference_count(key, name)
+        if refs:
+            self.kept.append((name, f"read by {refs} driver variables"))
+            return False
+        key.driver_remove(f'key_blocks["{name}"].value')
+        obj.shape_key_remove(key.key_blocks[name])
+        self.removed.append(name)
+        return True
+
+    def merge_key(self, obj, name, keeper, used_as_relative):
+        key = obj.data.shape_keys
+        if name in used_as_relative:
+            self.kept.append((name, "relative key of other keys"))
+            return False
+
+        drivers = key.animation_data.drivers if key.animation_data else None
+        dup_fc = drivers.find(f'key_blocks["{name}"].value') if drivers else None
+        keeper_fc = drivers.find(f'key_blocks["{keeper}"].value') if drivers else None
+        if dup_fc and keeper_fc:
+            self.kept.append((name, f"driven separately from its duplicate '{keeper}'"))
+            return False
+        if dup_fc:
+            # The keeper takes over the duplicate's driver
+            copy_driver_to_fcurve(dup_fc, key.driver_add(f'key_blocks["{keeper}"].value'), mirror_targets=False)
+
+        repoint_shape_key_references(key, name, keeper)
+        key.driver_remove(f'key_blocks["{name}"].value')
+        obj.shape_key_remove(key.key_blocks[name])
+        self.merged.append(name)
+        return True
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
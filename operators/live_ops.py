@@ -0,0 +1,238 @@
+import bpy
+from .utils import (
+    read_driver_input, sdk_constraint_name, is_multikey_sdk, multikey_frame, multikey_mapping,
+    update_multikey_range, find_keyframe, set_keyframe_value, compose_pose_value,
+    decompose_pose_value, read_influence_mapping,
+)
+
+# Set by the depsgraph handler, consumed (throttled) by the session timer
+_session_state = {"dirty": False, "running": False, "stop": False}
+
+def _on_depsgraph_update(scene, depsgraph):
+    _session_state["dirty"] = True
+
+def unregister_handler():
+    """Remove the session handler (also when the addon is disabled mid-session) and reset the state"""
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    _session_state.update(dirty=False, running=False, stop=False)
+
+
+class BSETUP_OT_LiveSDKSession(bpy.types.Operator):
+    """Live SDK editing: edits to the driven shape key value or bones are written straight into the SDK key at the current driver value (ESC to stop)"""
+    bl_idname = "bsetup.live_sdk_session"
+    bl_label = "Live SDK Edit"
+
+    interval: bpy.props.FloatProperty(
+        name="Update Interval",
+        description="Minimum time between two keyframe writes (seconds)",
+        default=0.1,
+        min=0.02,
+        max=1.0
+    )
+
+    def invoke(self, context, event):
+        # Pressing the button again ends the running session
+        if _session_state["running"]:
+            _session_state["stop"] = True
+            return {'FINISHED'}
+
+        props = context.scene.maya_shape_keys
+        self.driver_obj = props.driver_target
+        self.driven_obj = props.driven_object
+        if not self.driver_obj or not self.driven_obj or not props.driver_data_path:
+            self.report({'ERROR'}, "Driver or Driven object missing")
+            return {'CANCELLED'}
+
+        self.mode = props.driven_type
+        if self.mode == 'KEY':
+            if not self._start_key(props):
+                return {'CANCELLED'}
+        else:
+            if not self._start_pose(context, props):
+                return {'CANCELLED'}
+
+        _session_state.update(dirty=True, running=True, stop=False)
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+        self._timer = context.window_manager.event_timer_add(self.interval, window=context.window)
+        context.window_manager.modal_handler_add(self)
+
+        self.report({'INFO'}, "Live SDK Edit started (ESC to stop)")
+        return {'RUNNING_MODAL'}
+
+    # --- SHAPE KEY SESSION ---
+    def _start_key(self, props):
+        key_data = self.driven_obj.data.shape_keys if hasattr(self.driven_obj.data, "shape_keys") else None
+        fc = None
+        if key_data and key_data.animation_data and props.driven_key:
+            fc = key_data.animation_data.drivers.find(f'key_blocks["{props.driven_key}"].value')
+        if not fc:
+            self.report({'ERROR'}, "No driver on the driven shape key. Key it once first.")
+            return False
+
+        self.key_fcurve = fc
+        self.last_driver = None
+        self.last_value = None
+        return True
+
+    def _tick_key(self, props):
+        fc = self.key_fcurve
+        driver_val = read_driver_input(self.driver_obj, props.driver_bone, props.driver_data_path)
+
+        if self.last_driver is None or abs(driver_val - self.last_driver) > 1e-5:
+            # Driver moved: show the curve value there, nothing to write
+            self.last_driver = driver_val
+            self.last_value = fc.evaluate(driver_val)
+            props.driver_value = driver_val
+            props.driven_value = self.last_value
+            return
+
+        value = props.driven_value
+        if abs(value - self.last_value) < 1e-6:
+            return
+
+        kp = find_keyframe(fc, driver_val)
+        if kp:
+            set_keyframe_value(fc, kp, value)
+        else:
+            kp = fc.keyframe_points.insert(driver_val, value)
+            kp.interpolation = props.driver_interpolation
+            fc.update()
+        self.last_value = value
+
+    # --- POSE SESSION ---
+    def _start_pose(self, context, props):
+        """Mute the edited SDK and show its pose on the bone's base transform instead"""
+        const_name = sdk_constraint_name(self.driver_obj, props)
+        armature = self.driven_obj
+
+        self.bones = [] # (pb, const, channels: {(path, idx): (fcurve, orig_base)})
+        for pb in (context.selected_pose_bones or []):
+            if pb.id_data != armature:
+                continue
+            const = pb.constraints.get(const_name)
+            if not const or const.type != 'ACTION' or not const.action:
+                continue
+
+            channels = {}
+            for fc in const.action.fcurves:
+                path = fc.data_path.rsplit(".", 1)[-1]
+                if hasattr(pb, path):
+                    channels[path, fc.array_index] = (fc, getattr(pb, path)[fc.array_index])
+            if channels:
+                self.bones.append((pb, const, const.mute, channels))
+                const.mute = True
+
+        if not self.bones:
+            self.report({'ERROR'}, f"No selected bone has SDK '{const_name}'")
+            return False
+
+        self.last_driver = None
+        self.last_written = {}
+        return True
+
+    def _pose_frame(self, pb, const, driver_val, mapping=None):
+        """Action frame edited at this driver value and the SDK weight there.
+
+        Multi-key SDKs pass their value -> frame mapping (mirrored ones have their own).
+        Rest + Pose SDKs only hold their target pose, so the frame is None
+        unless the driver sits on the target value.
+        """
+        armature = self.driven_obj
+        if mapping is not None:
+            return multikey_frame(armature, pb, const, driver_val, mapping), 1.0
+
+        mapping = None
+        if armature.animation_data:
+            d_fc = armature.animation_data.drivers.find(f'pose.bones["{pb.name}"].constraints["{const.name}"].influence')
+            if d_fc:
+                mapping = read_influence_mapping(d_fc)
+        if not mapping or abs(mapping[1] - mapping[0]) < 1e-6:
+            return None, const.influence
+
+        rest, target = mapping
+        weight = min(max((driver_val - rest) / (target - rest), 0.0), 1.0)
+        frame = const.frame_end if abs(driver_val - target) < 1e-4 else None
+        return frame, weight
+
+    def _tick_pose(self, props):
+        driver_val = read_driver_input(self.driver_obj, props.driver_bone, props.driver_data_path)
+        driver_moved = self.last_driver is None or abs(driver_val - self.last_driver) > 1e-5
+        if driver_moved:
+            self.last_driver = driver_val
+            props.driver_value = driver_val
+
+        for pb, const, _, channels in self.bones:
+            mapping = multikey_mapping(self.driven_obj, pb, const) if is_multikey_sdk(self.driven_obj, pb, const) else None
+            frame, weight = self._pose_frame(pb, const, driver_val, mapping)
+
+            for (path, idx), (fc, orig) in channels.items():
+                key = (pb.name, path, idx)
+                prop = getattr(pb, path)
+
+                if driver_moved:
+                    # Show the SDK pose at the new driver value on the base transform
+                    pose_frame = frame if frame is not None else const.frame_end
+                    identity = 1.0 if ("scale" in path or ("quaternion" in path and idx == 0)) else 0.0
+                    action_val = fc.evaluate(pose_frame)
+                    action_val = identity + (action_val - identity) * weight
+                    value = compose_pose_value(action_val, orig, path, idx)
+                    prop[idx] = value
+                    self.last_written[key] = value
+                    continue
+
+                value = prop[idx]
+                if frame is None or abs(value - self.last_written.get(key, value)) < 1e-6:
+                    continue
+
+                # Only the changed channel is written back
+                key_value = decompose_pose_value(value, orig, path, idx)
+                kp = find_keyframe(fc, frame)
+                if kp:
+                    set_keyframe_value(fc, kp, key_value)
+                else:
+                    kp = fc.keyframe_points.insert(frame, key_value)
+                    kp.interpolation = props.driver_interpolation
+                    fc.update()
+                    if mapping is not None:
+                        # Refit with the mapping the key was placed with (keeps mirrored ranges)
+                        update_multikey_range(self.driven_obj, pb, const, mapping)
+                self.last_written[key] = value
+
+    def _finish_pose(self):
+        """Unmute the SDKs and give the bones their original base transform back"""
+        for pb, const, was_muted, channels in self.bones:
+            const.mute = was_muted
+            for (path, idx), (fc, orig) in channels.items():
+                getattr(pb, path)[idx] = orig
+
+    # --- MODAL ---
+    def modal(self, context, event):
+        if event.type == 'ESC' or _session_state["stop"]:
+            return self._finish(context)
+
+        if event.type == 'TIMER' and _session_state["dirty"]:
+            _session_state["dirty"] = False
+            props = context.scene.maya_shape_keys
+            try:
+                if self.mode == 'KEY':
+                    self._tick_key(props)
+                else:
+                    self._tick_pose(props)
+            except (ReferenceError, ValueError) as e:
+                # Edited data was deleted or the driver path became invalid
+                self.report({'WARNING'}, f"Live SDK Edit stopped: {e}")
+                return self._finish(context)
+
+        return {'PASS_THROUGH'}
+
+    def _finish(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        unregister_handler()
+
+        if self.mode == 'POSE':
+            self._finish_pose()
+
+        context.view_layer.update()
+        self.report({'INFO'}, "Live SDK Edit finished")
+        return {'FINISHED'}
@@ -0,0 +1,279 @@
+import bpy
+import hashlib
+from bpy.app.handlers import persistent
+from .naming import DEFAULT_CONVENTION, build_mirror_map
+from .utils import (
+    copy_driver_to_fcurve, mirrored_input_flip, read_keyframes, write_keyframes, reflect_keyframes,
+    mirror_channel_sign, multikey_reflect_pivot, KEYFRAME_VECTOR_ATTRS, MIRROR_LINK_PROP, log_debug,
+)
+from .symmetry import get_symmetry_map, read_coords, write_coords, basis_coords
+from .shape_math import mirror_shape_coords, mirror_shape_coords_partial, changed_vertices
+
+# Live L->R mirror link.
+# Objects flagged with MIRROR_LINK_PROP (value: source side) are watched by a persistent depsgraph
+# handler. Content hashes of the source shape keys, drivers and SDK actions are kept per
+# object and only items whose hash changed are mirrored again. Shape data is checked for the
+# active shape key, which is the key edit and sculpt mode write to.
+# {object name: {"hashes": {item: digest}, "coords": {shape key name: (V, 3) array}}}
+_link_cache = {}
+_syncing = False
+
+def _digest(*chunks):
+    h = hashlib.blake2b(digest_size=16)
+    for chunk in chunks:
+        h.update(chunk if isinstance(chunk, bytes) else str(chunk).encode())
+    return h.hexdigest()
+
+def _fcurve_digest(fc):
+    keys = read_keyframes(fc)
+    chunks = [keys[attr].tobytes() for attr in sorted(keys)]
+    drv = getattr(fc, "driver", None)
+    if drv:
+        chunks.append(f"{drv.type}|{drv.expression}")
+        for var in drv.variables:
+            for tgt in var.targets:
+                chunks.append(f"{var.name}|{var.type}|{tgt.id and tgt.id.name}|{tgt.bone_target}|{tgt.data_path}|{tgt.transform_type}")
+    return _digest(*chunks)
+
+def _changed(cache, item, digest):
+    """Record the digest of an item; True if it differs from the last one seen"""
+    old = cache["hashes"].get(item)
+    cache["hashes"][item] = digest
+    return old is not None and old != digest
+
+def _cache(obj):
+    return _link_cache.setdefault(obj.name, {"hashes": {}, "coords": {}})
+
+# Errors of a single item are logged and the item is retried on the next update
+_ITEM_ERRORS = (TypeError, ValueError, RuntimeError, KeyError)
+
+def _retry_later(cache, item, err):
+    cache["hashes"][item] = "" # Differs from every digest
+    print(f"[MayaShapeKeys] Mirror link skipped {item[0].lower()} {' / '.join(item[1:])}: {err}")
+
+
+# --- SHAPE KEYS ---
+def _add_mirrored_key(obj, kb, target_name):
+    target = obj.shape_key_add(name=target_name, from_mix=False)
+    co = read_coords(kb.data, len(obj.data.vertices))
+    write_coords(target, mirror_shape_coords(basis_coords(obj), co, get_symmetry_map(obj)))
+    return target
+
+def _sync_shape_data(obj, cache, kb, target_name):
+    key_blocks = obj.data.shape_keys.key_blocks
+    n = len(obj.data.vertices)
+    co = read_coords(kb.data, n)
+    old = cache["coords"].get(kb.name)
+    cache["coords"][kb.name] = co
+
+    if not _changed(cache, ("SHAPE", kb.name), _digest(co.tobytes())):
+        return False
+
+    basis = basis_coords(obj)
+    sym_map = get_symmetry_map(obj)
+    target = key_blocks.get(target_name)
+    if target is None or old is None:
+        target = target or obj.shape_key_add(name=target_name, from_mix=False)
+        write_coords(target, mirror_shape_coords(basis, co, sym_map))
+    else:
+        # Only the edited vertices (and their partners) are recomputed
+        tgt_co = read_coords(target.data, n)
+        mirror_shape_coords_partial(basis, co, tgt_co, sym_map, changed_vertices(old, co))
+        write_coords(target, tgt_co)
+    return True
+
+def sync_mesh(obj, full=False, shapes=True, drivers=True):
+    """Mirror changed source shape keys and shape drivers of a linked mesh. Returns the number of items written.
+
+    'shapes' / 'drivers' limit the check to shape data or to the shape key drivers; the
+    handler only checks what the depsgraph update can have changed.
+    """
+    key = obj.data.shape_keys
+    if not key:
+        return 0
+
+    side = obj.get(MIRROR_LINK_PROP)
+    cache = _cache(obj)
+    name_map = build_mirror_map(key.key_blocks.keys())
+    written = 0
+
+    edited = key.key_blocks if full else [obj.active_shape_key] if obj.active_shape_key else []
+    for kb in edited if shapes else []:
+        if kb == key.reference_key or DEFAULT_CONVENTION.side(kb.name) != side:
+            continue
+        try:
+            if _sync_shape_data(obj, cache, kb, name_map.flip(kb.name)):
+                written += 1
+        except _ITEM_ERRORS as err:
+            cache["coords"].pop(kb.name, None)
+            _retry_later(cache, ("SHAPE", kb.name), err)
+
+    if drivers and key.animation_data:
+        # Paths first: mirrored drivers are removed and re-added while looping
+        for path in [fc.data_path for fc in key.animation_data.drivers]:
+            name = path[len('key_blocks["'):-len('"].value')]
+            if not path.startswith('key_blocks["') or DEFAULT_CONVENTION.side(name) != side:
+                continue
+            fc = key.animation_data.drivers.find(path)
+            if fc is None:
+                continue
+            if not _changed(cache, ("DRIVER", path), _fcurve_digest(fc)):
+                continue
+
+            try:
+                # The mirrored key may not exist yet (driver added before the shape was edited)
+                target_name = name_map.flip(name)
+                if target_name not in key.key_blocks:
+                    _add_mirrored_key(obj, key.key_blocks[name], target_name)
+                tgt_path = f'key_blocks["{target_name}"].value'
+                key.driver_remove(tgt_path)
+                copy_driver_to_fcurve(fc, key.driver_add(tgt_path), mirrored_input_flip(fc.driver) is not None)
+                written += 1
+            except _ITEM_ERRORS as err:
+                _retry_later(cache, ("DRIVER", path), err)
+
+    if written:
+        obj.data.update()
+    return written
+
+
+# --- POSE SDKs ---
+def _sync_action(armature, pb, const, mirror_pb, tgt_const):
+    """Copy the source action keys into the already mirrored action (paths, signs and time reflection)"""
+    src_action, tgt_action = const.action, tgt_const.action
+    pivot = multikey_reflect_pivot(armature, pb, const)
+
+    for fc in src_action.fcurves:
+        path = fc.data_path.replace(pb.name, mirror_pb.name)
+        tgt_fc = tgt_action.fcurves.find(path, index=fc.array_index)
+        if tgt_fc is None:
+            tgt_fc = tgt_action.fcurves.new(path, index=fc.array_index, action_group=mirror_pb.name)
+
+        keys = read_keyframes(fc)
+        if pivot is not None:
+            keys = reflect_keyframes(keys, pivot)
+        sign = mirror_channel_sign(path, fc.array_index)
+        for attr in KEYFRAME_VECTOR_ATTRS:
+            keys[attr][:, 1] *= sign
+        write_keyframes(tgt_fc, keys)
+
+def sync_armature(armature, changed_actions=None):
+    """Mirror changed SDK actions and influence drivers of a linked armature onto existing mirrored SDKs"""
+    side = armature.get(MIRROR_LINK_PROP)
+    cache = _cache(armature)
+    bone_map = build_mirror_map(armature.pose.bones.keys())
+    anim = armature.animation_data
+    written = 0
+
+    for pb in armature.pose.bones:
+        if DEFAULT_CONVENTION.side(pb.name) != side:
+            continue
+        mirror_name = bone_map.partner(pb.name)
+        if not mirror_name:
+            continue
+        mirror_pb = armature.pose.bones[mirror_name]
+
+        for const in pb.constraints:
+            if const.type != 'ACTION' or not const.name.startswith("SDK_") or not const.action:
+                continue
+            tgt_const = mirror_pb.constraints.get(DEFAULT_CONVENTION.flip(const.name) or const.name)
+            if not tgt_const or not tgt_const.action or tgt_const.action == const.action:
+                continue # Not mirrored yet: that is the job of the mirror operators
+
+            if changed_actions is None or const.action in changed_actions:
+                action_digest = _digest(*(_fcurve_digest(fc) for fc in const.action.fcurves))
+                if _changed(cache, ("ACTION", pb.name, const.name), action_digest):
+                    try:
+                        _sync_action(armature, pb, const, mirror_pb, tgt_const)
+                        written += 1
+                    except _ITEM_ERRORS as err:
+                        _retry_later(cache, ("ACTION", pb.name, const.name), err)
+
+            src_fc = anim.drivers.find(f'pose.bones["{pb.name}"].constraints["{const.name}"].influence') if anim else None
+            if src_fc and src_fc.keyframe_points and _changed(cache, ("DRIVER", pb.name, const.name), _fcurve_digest(src_fc)):
+                try:
+                    tgt_path = f'pose.bones["{mirror_name}"].constraints["{tgt_const.name}"].influence'
+                    armature.driver_remove(tgt_path)
+                    copy_driver_to_fcurve(src_fc, armature.driver_add(tgt_path), mirrored_input_flip(src_fc.driver) is not None)
+                    written += 1
+                except _ITEM_ERRORS as err:
+                    _retry_later(cache, ("DRIVER", pb.name, const.name), err)
+
+    return written
+
+
+# --- HANDLER ---
+def unlink(obj):
+    _link_cache.pop(obj.name, None)
+    if MIRROR_LINK_PROP in obj:
+        del obj[MIRROR_LINK_PROP]
+
+def baseline(obj):
+    """Forget old hashes and record the current state, so only later edits are mirrored"""
+    _link_cache.pop(obj.name, None)
+    if obj.type == 'MESH':
+        sync_mesh(obj, full=True)
+    elif obj.type == 'ARMATURE':
+        sync_armature(obj)
+
+@persistent
+def mirror_link_update(scene, depsgraph):
+    global _syncing
+    if _syncing:
+        return
+
+    # {mesh object: [shape data may have changed, shape drivers may have changed]}
+    # Updates that only move driver bones re-evaluate the mesh without editing anything,
+    # so shape data is hashed on geometry updates and drivers on updates of the Key itself.
+    meshes, armatures, actions = {}, set(), set()
+    def linked_meshes(data):
+        return (o for o in bpy.data.objects if o.get(MIRROR_LINK_PROP) and o.type == 'MESH' and (o.data == data or o.data.shape_keys == data))
+        
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        if isinstance(id_data, bpy.types.Object) and id_data.get(MIRROR_LINK_PROP):
+            if id_data.type == 'ARMATURE':
+                armatures.add(id_data)
+            elif update.is_updated_geometry:
+                meshes.setdefault(id_data, [False, False])[0] = True
+        elif isinstance(id_data, bpy.types.Mesh) and update.is_updated_geometry:
+            for o in linked_meshes(id_data):
+                meshes.setdefault(o, [False, False])[0] = True
+        elif isinstance(id_data, bpy.types.Key):
+            for o in linked_meshes(id_data):
+                flags = meshes.setdefault(o, [False, False])
+                flags[0] |= update.is_updated_geometry
+                flags[1] = True
+        elif isinstance(id_data, bpy.types.Action):
+            actions.add(id_data)
+
+    if actions:
+        armatures.update(o for o in bpy.data.objects if o.get(MIRROR_LINK_PROP) and o.type == 'ARMATURE')
+    if not meshes and not armatures:
+        return
+
+    _syncing = True
+    try:
+        for obj, (shapes, drivers) in meshes.items():
+            if obj.name not in _link_cache:
+                baseline(obj)
+            elif sync_mesh(obj, shapes=shapes, drivers=drivers):
+                log_debug(f"[DEBUG] Mirror link updated '{obj.name}'")
+        for obj in armatures:
+            if obj.name not in _link_cache:
+                baseline(obj)
+            elif sync_armature(obj, actions):
+                log_debug(f"[DEBUG] Mirror link updated '{obj.name}'")
+    except ReferenceError:
+        _link_cache.clear()
+    finally:
+        _syncing = False
+
+def register_handler():
+    if mirror_link_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(mirror_link_update)
+
+def unregister_handler():
+    if mirror_link_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(mirror_link_update)
+    _link_cache.clear()
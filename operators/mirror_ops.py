@@ -0,0 +1,314 @@
+import bpy
+from .naming import DEFAULT_CONVENTION, build_mirror_map
+from .utils import (
+    rig_mirror_map, iter_sdk_drivers, copy_driver_to_fcurve, mirrored_input_flip,
+    create_mirrored_shape, log_debug, request_update, HAS_NUMPY, MIRROR_LINK_PROP,
+)
+from .pose_ops import SDKMirrorMixin
+from .batch_ops import rig_build
+
+def _shape_key_name(data_path):
+    # key_blocks["Name"].value -> Name
+    return data_path[len('key_blocks["'):-len('"].value')]
+
+
+class BSETUP_OT_MirrorRig(SDKMirrorMixin, bpy.types.Operator):
+    """Mirror every SDK (shape key drivers and pose Action constraints) from one side of the rig to the other"""
+    bl_idname = "bsetup.mirror_rig"
+    bl_label = "Mirror Whole Rig"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    source_side: bpy.props.EnumProperty(
+        name="Source Side",
+        items=[
+            ('LEFT', "Left to Right", "Mirror SDKs on left side names to the right side"),
+            ('RIGHT', "Right to Left", "Mirror SDKs on right side names to the left side"),
+        ],
+        default='LEFT'
+    )
+
+    include_shapes: bpy.props.BoolProperty(
+        name="Shape Key Drivers",
+        description="Mirror shape key SDK drivers",
+        default=True
+    )
+
+    include_poses: bpy.props.BoolProperty(
+        name="Pose SDKs",
+        description="Mirror SDK Action constraints on pose bones",
+        default=True
+    )
+
+    create_missing_shapes: bpy.props.BoolProperty(
+        name="Create Missing Shapes",
+        description="Create mirrored shape key geometry when the counterpart key does not exist",
+        default=True
+    )
+
+    use_topology: bpy.props.BoolProperty(
+        name="Topology Mirror",
+        description="Use topology based mirroring for created shape keys",
+        default=False
+    )
+
+    def execute(self, context):
+        self.created = self.updated = 0
+        self.skipped = []
+
+        # One depsgraph update at the end instead of one per mirrored item
+        with rig_build(context, message="Mirror Rig", push_undo=False):
+            if self.include_shapes:
+                self.mirror_shapes(context)
+            if self.include_poses:
+                self.mirror_poses(context)
+
+        for item, reason in self.skipped:
+            print(f"[MayaShapeKeys] Mirror skipped {item}: {reason}")
+
+        self.report({'INFO'}, f"Mirrored rig: {self.created} created, {self.updated} updated, {len(self.skipped)} skipped")
+        return {'FINISHED'}
+
+    def mirror_shapes(self, context):
+        mesh_users = {}
+        for obj in bpy.data.objects:
+            if obj.type == 'MESH' and obj.data.shape_keys:
+                mesh_users.setdefault(obj.data.shape_keys.name, obj)
+
+        # Collect first: adding drivers while iterating the collection is unsafe
+        sources = [(key, fc) for key, fc, kind in iter_sdk_drivers() if kind == 'SHAPE']
+
+        for key, src_fc in sources:
+            name = _shape_key_name(src_fc.data_path)
+            if DEFAULT_CONVENTION.side(name) != self.source_side:
+                continue
+
+            obj = mesh_users.get(key.name)
+            target_name = DEFAULT_CONVENTION.flip(name)
+            if not obj:
+                self.skipped.append((name, "no mesh uses this shape key block"))
+                continue
+
+            key_blocks = key.key_blocks
+            if target_name in key_blocks:
+                self.updated += 1
+            elif self.create_missing_shapes:
+                with context.temp_override(active_object=obj, object=obj):
+                    target_name = create_mirrored_shape(obj, name, target_name, self.use_topology).name
+                self.created += 1
+            else:
+                self.skipped.append((name, f"'{target_name}' does not exist"))
+                continue
+
+            target_path = f'key_blocks["{target_name}"].value'
+            key.driver_remove(target_path)
+
+            invert = self.invert_driver or mirrored_input_flip(src_fc.driver) is not None
+            copy_driver_to_fcurve(src_fc, key.driver_add(target_path), invert)
+            log_debug(f"[DEBUG] Mirrored shape driver '{name}' -> '{target_name}'")
+
+            request_update(context, obj)
+
+    def mirror_poses(self, context):
+        for armature in [o for o in bpy.data.objects if o.type == 'ARMATURE']:
+            bone_map, _, action_map = rig_mirror_map(armature)
+
+            for pb in armature.pose.bones:
+                if DEFAULT_CONVENTION.side(pb.name) != self.source_side:
+                    continue
+
+                sdk_consts = [c for c in pb.constraints if c.type == 'ACTION' and c.name.startswith("SDK_")]
+                if not sdk_consts:
+                    continue
+
+                mirror_name = bone_map.partner(pb.name)
+                if not mirror_name:
+                    for const in sdk_consts:
+                        self.skipped.append((f"{pb.name}: {const.name}", "no mirror bone"))
+                    continue
+
+                mirror_pb = armature.pose.bones[mirror_name]
+                for const in sdk_consts:
+                    status = self.mirror_sdk_constraint(context, armature, pb, mirror_pb, const, action_map)
+                    if status == 'CREATED':
+                        self.created += 1
+                    elif status == 'UPDATED':
+                        self.updated += 1
+                    else:
+                        self.skipped.append((f"{pb.name}: {const.name}", "no action"))
+
+            request_update(context, armature)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+
+# Mirrored shapes closer than this to the existing counterpart count as up to date
+STALE_TOLERANCE = 1e-5
+
+
+class BSETUP_OT_MirrorAllShapes(bpy.types.Operator):
+    """Mirror every shape key whose L/R counterpart is missing or out of date, including their drivers"""
+    bl_idname = "bsetup.mirror_all_shapes"
+    bl_label = "Mirror All Shapes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    source_side: bpy.props.EnumProperty(
+        name="Source Side",
+        items=[
+            ('LEFT', "Left to Right", "Left side shape keys are the source"),
+            ('RIGHT', "Right to Left", "Right side shape keys are the source"),
+        ],
+        default='LEFT'
+    )
+
+    update_stale: bpy.props.BoolProperty(
+        name="Update Stale",
+        description="Overwrite existing counterparts whose geometry no longer matches the mirrored source",
+        default=True
+    )
+
+    mirror_drivers: bpy.props.BoolProperty(
+        name="Mirror Drivers",
+        description="Mirror the SDK driver of every written shape key (and add missing ones)",
+        default=True
+    )
+
+    invert_driver: bpy.props.BoolProperty(
+        name="Invert Driver",
+        description="Always negate the driver input values (mirrored X-Location / Y/Z-Rotation inputs are detected automatically)",
+        default=False
+    )
+
+    use_topology: bpy.props.BoolProperty(
+        name="Topology Mirror",
+        description="Build the symmetry map from topology instead of vertex positions",
+        default=False
+    )
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or obj.type != 'MESH' or not obj.data.shape_keys:
+            self.report({'ERROR'}, "Select a Mesh Object with Shape Keys")
+            return {'CANCELLED'}
+
+        if not HAS_NUMPY:
+            self.report({'ERROR'}, "Mirror All Shapes requires numpy")
+            return {'CANCELLED'}
+
+        import numpy as np
+        from .symmetry import get_symmetry_map, read_coords, write_coords, basis_coords
+        from .shape_math import mirror_shape_coords
+
+        key = obj.data.shape_keys
+        key_blocks = key.key_blocks
+        name_map = build_mirror_map(key_blocks.keys())
+        n = len(obj.data.vertices)
+
+        sym_map = get_symmetry_map(obj, self.use_topology)
+        basis = basis_coords(obj)
+
+        drivers = {}
+        if key.animation_data:
+            drivers = {fc.data_path: fc for fc in key.animation_data.drivers}
+
+        created = updated = current = stale = 0
+        sources = [kb for kb in key_blocks if kb != key.reference_key and DEFAULT_CONVENTION.side(kb.name) == self.source_side]
+
+        with rig_build(context, message="Mirror All Shapes", push_undo=False):
+            for src_kb in sources:
+                target_name = name_map.flip(src_kb.name)
+                mirrored = mirror_shape_coords(basis, read_coords(src_kb.data, n), sym_map)
+
+                tgt_kb = key_blocks.get(target_name)
+                if tgt_kb is None:
+                    tgt_kb = obj.shape_key_add(name=target_name, from_mix=False)
+                    self._copy_settings(src_kb, tgt_kb, name_map)
+                    created += 1
+                elif np.allclose(read_coords(tgt_kb.data, n), mirrored, atol=STALE_TOLERANCE):
+                    current += 1
+                    mirrored = None
+                elif self.update_stale:
+                    updated += 1
+                else:
+                    stale += 1
+                    mirrored = None
+
+                if mirrored is not None:
+                    write_coords(tgt_kb, mirrored)
+
+                if self.mirror_drivers:
+                    src_fc = drivers.get(f'key_blocks["{src_kb.name}"].value')
+                    tgt_path = f'key_blocks["{tgt_kb.name}"].value'
+                    # Written shapes get a fresh driver, up to date shapes only a missing one
+                    if src_fc and (mirrored is not None or tgt_path not in drivers):
+                        key.driver_remove(tgt_path)
+                        invert = self.invert_driver or mirrored_input_flip(src_fc.driver) is not None
+                        copy_driver_to_fcurve(src_fc, key.driver_add(tgt_path), invert)
+                        log_debug(f"[DEBUG] Mirrored shape driver '{src_kb.name}' -> '{tgt_kb.name}'")
+
+            obj.data.update()
+            request_update(context, obj)
+
+        msg = f"Mirrored shapes: {created} created, {updated} updated, {current} up to date"
+        if stale:
+            msg += f", {stale} stale left unchanged"
+        self.report({'INFO'}, msg)
+        return {'FINISHED'}
+
+    def _copy_settings(self, src_kb, tgt_kb, name_map):
+        tgt_kb.slider_min = src_kb.slider_min
+        tgt_kb.slider_max = src_kb.slider_max
+        tgt_kb.interpolation = src_kb.interpolation
+        if src_kb.vertex_group:
+            tgt_kb.vertex_group = DEFAULT_CONVENTION.flip(src_kb.vertex_group) or src_kb.vertex_group
+        relative = name_map.flip(src_kb.relative_key.name) or src_kb.relative_key.name
+        if relative in src_kb.id_data.key_blocks:
+            tgt_kb.relative_key = src_kb.id_data.key_blocks[relative]
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+
+class BSETUP_OT_ToggleMirrorLink(bpy.types.Operator):
+    """Keep the other side mirrored while editing: changed source shapes, drivers and SDK actions are mirrored again automatically"""
+    bl_idname = "bsetup.toggle_mirror_link"
+    bl_label = "Live Mirror Link"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    source_side: bpy.props.EnumProperty(
+        name="Source Side",
+        items=[
+            ('LEFT', "Left to Right", "Edits on the left side are mirrored to the right"),
+            ('RIGHT', "Right to Left", "Edits on the right side are mirrored to the left"),
+        ],
+        default='LEFT'
+    )
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or obj.type not in {'MESH', 'ARMATURE'}:
+            self.report({'ERROR'}, "Select a Mesh or Armature")
+            return {'CANCELLED'}
+
+        if not HAS_NUMPY:
+            self.report({'ERROR'}, "Live Mirror Link requires numpy")
+            return {'CANCELLED'}
+
+        from . import mirror_link
+
+        if obj.get(MIRROR_LINK_PROP):
+            mirror_link.unlink(obj)
+            self.report({'INFO'}, f"Mirror link disabled on '{obj.name}'")
+            return {'FINISHED'}
+
+        obj[MIRROR_LINK_PROP] = self.source_side
+        # Existing differences stay as they are, only edits from now on are mirrored
+        mirror_link.baseline(obj)
+        self.report({'INFO'}, f"Mirror link enabled on '{obj.name}' ({self.source_side.title()} side is the source)")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        obj = context.active_object
+        if obj and obj.get(MIRROR_LINK_PROP):
+            return self.execute(context)
+        return context.window_manager.invoke_props_dialog(self)
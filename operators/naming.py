@@ -0,0 +1,117 @@
+import re
+from functools import lru_cache
+
+# L/R naming conventions. No bpy import here so the rules can be checked outside of Blender.
+#
+# A rule is (template, left_tokens, right_tokens). '{side}' in the template marks where the
+# side token sits, tokens are paired by position (("L", "l"), ("R", "r")) -> L<->R, l<->r.
+# Rules are tried in order and the first rule that matches decides the flip, so a name
+# like "Left_Arm_L" only has its "_L" suffix flipped.
+DEFAULT_RULES = (
+    (r'_{side}(?=$|[._])', ("L", "l"), ("R", "r")),   # Arm_L, Arm_L.001, Leg_L_01
+    (r'\.{side}(?=$|[._])', ("L", "l"), ("R", "r")),  # Arm.L, Arm.L.001
+    (r'^{side}(?=[._])', ("L",), ("R",)),             # L_Arm, L.Arm
+    (r'{side}(?![a-z])', ("Left",), ("Right",)),      # LeftArm, eyeBlinkLeft, not "Leftover"
+    (r'(?:^|[._]){side}(?=$|[._])', ("left",), ("right",)),   # arm_left, not "mouth_cleft"
+)
+
+
+class NamingConvention:
+    """Precompiled L/R flip rules with a memoized flip()"""
+
+    def __init__(self, rules=DEFAULT_RULES):
+        self.rules = tuple((t, tuple(l), tuple(r)) for t, l, r in rules)
+        self._compiled = []
+        for template, left, right in self.rules:
+            swap = dict(zip(left, right))
+            swap.update(zip(right, left))
+            for label, tokens in (('LEFT', left), ('RIGHT', right)):
+                side = "(?P<side>" + "|".join(re.escape(t) for t in tokens) + ")"
+                self._compiled.append((re.compile(template.replace("{side}", side)), swap, label))
+        self._cache = {}
+
+    def __eq__(self, other):
+        return isinstance(other, NamingConvention) and self.rules == other.rules
+
+    def __hash__(self):
+        return hash(self.rules)
+
+    def _swap(self, swap):
+        def repl(m):
+            start, end = m.span("side")
+            return m.group(0)[:start - m.start()] + swap[m.group("side")] + m.group(0)[end - m.start():]
+        return repl
+
+    def _match(self, name):
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        result = (None, None)
+        for pattern, swap, label in self._compiled:
+            if pattern.search(name):
+                result = (pattern.sub(self._swap(swap), name), label)
+                break
+
+        self._cache[name] = result
+        return result
+
+    def flip(self, name):
+        """Mirrored name, or None if the name has no side token"""
+        return self._match(name)[0]
+
+    def side(self, name):
+        """'LEFT', 'RIGHT' or None (center) according to the first matching rule"""
+        return self._match(name)[1]
+
+
+DEFAULT_CONVENTION = NamingConvention()
+
+
+def flip_name(name):
+    """Flip .L/.R, _L/_R, L_, R_, Left, Right naming conventions, preserving suffixes like .001"""
+    return DEFAULT_CONVENTION.flip(name)
+
+
+class MirrorMap:
+    """Bidirectional L<->R map over one set of names (bones, shape keys, actions ...)"""
+
+    def __init__(self, names, convention=DEFAULT_CONVENTION):
+        self.convention = convention
+        self.pairs = {}
+        self.unpaired = set() # Sided names whose partner does not exist (yet)
+        self.centers = set()  # Names without a side token
+
+        for name in names:
+            flipped = convention.flip(name)
+            if flipped is None or flipped == name:
+                self.centers.add(name)
+            elif flipped in names:
+                self.pairs[name] = flipped
+            else:
+                self.unpaired.add(name)
+
+    def __contains__(self, name):
+        return name in self.pairs
+
+    def __len__(self):
+        return len(self.pairs)
+
+    def partner(self, name):
+        """Existing partner of 'name', or None"""
+        return self.pairs.get(name)
+
+    def flip(self, name):
+        """Existing partner, or the convention's flipped name for names that are not paired"""
+        return self.pairs.get(name) or self.convention.flip(name)
+
+
+@lru_cache(maxsize=64)
+def _cached_map(names, convention):
+    return MirrorMap(names, convention)
+
+
+def build_mirror_map(names, convention=DEFAULT_CONVENTION):
+    """MirrorMap for 'names', cached against the name set (renames or new names rebuild it)"""
+    return _cached_map(frozenset(names), convention)
@@ -1,11 +1,14 @@
 import bpy
-from .utils import flip_name, copy_driver_to_fcurve
+import math
+from .utils import (
+    flip_name, flip_bone_name, rig_mirror_map, flip_data_path, copy_driver_to_fcurve, simplify_driver_expression,
+    iter_sdk_drivers, read_influence_mapping, set_influence_mapping,
+    mirrored_input_flip, ensure_hub_for_path, is_multikey_sdk, multikey_reflect_pivot, mirror_channel_sign, mirror_fcurve_keys,
+    log_debug, request_update,
+)
 
-class BSETUP_OT_MirrorPoseDriver(bpy.types.Operator):
-    """Mirror drivers from selected bones to their symmetrical counterparts"""
-    bl_idname = "bsetup.mirror_pose_driver"
-    bl_label = "Mirror Pose Driver"
-    bl_options = {'REGISTER', 'UNDO'}
+class SDKMirrorMixin:
+    """Settings and per-constraint logic shared by the pose SDK mirror operators"""
     
     invert_driver: bpy.props.BoolProperty(
         name="Invert Driver",
@@ -30,6 +33,371 @@ class BSETUP_OT_MirrorPoseDriver(bpy.types.Operator):
         description="Auto-apply normalization formula for Scale drivers (clamp((var-1)/(tgt-1))...)",
         default=False
     )
+
+    def mirror_sdk_constraint(self, context, armature, pb, mirror_pb, const, action_map):
+        """Mirror one SDK Action constraint (action, settings and drivers) from pb onto mirror_pb.
+
+        Returns 'CREATED' or 'UPDATED', or None if the constraint has no action.
+        """
+        mirror_name = mirror_pb.name
+        existed = (flip_name(const.name) or const.name) in mirror_pb.constraints
+        
+        # Found a driver constraint
+        src_action = const.action
+        if not src_action: return None
+        
+        # 3. Determine Constraint Target Info
+        target_obj = const.target
+        target_bone_name = const.subtarget
+        
+        # Flip target bone
+        if target_bone_name:
+            target_bone_name = flip_bone_name(target_obj, target_bone_name)
+        
+        # Flip target object (rare)
+        if target_obj and flip_name(target_obj.name) and flip_name(target_obj.name) in bpy.data.objects:
+            target_obj = bpy.data.objects[flip_name(target_obj.name)]
+            
+        # 4. Create/Get Target Constraint
+        new_const_name = flip_name(const.name)
+        if not new_const_name: new_const_name = const.name
+        
+        tgt_const = mirror_pb.constraints.get(new_const_name)
+        if tgt_const:
+            # Force remove to ensure clean state (Fixes assignment bugs)
+            mirror_pb.constraints.remove(tgt_const)
+            
+        tgt_const = mirror_pb.constraints.new('ACTION')
+        tgt_const.name = new_const_name
+            
+        # Copy Settings
+        tgt_const.target = target_obj
+        tgt_const.subtarget = target_bone_name
+        tgt_const.min = const.min
+        tgt_const.max = const.max
+        tgt_const.frame_start = const.frame_start
+        tgt_const.frame_end = const.frame_end
+        tgt_const.transform_channel = const.transform_channel
+        tgt_const.target_space = const.target_space
+        tgt_const.mix_mode = const.mix_mode # Important: Copy AFTER/ADD
+        
+        # Copy Evaluation Time Settings (Critical for this setup)
+        if hasattr(const, "use_eval_time"):
+            tgt_const.use_eval_time = const.use_eval_time
+            tgt_const.eval_time = const.eval_time
+            
+            # SAFETY: If we detect an influence driver on source, we almost certainly want this ON
+            # because that's how this addon works (Fixed Action Time, Driven Influence)
+            # We don't check for driver here, but we can assume if use_eval_time is True, it's True.
+            if const.use_eval_time:
+                 tgt_const.use_eval_time = True # Force set explicit
+        
+        # 5. Mirror Action
+        # Ensure name is FLIPPED.
+        new_action_name = action_map.flip(src_action.name)
+        
+        if not new_action_name: 
+             # Try manual replacement if flip failed (e.g. name didn't have L/R but bone did?)
+             new_action_name = src_action.name.replace(pb.name, mirror_name)
+        
+        # SAFETY: If name is still same (e.g. "MyAction" -> "MyAction"), we get a collision.
+        if new_action_name == src_action.name:
+            new_action_name = f"{src_action.name}_Mirrored"
+        
+        # 5b. COPY SOURCE ACTION (Preserves metadata/groups)
+        if new_action_name in bpy.data.actions:
+            # If exists, we should probably start fresh to ensure clean state? 
+            # Or update it? For mirroring, we usually want to Overwrite.
+            # Easiest way: Remove old, copy new.
+            bpy.data.actions.remove(bpy.data.actions[new_action_name])
+        
+        tgt_action = src_action.copy()
+        tgt_action.name = new_action_name
+        tgt_action.use_fake_user = True
+        
+        # Robust Action Assignment
+        if hasattr(tgt_const, "use_bone_object_action"):
+            tgt_const.use_bone_object_action = False
+        
+        log_debug(f"[DEBUG] Assigning Action '{tgt_action.name}' to Constraint '{tgt_const.name}' on '{mirror_pb.name}'")
+        tgt_const.action = tgt_action
+        
+        # Workaround if direct assignment failed (sometimes happens in 4.0+)
+        if tgt_const.action != tgt_action:
+            print(f"[WARNING] Direct assignment failed. Attempting Context Override Workaround...")
+            try:
+                # Preferred method for Blender 3.2+
+                if hasattr(context, "temp_override"):
+                    with context.temp_override(active_object=armature, object=armature):
+                        bpy.ops.object.mode_set(mode='POSE')
+                        bpy.ops.pose.select_all(action='DESELECT')
+                        mirror_pb.bone.select = True
+                        armature.data.bones.active = mirror_pb.bone
+                        tgt_const.action = tgt_action
+            except Exception as e:
+                print(f"[ERROR] Assignment Workaround Exception: {e}")
+                
+        # FINAL CHECK
+        if tgt_const.action != tgt_action:
+             self.report({'ERROR'}, f"Failed to assign Action '{tgt_action.name}' to mirrored bone '{mirror_pb.name}'")
+        else:
+             log_debug(f"[SUCCESS] Action assigned successfully.")
+             
+             # --- APPLY PROPERTIES AFTER ACTION ASSIGNMENT (Fixes Reset/Override Issues) ---
+             try:
+                 tgt_const.target = target_obj
+                 tgt_const.subtarget = target_bone_name
+                 tgt_const.min = const.min
+                 tgt_const.max = const.max
+                 tgt_const.frame_start = const.frame_start
+                 tgt_const.frame_end = const.frame_end
+                 tgt_const.transform_channel = const.transform_channel
+                 tgt_const.target_space = const.target_space
+                 tgt_const.mix_mode = const.mix_mode
+                 
+                 if hasattr(const, "use_eval_time"):
+                     tgt_const.use_eval_time = const.use_eval_time
+                     tgt_const.eval_time = const.eval_time
+             except Exception as e:
+                 print(f"[WARNING] property sync error: {e}")
+
+
+
+
+        
+        # 6. MODIFY KEYS IN PLACE (Since we copied)
+        
+        # We need to iterate curves and FLIP PATHS and VALUES
+        # NOTE: Modifying data_path while iterating might be risky if we rely on it?
+        # FCurves are list.
+        
+        # Multi-key SDKs driven through the channel range are reflected in time when
+        # the mirrored input moves the opposite way (see 6b)
+        reflect_pivot = multikey_reflect_pivot(armature, pb, const, self.invert_driver)
+        
+        for fc in tgt_action.fcurves:
+            # Path: pose.bones["Bone.L"].location
+            # We need to construct path for Mirror Bone: pose.bones["Bone.R"].location
+            
+            original_path = fc.data_path
+            new_path = original_path.replace(pb.name, mirror_name)
+            
+            # Apply new path
+            fc.data_path = new_path
+            
+            # Update Group name if it matches bone name
+            if fc.group and fc.group.name == pb.name:
+                 # We can't rename group easily if it's shared? 
+                 # But in a mirrored action, the group SHOULD be the mirror bone.
+                 # Check if group exists?
+                 pass # Blender handles groups loosely.
+                 # Better: Set group explicitly
+                 # fc.group = tgt_action.groups.new(mirror_pb.name) # Might fail if exists.
+                 # Usually we don't need to stress groups for functionality.
+            
+            # Flip Logic for Values, plus the time reflection of mirrored multi-key SDKs (6b)
+            flip_mult = mirror_channel_sign(new_path, fc.array_index) if self.mirror_axis_values else 1.0
+            mirror_fcurve_keys(fc, flip_mult, reflect_pivot)
+        
+        # 6b. MULTI-KEY SDKs map the driver through the constraint range.
+        # If the mirrored input moves the opposite way, negate the range (the keys
+        # were reflected in time in step 6) so each pose stays at its mirrored driver value.
+        if is_multikey_sdk(armature, pb, const):
+            if const.use_eval_time:
+                src_eval = armature.animation_data.drivers.find(f'pose.bones["{pb.name}"].constraints["{const.name}"].eval_time')
+                if src_eval:
+                    tgt_const.driver_remove("eval_time")
+                    tgt_eval = tgt_const.driver_add("eval_time")
+                    for mod in list(tgt_eval.modifiers):
+                        tgt_eval.modifiers.remove(mod)
+                    copy_driver_to_fcurve(src_eval, tgt_eval, self.invert_driver)
+            elif reflect_pivot is not None:
+                tgt_const.min, tgt_const.max = -const.max, -const.min
+                
+        # 7. Mirror Influence Driver
+        # The source constraint has a driver on "influence"
+        # We need to copy it to tgt_const
+        
+        src_drv = None
+        # Find driver on source constraint
+        # Constraints drivers are on the Object/Bone ID_Data?
+        # No, usually on the Object/Armature data block or Object block?
+        # Armature -> pose.bones["Bone"].constraints["Name"].influence
+        
+        # We need to find the fcurve
+        anim_data = armature.animation_data
+        if anim_data and anim_data.drivers:
+            path_check = f'pose.bones["{pb.name}"].constraints["{const.name}"].influence'
+            for fc in anim_data.drivers:
+                 if fc.data_path == path_check:
+                     src_drv = fc
+                     break
+        
+        if src_drv:
+            # Drive proper target path
+            tgt_path = f'pose.bones["{mirror_pb.name}"].constraints["{tgt_const.name}"].influence'
+            
+            # Remove existing
+            try: armature.driver_remove(tgt_path)
+            except: pass
+            
+            tgt_drv_fc = armature.driver_add(tgt_path)
+            
+            # Auto-Detect Inversion Logic
+            # If the driver relies on LOC_X, ROT_Y, ROT_Z -> These flip signs in mirror.
+            # We must invert the driver curve inputs.
+            tt = mirrored_input_flip(src_drv.driver)
+            auto_invert = tt is not None
+            
+            final_invert = self.invert_driver or auto_invert
+            if auto_invert:
+                 log_debug(f"[DEBUG] Auto-Inverting Driver Curve for {mirror_pb.name} (Detected {tt})")
+            
+            # Copy logic
+            # If the user provided a custom expression, we apply it AFTER copying
+
+            
+            # --- MIRROR LOGIC UPDATE for Expression-based Drivers (e.g. Scale) ---
+            # If the source driver has NO keyframes (because it uses pure expression),
+            # copy_driver_to_fcurve might not work perfectly or we need special handling.
+            
+            is_expression_only = len(src_drv.keyframe_points) == 0
+            
+            if is_expression_only:
+                log_debug(f"[DEBUG] Mirroring Expression-Only Driver (Scale Fix?)")
+                
+                # 1. Copy Driver Properties Manually
+                tgt_drv_fc.driver.type = src_drv.driver.type
+                tgt_drv_fc.driver.expression = src_drv.driver.expression
+                
+                # 2. Recreate Variables
+                for src_var in src_drv.driver.variables:
+                    new_var = tgt_drv_fc.driver.variables.new()
+                    new_var.name = src_var.name
+                    new_var.type = src_var.type
+                    
+                    # Copy Targets
+                    for i, src_tgt in enumerate(src_var.targets):
+                        tgt = new_var.targets[i]
+                        tgt.id = src_tgt.id # Start with same ID
+                        
+                        # Handle ID Flipping (Object)
+                        if src_tgt.id and hasattr(src_tgt.id, "name"):
+                            flipped_id_name = flip_name(src_tgt.id.name)
+                            if flipped_id_name and flipped_id_name in bpy.data.objects:
+                                 tgt.id = bpy.data.objects[flipped_id_name]
+                        
+                        # Handle TRANSFORMS
+                        if src_var.type == 'TRANSFORMS':
+                            tgt.transform_type = src_tgt.transform_type
+                            tgt.transform_space = src_tgt.transform_space
+                            
+                            # FLIP BONE TARGET
+                            if src_tgt.bone_target:
+                                tgt.bone_target = flip_bone_name(tgt.id, src_tgt.bone_target)
+                                if tgt.bone_target == src_tgt.bone_target:
+                                    print(f"[WARNING] Could not flip bone target '{src_tgt.bone_target}'")
+                                log_debug(f"[DEBUG] Flipping Var Target: '{src_tgt.bone_target}' -> '{tgt.bone_target}'")
+                        else:
+                            # Single Prop
+                            tgt.data_path = src_tgt.data_path
+                            # Try flipping path (e.g. pose.bones["Bone.L"])
+                            flipped_path = flip_data_path(src_tgt.data_path)
+                            if flipped_path:
+                                tgt.data_path = flipped_path
+                            ensure_hub_for_path(tgt.id, tgt.data_path)
+
+                # 3. Apply Expression
+                # Handle Auto-Invert (e.g. Loc X needs to be flipped)
+                # Expression is typically: clamp((var - Rest) / Denom, ...)
+                if auto_invert:
+                     # We wrap 'var' with '(-var)'
+                     # This is a safe heuristic for our specific generated expressions.
+                     if "var" in tgt_drv_fc.driver.expression:
+                          tgt_drv_fc.driver.expression = tgt_drv_fc.driver.expression.replace("var", "(-var)")
+                          log_debug(f"[DEBUG] Inverted Expression var: {tgt_drv_fc.driver.expression}")
+                
+                tgt_drv_fc.update()
+                
+            else:
+                 # Standard Keyframe-based Copy
+                 if self.driver_expression != "var" or self.use_scale_fix:
+                      # We copy first to get variables, then override expression
+                      copy_driver_to_fcurve(src_drv, tgt_drv_fc, False)
+                      tgt_drv_fc.driver.type = 'SCRIPTED'
+                      
+                      # Expression Logic
+                      final_expr = self.driver_expression
+                      
+                      # Auto-Override if Scale Fix is requested
+                      if self.use_scale_fix:
+                          final_expr = "clamp((var - 1) / (<TARGET> - 1), 0, 1)"
+                      
+                      # Token Substitution: <TARGET>
+                      target_val = 1.0
+                      if len(src_drv.keyframe_points) >= 2:
+                          target_val = src_drv.keyframe_points[1].co[0]
+                      
+                      if "<TARGET>" in final_expr:
+                          final_expr = final_expr.replace("<TARGET>", f"{target_val:.4f}")
+                          
+                      tgt_drv_fc.driver.expression = final_expr
+                      
+                      # Keep custom overrides on the native (non-Python) evaluation path
+                      if simplify_driver_expression(tgt_drv_fc.driver):
+                          log_debug(f"[DEBUG] Rewrote override expression to: {tgt_drv_fc.driver.expression}")
+                      
+                      # Remove keyframes for custom expression
+                      for k in tgt_drv_fc.keyframe_points:
+                           tgt_drv_fc.keyframe_points.remove(k)
+                           
+                      tgt_drv_fc.update()
+                 else:
+                      # Standard Auto Logic
+                      copy_driver_to_fcurve(src_drv, tgt_drv_fc, final_invert)
+            
+            # Fixup Variable Targets - GUIDED SAFETY CHECK
+            # We iterate variables and check if they are still pointing to the SOURCE bone.
+            # If so, we attempt to flip them.
+            # This catches cases where upstream logic failed (e.g. reload issues) but avoids double-flipping valid changes.
+            
+            try:
+                # Iterate Target Variables
+                for i, var in enumerate(tgt_drv_fc.driver.variables):
+                    for j, tgt in enumerate(var.targets):
+                        if not (hasattr(tgt, "bone_target") and tgt.bone_target):
+                            continue
+                            
+                        # Get Source Equivalent for Comparison
+                        # (Assumes 1:1 mapping preserved from copy)
+                        src_bone_target = None
+                        if i < len(src_drv.driver.variables):
+                            s_var = src_drv.driver.variables[i]
+                            if j < len(s_var.targets):
+                                src_bone_target = s_var.targets[j].bone_target
+                        
+                        # CRITICAL GUARD: Only flip if Target == Source (Unchanged)
+                        # This prevents double-flipping if upstream already worked.
+                        if src_bone_target and tgt.bone_target == src_bone_target:
+                            log_debug(f"[DEBUG] Detected Unflipped Target '{tgt.bone_target}'. Attempting Force Flip...")
+                            
+                            flipped_bone = flip_bone_name(tgt.id, tgt.bone_target)
+                            
+                            if flipped_bone and flipped_bone != tgt.bone_target:
+                                 tgt.bone_target = flipped_bone
+                                 log_debug(f"[DEBUG] Force Flip Success: -> {tgt.bone_target}")
+                        
+            except Exception as e:
+                print(f"[ERROR] Safety Check Exception: {e}")
+        
+        return 'UPDATED' if existed else 'CREATED'
+
+
+class BSETUP_OT_MirrorPoseDriver(SDKMirrorMixin, bpy.types.Operator):
+    """Mirror drivers from selected bones to their symmetrical counterparts"""
+    bl_idname = "bsetup.mirror_pose_driver"
+    bl_label = "Mirror Pose Driver"
+    bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
         props = context.scene.maya_shape_keys
@@ -45,421 +413,30 @@ class BSETUP_OT_MirrorPoseDriver(bpy.types.Operator):
              
         count = 0
         
+        # One L<->R map per armature, shared by all selected bones
+        mirror_maps = {}
+        
         for pb in selected_bones:
+            armature = pb.id_data
+            if armature.name not in mirror_maps:
+                mirror_maps[armature.name] = rig_mirror_map(armature)
+            bone_map, _, action_map = mirror_maps[armature.name]
+            
             # 1. Find Mirror Bone
-            mirror_name = flip_name(pb.name)
+            mirror_name = bone_map.partner(pb.name)
             if not mirror_name:
                  continue 
-                 
-            armature = pb.id_data
-            if mirror_name not in armature.pose.bones:
-                 continue
             
             mirror_pb = armature.pose.bones[mirror_name]
                  
             # 2. Iterate Constraints on Source
             for const in pb.constraints:
                 if const.type == 'ACTION' and const.name.startswith("SDK_"):
-                    # Found a driver constraint
-                    src_action = const.action
-                    if not src_action: continue
-                    
-                    # 3. Determine Constraint Target Info
-                    target_obj = const.target
-                    target_bone_name = const.subtarget
-                    
-                    # Flip target bone
-                    if target_bone_name:
-                        target_bone_name = flip_name(target_bone_name) or target_bone_name
-                    
-                    # Flip target object (rare)
-                    if target_obj and flip_name(target_obj.name) and flip_name(target_obj.name) in bpy.data.objects:
-                        target_obj = bpy.data.objects[flip_name(target_obj.name)]
-                        
-                    # 4. Create/Get Target Constraint
-                    new_const_name = flip_name(const.name)
-                    if not new_const_name: new_const_name = const.name
-                    
-                    tgt_const = mirror_pb.constraints.get(new_const_name)
-                    if tgt_const:
-                        # Force remove to ensure clean state (Fixes assignment bugs)
-                        mirror_pb.constraints.remove(tgt_const)
-                        
-                    tgt_const = mirror_pb.constraints.new('ACTION')
-                    tgt_const.name = new_const_name
-                        
-                    # Copy Settings
-                    tgt_const.target = target_obj
-                    tgt_const.subtarget = target_bone_name
-                    tgt_const.min = const.min
-                    tgt_const.max = const.max
-                    tgt_const.frame_start = const.frame_start
-                    tgt_const.frame_end = const.frame_end
-                    tgt_const.transform_channel = const.transform_channel
-                    tgt_const.target_space = const.target_space
-                    tgt_const.mix_mode = const.mix_mode # Important: Copy AFTER/ADD
-                    
-                    # Copy Evaluation Time Settings (Critical for this setup)
-                    if hasattr(const, "use_eval_time"):
-                        tgt_const.use_eval_time = const.use_eval_time
-                        tgt_const.eval_time = const.eval_time
-                        
-                        # SAFETY: If we detect an influence driver on source, we almost certainly want this ON
-                        # because that's how this addon works (Fixed Action Time, Driven Influence)
-                        # We don't check for driver here, but we can assume if use_eval_time is True, it's True.
-                        if const.use_eval_time:
-                             tgt_const.use_eval_time = True # Force set explicit
-                    
-                    # 5. Mirror Action
-                    # Ensure name is FLIPPED.
-                    new_action_name = flip_name(src_action.name)
-                    
-                    if not new_action_name: 
-                         # Try manual replacement if flip failed (e.g. name didn't have L/R but bone did?)
-                         new_action_name = src_action.name.replace(pb.name, mirror_name)
-                    
-                    # SAFETY: If name is still same (e.g. "MyAction" -> "MyAction"), we get a collision.
-                    if new_action_name == src_action.name:
-                        new_action_name = f"{src_action.name}_Mirrored"
-                    
-                    # 5b. COPY SOURCE ACTION (Preserves metadata/groups)
-                    if new_action_name in bpy.data.actions:
-                        # If exists, we should probably start fresh to ensure clean state? 
-                        # Or update it? For mirroring, we usually want to Overwrite.
-                        # Easiest way: Remove old, copy new.
-                        bpy.data.actions.remove(bpy.data.actions[new_action_name])
-                    
-                    tgt_action = src_action.copy()
-                    tgt_action.name = new_action_name
-                    tgt_action.use_fake_user = True
-                    
-                    # Robust Action Assignment
-                    if hasattr(tgt_const, "use_bone_object_action"):
-                        tgt_const.use_bone_object_action = False
-                    
-                    print(f"[DEBUG] Assigning Action '{tgt_action.name}' to Constraint '{tgt_const.name}' on '{mirror_pb.name}'")
-                    tgt_const.action = tgt_action
-                    
-                    # Workaround if direct assignment failed (sometimes happens in 4.0+)
-                    if tgt_const.action != tgt_action:
-                        print(f"[WARNING] Direct assignment failed. Attempting Context Override Workaround...")
-                        try:
-                            # Preferred method for Blender 3.2+
-                            if hasattr(context, "temp_override"):
-                                with context.temp_override(active_object=armature, object=armature):
-                                    bpy.ops.object.mode_set(mode='POSE')
-                                    bpy.ops.pose.select_all(action='DESELECT')
-                                    mirror_pb.bone.select = True
-                                    armature.data.bones.active = mirror_pb.bone
-                                    tgt_const.action = tgt_action
-                        except Exception as e:
-                            print(f"[ERROR] Assignment Workaround Exception: {e}")
-                            
-                    # FINAL CHECK
-                    if tgt_const.action != tgt_action:
-                         self.report({'ERROR'}, f"Failed to assign Action '{tgt_action.name}' to mirrored bone '{mirror_pb.name}'")
-                    else:
-                         print(f"[SUCCESS] Action assigned successfully.")
-                         
-                         # --- APPLY PROPERTIES AFTER ACTION ASSIGNMENT (Fixes Reset/Override Issues) ---
-                         try:
-                             tgt_const.target = target_obj
-                             tgt_const.subtarget = target_bone_name
-                             tgt_const.min = const.min
-                             tgt_const.max = const.max
-                             tgt_const.frame_start = const.frame_start
-                             tgt_const.frame_end = const.frame_end
-                             tgt_const.transform_channel = const.transform_channel
-                             tgt_const.target_space = const.target_space
-                             tgt_const.mix_mode = const.mix_mode
-                             
-                             if hasattr(const, "use_eval_time"):
-                                 tgt_const.use_eval_time = const.use_eval_time
-                                 tgt_const.eval_time = const.eval_time
-                         except Exception as e:
-                             print(f"[WARNING] property sync error: {e}")
-
-
-
-
-                    
-                    # 6. MODIFY KEYS IN PLACE (Since we copied)
-                    
-                    # We need to iterate curves and FLIP PATHS and VALUES
-                    # NOTE: Modifying data_path while iterating might be risky if we rely on it?
-                    # FCurves are list.
-                    
-                    for fc in tgt_action.fcurves:
-                        # Path: pose.bones["Bone.L"].location
-                        # We need to construct path for Mirror Bone: pose.bones["Bone.R"].location
-                        
-                        original_path = fc.data_path
-                        new_path = original_path.replace(pb.name, mirror_name)
-                        
-                        # Apply new path
-                        fc.data_path = new_path
-                        
-                        # Update Group name if it matches bone name
-                        if fc.group and fc.group.name == pb.name:
-                             # We can't rename group easily if it's shared? 
-                             # But in a mirrored action, the group SHOULD be the mirror bone.
-                             # Check if group exists?
-                             pass # Blender handles groups loosely.
-                             # Better: Set group explicitly
-                             # fc.group = tgt_action.groups.new(mirror_pb.name) # Might fail if exists.
-                             # Usually we don't need to stress groups for functionality.
-                        
-                        # Flip Logic for Values
-                        flip_mult = 1.0
-                        
-                        if self.mirror_axis_values:
-                             if "location" in new_path and fc.array_index == 0: flip_mult = -1.0
-                             if "rotation_euler" in new_path and fc.array_index in {1,2}: flip_mult = -1.0
-                             
-                             # Quaternion Flipping for X-Mirror
-                             # Quaternions are (W, X, Y, Z). 
-                             # Standard X-Mirror usually flips Y and Z components (i.e. 180 deg rot around X).
-                             # W (0) -> Keep
-                             # X (1) -> Keep
-                             # Y (2) -> Flip
-                             # Z (3) -> Flip
-                             if "rotation_quaternion" in new_path and fc.array_index in {2,3}: flip_mult = -1.0
-                             
-                             # Axis Angle (W, X, Y, Z) - W is Angle. XYZ is Axis.
-                             # Flip Y and Z of Axis.
-                             if "rotation_axis_angle" in new_path and fc.array_index in {2,3}: flip_mult = -1.0
-                        
-                        if flip_mult != 1.0:
-                             for kp in fc.keyframe_points:
-                                  kp.co[1] *= flip_mult
-                                  kp.handle_left[1] *= flip_mult
-                                  kp.handle_right[1] *= flip_mult
-                             
-                    # 7. Mirror Influence Driver
-                    # The source constraint has a driver on "influence"
-                    # We need to copy it to tgt_const
-                    
-                    src_drv = None
-                    # Find driver on source constraint
-                    # Constraints drivers are on the Object/Bone ID_Data?
-                    # No, usually on the Object/Armature data block or Object block?
-                    # Armature -> pose.bones["Bone"].constraints["Name"].influence
-                    
-                    # We need to find the fcurve
-                    anim_data = armature.animation_data
-                    if anim_data and anim_data.drivers:
-                        path_check = f'pose.bones["{pb.name}"].constraints["{const.name}"].influence'
-                        for fc in anim_data.drivers:
-                             if fc.data_path == path_check:
-                                 src_drv = fc
-                                 break
-                    
-                    if src_drv:
-                        # Drive proper target path
-                        tgt_path = f'pose.bones["{mirror_pb.name}"].constraints["{tgt_const.name}"].influence'
-                        
-                        # Remove existing
-                        try: armature.driver_remove(tgt_path)
-                        except: pass
-                        
-                        tgt_drv_fc = armature.driver_add(tgt_path)
-                        
-                        # Auto-Detect Inversion Logic
-                        # If the driver relies on LOC_X, ROT_Y, ROT_Z -> These flip signs in mirror.
-                        # We must invert the driver curve inputs.
-                        auto_invert = False
-                        if src_drv.driver.type == 'SCRIPTED' or src_drv.driver.type == 'AVERAGE':
-                             for v in src_drv.driver.variables:
-                                 if v.type == 'TRANSFORMS':
-                                     # Check transform type
-                                     tt = v.targets[0].transform_type
-                                     if tt in {'LOC_X', 'ROT_Y', 'ROT_Z', 'ROT_W'}: # Quats are complex but often flip W or specific axes
-                                          # Note: Rot Y/Z in Euler flips.
-                                          auto_invert = True
-                                          break
-                        
-                        final_invert = self.invert_driver or auto_invert
-                        if auto_invert:
-                             print(f"[DEBUG] Auto-Inverting Driver Curve for {mirror_pb.name} (Detected {tt})")
-                        
-                        # Copy logic
-                        # If the user provided a custom expression, we apply it AFTER copying
-
-                        
-                        # --- MIRROR LOGIC UPDATE for Expression-based Drivers (e.g. Scale) ---
-                        # If the source driver has NO keyframes (because it uses pure expression),
-                        # copy_driver_to_fcurve might not work perfectly or we need special handling.
-                        
-                        is_expression_only = len(src_drv.keyframe_points) == 0
-                        
-                        if is_expression_only:
-                            print(f"[DEBUG] Mirroring Expression-Only Driver (Scale Fix?)")
-                            
-                            # 1. Copy Driver Properties Manually
-                            tgt_drv_fc.driver.type = src_drv.driver.type
-                            tgt_drv_fc.driver.expression = src_drv.driver.expression
-                            
-                            # 2. Recreate Variables
-                            for src_var in src_drv.driver.variables:
-                                new_var = tgt_drv_fc.driver.variables.new()
-                                new_var.name = src_var.name
-                                new_var.type = src_var.type
-                                
-                                # Copy Targets
-                                for i, src_tgt in enumerate(src_var.targets):
-                                    tgt = new_var.targets[i]
-                                    tgt.id = src_tgt.id # Start with same ID
-                                    
-                                    # Handle ID Flipping (Object)
-                                    if src_tgt.id and hasattr(src_tgt.id, "name"):
-                                        flipped_id_name = flip_name(src_tgt.id.name)
-                                        if flipped_id_name and flipped_id_name in bpy.data.objects:
-                                             tgt.id = bpy.data.objects[flipped_id_name]
-                                    
-                                    # Handle TRANSFORMS
-                                    if src_var.type == 'TRANSFORMS':
-                                        tgt.transform_type = src_tgt.transform_type
-                                        tgt.transform_space = src_tgt.transform_space
-                                        
-                                        # FLIP BONE TARGET
-                                        if src_tgt.bone_target:
-                                            # Try logic flip
-                                            flipped_bone = flip_name(src_tgt.bone_target)
-                                            print(f"[DEBUG] Flipping Var Target: '{src_tgt.bone_target}' -> '{flipped_bone}'")
-                                            
-                                            if flipped_bone:
-                                                 tgt.bone_target = flipped_bone
-                                                 print(f"[DEBUG] SUCCESS: Flipped Bone Target to '{tgt.bone_target}'")
-                                            else:
-                                                 # Fallback: Try simple replace if flip_name failed
-                                                 bt = src_tgt.bone_target
-                                                 print(f"[DEBUG] FAIL: flip_name returned None for '{bt}'. Trying Fallback...")
-                                                 
-                                                 # New Logic: Try standard replacements without regex overkill first
-                                                 if ".L" in bt: tgt.bone_target = bt.replace(".L", ".R")
-                                                 elif ".R" in bt: tgt.bone_target = bt.replace(".R", ".L")
-                                                 elif "_L" in bt: tgt.bone_target = bt.replace("_L", "_R")
-                                                 elif "_R" in bt: tgt.bone_target = bt.replace("_R", "_L")
-                                                 else:
-                                                     # Try Regex for cases like Bone_L.001
-                                                     import re
-                                                     if re.search(r'(_[Ll])\.', bt):
-                                                         tgt.bone_target = re.sub(r'(_[Ll])\.', lambda m: m.group(1).replace('l', 'r').replace('L', 'R') + ".", bt)
-                                                     elif re.search(r'(\.[Ll])\.', bt):
-                                                         tgt.bone_target = re.sub(r'(\.[Ll])\.', lambda m: m.group(1).replace('l', 'r').replace('L', 'R') + ".", bt)
-                                                     else:
-                                                         tgt.bone_target = src_tgt.bone_target
-                                                         print(f"[WARNING] Could not flip bone target '{src_tgt.bone_target}'")
-                                                 
-                                                 print(f"[DEBUG] Fallback Result: '{tgt.bone_target}'")
-                                    else:
-                                        # Single Prop
-                                        tgt.data_path = src_tgt.data_path
-                                        # Try flipping path (e.g. pose.bones["Bone.L"])
-                                        # This is complex but usually handled by flip_name if simple string
-                                        pass
-
-                            # 3. Apply Expression
-                            # Handle Auto-Invert (e.g. Loc X needs to be flipped)
-                            # Expression is typically: clamp((var - Rest) / Denom, ...)
-                            if auto_invert:
-                                 # We wrap 'var' with '(-var)'
-                                 # This is a safe heuristic for our specific generated expressions.
-                                 if "var" in tgt_drv_fc.driver.expression:
-                                      tgt_drv_fc.driver.expression = tgt_drv_fc.driver.expression.replace("var", "(-var)")
-                                      print(f"[DEBUG] Inverted Expression var: {tgt_drv_fc.driver.expression}")
-                            
-                            tgt_drv_fc.update()
-                            
-                        else:
-                             # Standard Keyframe-based Copy
-                             if self.driver_expression != "var" or self.use_scale_fix:
-                                  # We copy first to get variables, then override expression
-                                  copy_driver_to_fcurve(src_drv, tgt_drv_fc, False)
-                                  tgt_drv_fc.driver.type = 'SCRIPTED'
-                                  
-                                  # Expression Logic
-                                  final_expr = self.driver_expression
-                                  
-                                  # Auto-Override if Scale Fix is requested
-                                  if self.use_scale_fix:
-                                      final_expr = "clamp((var - 1) / (<TARGET> - 1), 0, 1)"
-                                  
-                                  # Token Substitution: <TARGET>
-                                  target_val = 1.0
-                                  if len(src_drv.keyframe_points) >= 2:
-                                      target_val = src_drv.keyframe_points[1].co[0]
-                                  
-                                  if "<TARGET>" in final_expr:
-                                      final_expr = final_expr.replace("<TARGET>", f"{target_val:.4f}")
-                                      
-                                  tgt_drv_fc.driver.expression = final_expr
-                                  
-                                  # Remove keyframes for custom expression
-                                  for k in tgt_drv_fc.keyframe_points:
-                                       tgt_drv_fc.keyframe_points.remove(k)
-                                       
-                                  tgt_drv_fc.update()
-                             else:
-                                  # Standard Auto Logic
-                                  copy_driver_to_fcurve(src_drv, tgt_drv_fc, final_invert)
-                        
-                        # Fixup Variable Targets - GUIDED SAFETY CHECK
-                        # We iterate variables and check if they are still pointing to the SOURCE bone.
-                        # If so, we attempt to flip them.
-                        # This catches cases where upstream logic failed (e.g. reload issues) but avoids double-flipping valid changes.
-                        
-                        try:
-                            # Iterate Target Variables
-                            for i, var in enumerate(tgt_drv_fc.driver.variables):
-                                for j, tgt in enumerate(var.targets):
-                                    if not (hasattr(tgt, "bone_target") and tgt.bone_target):
-                                        continue
-                                        
-                                    # Get Source Equivalent for Comparison
-                                    # (Assumes 1:1 mapping preserved from copy)
-                                    src_bone_target = None
-                                    if i < len(src_drv.driver.variables):
-                                        s_var = src_drv.driver.variables[i]
-                                        if j < len(s_var.targets):
-                                            src_bone_target = s_var.targets[j].bone_target
-                                    
-                                    # CRITICAL GUARD: Only flip if Target == Source (Unchanged)
-                                    # This prevents double-flipping if upstream already worked.
-                                    if src_bone_target and tgt.bone_target == src_bone_target:
-                                        print(f"[DEBUG] Detected Unflipped Target '{tgt.bone_target}'. Attempting Force Flip...")
-                                        
-                                        flipped_bone = flip_name(tgt.bone_target)
-                                        
-                                        # Fallback Manual
-                                        if not flipped_bone or flipped_bone == tgt.bone_target:
-                                             import re
-                                             bt = tgt.bone_target
-                                             if ".L" in bt: flipped_bone = bt.replace(".L", ".R")
-                                             elif ".R" in bt: flipped_bone = bt.replace(".R", ".L")
-                                             elif "_L" in bt: flipped_bone = bt.replace("_L", "_R")
-                                             elif "_R" in bt: flipped_bone = bt.replace("_R", "_L")
-                                             else:
-                                                 if re.search(r'(_[Ll])\.', bt):
-                                                     flipped_bone = re.sub(r'(_[Ll])\.', lambda m: m.group(1).replace('l', 'r').replace('L', 'R') + ".", bt)
-                                                 elif re.search(r'(\.[Ll])\.', bt):
-                                                     flipped_bone = re.sub(r'(\.[Ll])\.', lambda m: m.group(1).replace('l', 'r').replace('L', 'R') + ".", bt)
-                                        
-                                        if flipped_bone and flipped_bone != tgt.bone_target:
-                                             tgt.bone_target = flipped_bone
-                                             print(f"[DEBUG] Force Flip Success: -> {tgt.bone_target}")
-                                    
-                        except Exception as e:
-                            print(f"[ERROR] Safety Check Exception: {e}")
-                        
+                    if self.mirror_sdk_constraint(context, armature, pb, mirror_pb, const, action_map):
                         count += 1
          
         # Force updates to ensure UI and Depsgraph catch up
-        if selected_bones:
-            id_data = selected_bones[0].id_data
-            if id_data: id_data.update_tag()
-            
-        context.view_layer.update()
+        request_update(context, selected_bones[0].id_data if selected_bones else None)
         
         self.report({'INFO'}, f"Mirrored {count} SDK Actions")
         return {'FINISHED'}
@@ -637,3 +614,283 @@ class BSETUP_OT_SelectDrivenBones(bpy.types.Operator):
             self.report({'WARNING'}, f"No bones found with action '{self.target_name}'")
             
         return {'FINISHED'}
+
+
+class BSETUP_OT_ConvertInfluenceMode(bpy.types.Operator):
+    """Convert existing SDK influence drivers between Expression and F-Curve mapping"""
+    bl_idname = "bsetup.convert_influence_mode"
+    bl_label = "Convert Influence Drivers"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('EXPRESSION', "Expression", "Scripted clamp() expression"),
+            ('FCURVE', "F-Curve", "Average driver with clamped linear F-Curve"),
+        ],
+        default='FCURVE'
+    )
+    
+    only_active: bpy.props.BoolProperty(
+        name="Active Armature Only",
+        description="Only convert drivers on the active armature (otherwise all armatures in the file)",
+        default=True
+    )
+    
+    def execute(self, context):
+        active = context.active_object
+        
+        converted = 0
+        skipped = 0
+        
+        for owner, fc, kind in list(iter_sdk_drivers()):
+            if kind != 'INFLUENCE':
+                continue
+            if self.only_active and owner != active:
+                continue
+                
+            mapping = read_influence_mapping(fc)
+            if mapping is None:
+                # Custom expressions (e.g. mirror overrides) are left untouched
+                skipped += 1
+                continue
+                
+            rest, target = mapping
+            set_influence_mapping(fc, rest, target, self.mode)
+            converted += 1
+            
+        request_update(context, active)
+        
+        self.report({'INFO'}, f"Converted {converted} Influence Drivers to {self.mode} ({skipped} custom skipped)")
+        return {'FINISHED'}
+
+
+# --- SDK STACK COMPILATION ---
+# A compiled bone keeps its SDK constraints (muted) so the stack can be restored.
+COMPILED_PROP = "_SDK_COMPILED"
+COMPILED_CHANNELS_PROP = "_SDK_COMPILED_CHANNELS"
+WEIGHT_PREFIX = "_SDK_W"
+COMPILABLE_PATHS = {"location", "rotation_euler", "scale"}
+MAX_EXPRESSION_LEN = 255
+
+def _constraint_driver(armature, pb, const, prop="influence"):
+    """Find the driver F-Curve on a bone constraint property"""
+    if not armature.animation_data:
+        return None
+    return armature.animation_data.drivers.find(f'pose.bones["{pb.name}"].constraints["{const.name}"].{prop}')
+
+def _sdk_pose_deltas(const):
+    """Return {(path, index): delta} of a constant-pose SDK action, or None if not compilable"""
+    deltas = {}
+    for fc in const.action.fcurves:
+        path = fc.data_path.rsplit(".", 1)[-1]
+        if path not in COMPILABLE_PATHS:
+            return None
+        rest = fc.evaluate(const.frame_start)
+        pose = fc.evaluate(const.frame_end)
+        if abs(pose - rest) > 1e-6:
+            deltas[path, fc.array_index] = pose - rest
+    return deltas
+
+
+def _stack_inexact_reason(pb, sdks, terms):
+    """Why summed channel drivers would not reproduce the constraint stack, or None if they are exact.
+
+    Each SDK multiplies the bone matrix (mix mode After Original). Sums of channel deltas only
+    match that product when the base transform is identity rotation / unit scale, nothing else
+    sits in the stack, and the deltas commute: one SDK, or several SDKs that all move location,
+    or all rotate about the same Euler axis.
+    """
+    others = [c for c in pb.constraints if not c.mute and not any(c == sdk for sdk in sdks)]
+    if others:
+        return f"other constraints in the stack ('{others[0].name}')"
+    if any(c.mix_mode != 'AFTER' for c in sdks):
+        return "SDK mix mode is not After Original"
+    
+    if pb.rotation_mode == 'QUATERNION':
+        identity = abs(pb.rotation_quaternion[0] - 1.0) < 1e-6 and all(abs(v) < 1e-6 for v in pb.rotation_quaternion[1:])
+    elif pb.rotation_mode == 'AXIS_ANGLE':
+        identity = abs(pb.rotation_axis_angle[0]) < 1e-6
+    else:
+        identity = all(abs(v) < 1e-6 for v in pb.rotation_euler)
+    if not identity or any(abs(v - 1.0) > 1e-6 for v in pb.scale):
+        return "base rotation/scale is not identity"
+    
+    rotation_axes = {idx for path, idx in terms if path == "rotation_euler"}
+    if rotation_axes and pb.rotation_mode in {'QUATERNION', 'AXIS_ANGLE'}:
+        return "bone does not use Euler rotation"
+    if len(rotation_axes) > 1:
+        return "rotation on more than one axis"
+    if any(abs(d) >= math.pi for (path, _), items in terms.items() if path == "rotation_euler" for d, _ in items):
+        return "rotation of 180 degrees or more"
+    if len(sdks) > 1 and len({path for path, _ in terms}) > 1:
+        return "SDKs mix location, rotation and scale (they compose, not add)"
+    if len({i for (path, _), items in terms.items() if path == "scale" for _, i in items}) > 1:
+        return "several scale SDKs (they multiply, not add)"
+    return None
+
+
+class BSETUP_OT_CompilePoseStack(bpy.types.Operator):
+    """Fold the SDK Action constraints of selected bones into summed drivers on their Loc/Rot/Scale channels (only where the sum is exact)"""
+    bl_idname = "bsetup.compile_pose_stack"
+    bl_label = "Compile SDK Stack"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        selected_bones = context.selected_pose_bones
+        if not selected_bones:
+             self.report({'WARNING'}, "No bones selected")
+             return {'CANCELLED'}
+             
+        compiled = 0
+        skipped = []
+        
+        for pb in selected_bones:
+            armature = pb.id_data
+            if COMPILED_PROP in pb:
+                continue
+                
+            # Only fixed-time (influence driven) SDKs hold a constant pose
+            sdks = [c for c in pb.constraints
+                    if c.type == 'ACTION' and c.name.startswith("SDK") and c.action and not c.mute
+                    and c.use_eval_time and not _constraint_driver(armature, pb, c, "eval_time")]
+            if not sdks:
+                continue
+                
+            # 1. Gather per-channel terms (delta * weight)
+            terms = {} # (path, index) -> [(delta, weight_index)]
+            valid = True
+            for i, const in enumerate(sdks):
+                deltas = _sdk_pose_deltas(const)
+                if deltas is None:
+                    valid = False
+                    break
+                for key, delta in deltas.items():
+                    terms.setdefault(key, []).append((delta, i))
+                    
+            if not valid:
+                skipped.append(f"{pb.name} (quaternion/other channels)")
+                continue
+            
+            # Channel sums must reproduce the matrix stack exactly, otherwise the rig would deform differently
+            reason = _stack_inexact_reason(pb, sdks, terms)
+            if reason:
+                skipped.append(f"{pb.name} ({reason})")
+                continue
+                
+            # 2. Build expressions first so a failure leaves the bone untouched
+            anim = armature.animation_data
+            expressions = {}
+            reason = None
+            for (path, idx), items in terms.items():
+                channel = f'pose.bones["{pb.name}"].{path}'
+                if anim and anim.drivers.find(channel, index=idx):
+                    reason = f"{path}[{idx}] already driven"
+                    break
+                if anim and anim.action and anim.action.fcurves.find(channel, index=idx):
+                    reason = f"{path}[{idx}] has keyframes the driver would override"
+                    break
+                base = getattr(pb, path)[idx]
+                expr = f"{base:.6g} + " + " + ".join(f"{d:.6g}*w{i}" for d, i in items)
+                if len(expr) > MAX_EXPRESSION_LEN:
+                    reason = "too many SDKs for one expression"
+                    break
+                expressions[path, idx] = (expr, {i for _, i in items})
+                
+            if reason:
+                skipped.append(f"{pb.name} ({reason})")
+                continue
+                
+            # 3. Weight properties: duplicate influence drivers onto bone custom props
+            for i, const in enumerate(sdks):
+                prop_name = f"{WEIGHT_PREFIX}{i}"
+                pb[prop_name] = const.influence
+                src_fc = _constraint_driver(armature, pb, const)
+                if src_fc:
+                    w_fc = pb.driver_add(f'["{prop_name}"]')
+                    for mod in list(w_fc.modifiers):
+                        w_fc.modifiers.remove(mod)
+                    copy_driver_to_fcurve(src_fc, w_fc, False, mirror_targets=False)
+                    src_fc.mute = True
+                const.mute = True
+                
+            # 4. Channel drivers
+            channels = []
+            for (path, idx), (expr, used) in expressions.items():
+                fc = pb.driver_add(path, idx)
+                for mod in list(fc.modifiers):
+                    fc.modifiers.remove(mod)
+                drv = fc.driver
+                drv.type = 'SCRIPTED'
+                for i in sorted(used):
+                    var = drv.variables.new()
+                    var.name = f"w{i}"
+                    var.type = 'SINGLE_PROP'
+                    var.targets[0].id = armature
+                    var.targets[0].data_path = f'pose.bones["{pb.name}"]["{WEIGHT_PREFIX}{i}"]'
+                drv.expression = expr
+                channels.append(f"{path}:{idx}:{getattr(pb, path)[idx]!r}")
+                
+            pb[COMPILED_PROP] = [c.name for c in sdks]
+            pb[COMPILED_CHANNELS_PROP] = channels
+            compiled += 1
+            
+        for name in skipped:
+            print(f"[MayaShapeKeys] Compile skipped: {name}")
+            
+        request_update(context, *{pb.id_data for pb in selected_bones})
+        
+        if skipped:
+            self.report({'WARNING'}, f"Compiled {compiled} bones, skipped {len(skipped)}. See console.")
+        else:
+            self.report({'INFO'}, f"Compiled {compiled} bones")
+        return {'FINISHED'}
+
+
+class BSETUP_OT_DecompilePoseStack(bpy.types.Operator):
+    """Restore the editable SDK Action constraint stack of compiled bones"""
+    bl_idname = "bsetup.decompile_pose_stack"
+    bl_label = "Decompile SDK Stack"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        selected_bones = context.selected_pose_bones
+        if not selected_bones:
+             self.report({'WARNING'}, "No bones selected")
+             return {'CANCELLED'}
+             
+        count = 0
+        for pb in selected_bones:
+            if COMPILED_PROP not in pb:
+                continue
+            armature = pb.id_data
+            
+            # 1. Remove channel drivers and restore base values
+            for entry in pb.get(COMPILED_CHANNELS_PROP, []):
+                path, idx, base = entry.split(":")
+                pb.driver_remove(path, int(idx))
+                getattr(pb, path)[int(idx)] = float(base)
+                
+            # 2. Unmute constraints and their influence drivers
+            for i, name in enumerate(pb[COMPILED_PROP]):
+                prop_name = f"{WEIGHT_PREFIX}{i}"
+                pb.driver_remove(f'["{prop_name}"]')
+                if prop_name in pb:
+                    del pb[prop_name]
+                    
+                const = pb.constraints.get(name)
+                if not const:
+                    continue
+                const.mute = False
+                src_fc = _constraint_driver(armature, pb, const)
+                if src_fc:
+                    src_fc.mute = False
+                    
+            del pb[COMPILED_PROP]
+            if COMPILED_CHANNELS_PROP in pb:
+                del pb[COMPILED_CHANNELS_PROP]
+            count += 1
+            
+        request_update(context, *{pb.id_data for pb in selected_bones})
+        self.report({'INFO'}, f"Decompiled {count} bones")
+        return {'FINISHED'}
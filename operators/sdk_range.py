@@ -0,0 +1,40 @@
+import math
+
+# Driver value -> action frame mappings of multi-key SDKs.
+# No bpy import here so the math can be checked outside of Blender.
+#
+# A mapping is (scale, offset) with frame = value * scale + offset. New SDKs use the
+# identity frames (offset 0), but mirrored SDKs do not: their keys are reflected about
+# frame_start + frame_end (offset != 0) or their eval_time curve was inverted (scale < 0).
+# Frames are therefore always derived from the range the constraint actually has.
+
+
+def range_mapping(value_start, value_end, frame_start, frame_end):
+    """Mapping sending value_start -> frame_start and value_end -> frame_end, or None for an empty value range"""
+    if abs(value_end - value_start) < 1e-9:
+        return None
+    scale = (frame_end - frame_start) / (value_end - value_start)
+    return scale, frame_start - value_start * scale
+
+
+def value_to_frame(mapping, value):
+    scale, offset = mapping
+    return value * scale + offset
+
+
+def frame_to_value(mapping, frame):
+    scale, offset = mapping
+    return (frame - offset) / scale
+
+
+def fit_frame_range(mapping, frames):
+    """(frame_start, frame_end, value_start, value_end) of an integer frame range around 'frames'.
+
+    The values are the driver values at the range ends under the same mapping, so refitting
+    keeps the sign and direction of the range (value_start > value_end for inverted SDKs).
+    """
+    start = math.floor(min(frames))
+    end = math.ceil(max(frames))
+    if end <= start:
+        end = start + 1
+    return start, end, frame_to_value(mapping, start), frame_to_value(mapping, end)
@@ -0,0 +1,240 @@
+import hashlib
+import numpy as np
+
+# Pure NumPy shape key math on (V, 3) coordinate arrays.
+# No bpy import here so the math can be checked outside of Blender.
+
+
+def mirror_shape_coords(basis, source, sym_map, axis=0):
+    """Mirror a shape across 'axis' using a vertex symmetry map.
+
+    Each vertex takes the offset (from the basis) of its mirror vertex with the axis
+    component negated. Vertices without a partner (-1) keep their source position.
+    """
+    matched = sym_map >= 0
+    gather = np.where(matched, sym_map, np.arange(len(sym_map)))
+
+    delta = source[gather] - basis[gather]
+    delta[:, axis] *= -1.0
+
+    out = basis + delta
+    out[~matched] = source[~matched]
+    return out
+
+
+def mirror_shape_coords_partial(basis, source, target, sym_map, changed, axis=0):
+    """Update 'target' in place for the source vertices in 'changed' (index array) only.
+
+    Gives the same result as mirror_shape_coords for those vertices' mirror partners.
+    """
+    partners = sym_map[changed]
+    matched = partners >= 0
+
+    src_idx = changed[matched]
+    delta = source[src_idx] - basis[src_idx]
+    delta[:, axis] *= -1.0
+    target[partners[matched]] = basis[partners[matched]] + delta
+
+    unmatched = changed[~matched]
+    target[unmatched] = source[unmatched]
+    return target
+
+
+def topology_marker_coords(vertex_count):
+    """(V, 3) marker coordinates for Blender's topology mirror: vertex index in Y, +1 in X"""
+    co = np.zeros((vertex_count, 3), dtype=np.float32)
+    co[:, 0] = 1.0
+    co[:, 1] = np.arange(vertex_count)
+    return co
+
+
+def topology_sym_map(mirrored):
+    """Symmetry map from marker coordinates after the topology mirror ran on them.
+
+    Matched and center vertices come back with X negated and their partner's index in Y.
+    Unmatched vertices are left untouched (X still +1) and get -1.
+    """
+    sym_map = np.rint(mirrored[:, 1]).astype(np.int32)
+    sym_map[mirrored[:, 0] > 0.0] = -1
+    return sym_map
+
+
+def changed_vertices(old, new, tolerance=0.0):
+    """Indices of vertices whose coordinates differ between two (V, 3) arrays"""
+    return np.flatnonzero(np.any(np.abs(new - old) > tolerance, axis=1))
+
+
+def split_weights(x, blend_width=0.0, curve='LINEAR'):
+    """Left side weight (0..1) per vertex from its X position; the Right side weight is 1 - w.
+
+    Within 'blend_width' around X = 0 the weight ramps from 0 to 1 ('LINEAR' or 'SMOOTHSTEP'),
+    so the two halves always add back up to the full shape without a seam.
+    """
+    if blend_width <= 0.0:
+        return np.where(x > 0.0, 1.0, np.where(x < 0.0, 0.0, 0.5)).astype(np.float32)
+
+    t = np.clip(x / blend_width + 0.5, 0.0, 1.0)
+    if curve == 'SMOOTHSTEP':
+        t = t * t * (3.0 - 2.0 * t)
+    return t.astype(np.float32)
+
+
+def axis_band_weights(coord, count, blend_width=0.0, curve='LINEAR'):
+    """(count, V) weights of 'count' equal bands along one axis, lowest coordinate first.
+
+    Band i is the difference of two ramps at its borders, so the bands always sum to 1.
+    """
+    lo, hi = float(coord.min()), float(coord.max())
+    borders = np.linspace(lo, hi, count + 1)[1:-1]
+
+    ramps = [np.ones(len(coord), dtype=np.float32)]
+    ramps += [split_weights(coord - b, blend_width, curve) for b in borders]
+    ramps.append(np.zeros(len(coord), dtype=np.float32))
+    return np.stack([ramps[i] - ramps[i + 1] for i in range(count)])
+
+
+def normalize_region_weights(weights):
+    """Scale (K, V) region weights so every vertex sums to 1 over the K regions.
+
+    Vertices outside every region are shared evenly, so the pieces always add back up to the
+    source shape. Returns (weights, number of such uncovered vertices).
+    """
+    weights = np.clip(np.asarray(weights, dtype=np.float32), 0.0, None)
+    total = weights.sum(axis=0)
+    uncovered = total <= 0.0
+
+    out = np.divide(weights, total, out=np.zeros_like(weights), where=~uncovered)
+    out[:, uncovered] = 1.0 / len(weights)
+    return out, int(uncovered.sum())
+
+
+def split_region_coords(basis, delta, weights):
+    """(K, V, 3) coordinates of K region keys: basis + delta scaled by each region's weights"""
+    return basis[None] + weights[:, :, None] * delta[None]
+
+
+def combo_mix(basis, deltas):
+    """Coordinates with every delta in 'deltas' (sequence of (V, 3)) fully applied"""
+    out = basis.copy()
+    for delta in deltas:
+        out += delta
+    return out
+
+
+def combo_residual(sculpted, basis, deltas):
+    """Offset of a sculpted combo that is not explained by its input (and lower-order combo) deltas"""
+    return sculpted - combo_mix(basis, deltas)
+
+
+def mix_shapes(basis, deltas, values, slider_min=None, slider_max=None):
+    """Mixed positions basis + sum_k value_k * deltas[k] from a (K, V, 3) delta array.
+
+    'values' is (K,) for one mix or (F, K) for F mixes at once (-> (F, V, 3)). Values are
+    clamped to the slider range when given. Only keys with a non-zero value take part in the
+    product, so sparse mixes (few active keys) stay cheap.
+    """
+    values = np.asarray(values, dtype=np.float32)
+    if slider_min is not None:
+        values = np.clip(values, slider_min, slider_max)
+
+    active = np.flatnonzero(np.any(values != 0.0, axis=0) if values.ndim == 2 else values)
+    if not len(active):
+        return np.broadcast_to(basis, values.shape[:-1] + basis.shape).copy()
+
+    flat = deltas[active].reshape(len(active), -1)
+    mixed = values[..., active] @ flat
+    return basis + mixed.reshape(values.shape[:-1] + basis.shape)
+
+
+# Bytes of one sparse entry: int32 vertex index + float32 (x, y, z) offset
+SPARSE_ENTRY_BYTES = 4 + 3 * 4
+
+
+def moved_mask(deltas, tolerance=1e-6):
+    """(..., V) bool: vertices whose offset length exceeds 'tolerance'"""
+    return np.sqrt((deltas * deltas).sum(axis=-1)) > tolerance
+
+
+def sparse_shape_stats(deltas, tolerance=1e-6):
+    """Per key of a (K, V, 3) delta array: moved vertex count, max displacement,
+    dense bytes (V * 3 floats) and sparse bytes (moved * SPARSE_ENTRY_BYTES)"""
+    lengths = np.sqrt((deltas * deltas).sum(axis=-1))
+    moved = (lengths > tolerance).sum(axis=1)
+    max_disp = lengths.max(axis=1, initial=0.0)
+    dense = np.full(len(deltas), deltas.shape[1] * 3 * 4, dtype=np.int64)
+    return moved, max_disp, dense, moved.astype(np.int64) * SPARSE_ENTRY_BYTES
+
+
+def pack_sparse_shapes(deltas, tolerance=1e-6):
+    """CSR style sparse form of a (K, V, 3) delta array: only moved vertices are kept.
+
+    Returns (offsets (K + 1,), indices (nnz,) int32, values (nnz, 3) float32); the entries of
+    key k are indices/values[offsets[k]:offsets[k + 1]].
+    """
+    moved = moved_mask(deltas, tolerance)
+    keys, verts = np.nonzero(moved)
+    offsets = np.zeros(len(deltas) + 1, dtype=np.int64)
+    np.cumsum(moved.sum(axis=1), out=offsets[1:])
+    return offsets, verts.astype(np.int32), deltas[keys, verts].astype(np.float32)
+
+
+def unpack_sparse_shapes(offsets, indices, values, vertex_count):
+    """Dense (K, V, 3) deltas from pack_sparse_shapes output"""
+    out = np.zeros((len(offsets) - 1, vertex_count, 3), dtype=np.float32)
+    rows = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    out[rows, indices] = values
+    return out
+
+
+def zero_noise(deltas, threshold):
+    """Zero per-vertex offsets shorter than 'threshold' (sculpting noise) in a (K, V, 3) array.
+
+    Returns (cleaned deltas, (K,) number of vertices zeroed per key that had an offset).
+    """
+    keep = moved_mask(deltas, threshold)
+    zeroed = (moved_mask(deltas, 0.0) & ~keep).sum(axis=1)
+    return deltas * keep[..., None], zeroed
+
+
+def find_duplicate_groups(deltas, tolerance=1e-5, candidates=None):
+    """Groups of near-identical keys: every vertex offset within 'tolerance' of the first key.
+
+    Keys are bucketed by a hash of their quantized deltas (exact duplicates in one step), the
+    bucket representatives are then compared by norm: keys whose delta norms differ by more than
+    tolerance * sqrt(V) cannot match, so only neighbours in norm order are checked vertex by vertex.
+    Returns lists of key indices, lowest index first. 'candidates' limits the keys considered.
+    """
+    keys = np.arange(len(deltas)) if candidates is None else np.asarray(candidates)
+    if not len(keys):
+        return []
+
+    # Same bucket -> every component within step, vertex distance within step * sqrt(3) < tolerance
+    step = tolerance / 2.0 if tolerance > 0.0 else 1e-9
+    buckets = {}
+    for k in keys:
+        digest = hashlib.blake2b(np.round(deltas[k] / step).astype(np.int64).tobytes(), digest_size=16).digest()
+        buckets.setdefault(digest, []).append(int(k))
+
+    groups = {members[0]: members for members in buckets.values()}
+    reps = np.array(sorted(groups))
+    norms = np.sqrt((deltas[reps] * deltas[reps]).sum(axis=(1, 2)))
+    order = np.argsort(norms, kind="stable")
+    window = tolerance * np.sqrt(deltas.shape[1])
+
+    merged = set()
+    for a, i in enumerate(order):
+        rep_i = int(reps[i])
+        if rep_i in merged:
+            continue
+        for j in order[a + 1:]:
+            if norms[j] - norms[i] > window:
+                break
+            rep_j = int(reps[j])
+            if rep_j in merged:
+                continue
+            diff = deltas[rep_i] - deltas[rep_j]
+            if np.sqrt((diff * diff).sum(axis=1)).max(initial=0.0) <= tolerance:
+                groups[rep_i].extend(groups.pop(rep_j))
+                merged.add(rep_j)
+
+    return sorted(sorted(g) for g in groups.values() if len(g) > 1)
@@ -0,0 +1,98 @@
+import numpy as np
+from .shape_math import mix_shapes
+from .utils import read_coords, vertex_group_weight_matrix
+
+# Depsgraph-free shape key evaluation.
+# All key deltas of a mesh are loaded once into a contiguous (K, V, 3) float32 array
+# (relative keys and vertex group masks applied), after which any mix of key values is a
+# single product. Index k of every array matches key_blocks[k]; the reference key has a
+# zero delta so values read straight from key_blocks line up. Only relative shape keys
+# (Key.use_relative) are supported.
+
+
+def read_key_coords(obj):
+    """All shape key coordinates of a mesh: ((K, V, 3) coords, (K,) relative key indices, reference index).
+
+    Every key is read once, relative keys are looked up in the same array.
+    """
+    key = obj.data.shape_keys
+    key_blocks = key.key_blocks
+    n = len(obj.data.vertices)
+
+    coords = np.empty((len(key_blocks), n, 3), dtype=np.float32)
+    for i, kb in enumerate(key_blocks):
+        coords[i] = read_coords(kb.data, n)
+    relative = np.array([key_blocks.find(kb.relative_key.name) for kb in key_blocks], dtype=np.int64)
+    return coords, relative, key_blocks.find(key.reference_key.name)
+
+
+def apply_vertex_groups(obj, deltas):
+    """Scale (K, V, 3) key deltas in place by each key's vertex group (all groups read in one pass)"""
+    key_blocks = obj.data.shape_keys.key_blocks
+    groups = sorted({kb.vertex_group for kb in key_blocks if kb.vertex_group})
+    if not groups:
+        return deltas
+    weights = vertex_group_weight_matrix(obj, groups)
+    for i, kb in enumerate(key_blocks):
+        if kb.vertex_group:
+            deltas[i] *= weights[groups.index(kb.vertex_group)][:, None]
+    return deltas
+
+
+class ShapeMixer:
+    """Basis, per-key deltas and slider ranges of one mesh, mixed with NumPy"""
+
+    def __init__(self, obj):
+        key_blocks = obj.data.shape_keys.key_blocks
+
+        self.obj = obj
+        self.names = key_blocks.keys()
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+        coords, relative, reference = read_key_coords(obj)
+        # Deltas are computed in place; only the (usually one) relative keys are copied first
+        refs = {int(r): coords[r].copy() for r in np.unique(relative)}
+        self.basis = refs[reference] if reference in refs else coords[reference].copy()
+        for k, r in enumerate(relative):
+            coords[k] -= refs[int(r)]
+        coords[reference] = 0.0
+        self.deltas = coords
+        apply_vertex_groups(obj, self.deltas)
+
+        self.slider_min = self._read(key_blocks, "slider_min")
+        self.slider_max = self._read(key_blocks, "slider_max")
+        self.muted = np.array([kb.mute for kb in key_blocks], dtype=bool)
+
+    @staticmethod
+    def _read(key_blocks, attr):
+        arr = np.empty(len(key_blocks), dtype=np.float32)
+        key_blocks.foreach_get(attr, arr)
+        return arr
+
+    def current_values(self):
+        """(K,) slider values as currently stored on the key blocks"""
+        return self._read(self.obj.data.shape_keys.key_blocks, "value")
+
+    def values_from(self, mapping):
+        """(K,) values from a {key name: value} dict, 0.0 for keys not listed"""
+        values = np.zeros(len(self.names), dtype=np.float32)
+        for name, value in mapping.items():
+            i = self.index.get(name)
+            if i is not None:
+                values[i] = value
+        return values
+
+    def mix(self, values=None):
+        """Mixed (V, 3) positions for (K,) values, or (F, V, 3) for (F, K). Defaults to the current values."""
+        values = self.current_values() if values is None else np.array(values, dtype=np.float32)
+        values[..., self.muted] = 0.0
+        return mix_shapes(self.basis, self.deltas, values, self.slider_min, self.slider_max)
+
+    def compare_evaluated(self, depsgraph, values=None):
+        """Largest vertex distance between mix() and Blender's evaluated mesh, or None if the
+        evaluated mesh has a different vertex count (topology changing modifiers)"""
+        mesh = self.obj.evaluated_get(depsgraph).data
+        if len(mesh.vertices) != len(self.basis):
+            return None
+        diff = read_coords(mesh.vertices, len(mesh.vertices)) - self.mix(values)
+        return float(np.sqrt((diff * diff).sum(axis=1)).max(initial=0.0))
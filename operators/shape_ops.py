@@ -1,8 +1,19 @@
 import bpy
-from .utils import flip_name, mirror_shape_driver_logic
+import itertools
+import math
+from .utils import (
+    flip_name, mirror_shape_driver_logic, create_mirrored_shape,
+    read_coords, write_coords, basis_coords, shape_delta, vertex_group_weight_matrix,
+    copy_driver_to_fcurve, combo_map, add_combo_driver, corrective_parts,
+    inbetween_info, inbetween_chain, set_inbetween_curves, mix_coords, keys_driven_by, request_update, COMBO_SCULPT_PROP, HAS_NUMPY,
+)
+from .batch_ops import rig_build
+
+if HAS_NUMPY:
+    import numpy as np
 
 class BSETUP_OT_AddComboShape(bpy.types.Operator):
-    """Create a new shape key driven by the product of two other keys"""
+    """Create a new shape key driven by the product of two or more other keys"""
     bl_idname = "bsetup.add_combo_shape"
     bl_label = "Create Combo Shape"
     
@@ -15,37 +26,255 @@ class BSETUP_OT_AddComboShape(bpy.types.Operator):
              return {'CANCELLED'}
              
         kb = obj.data.shape_keys.key_blocks
-        if props.combo_shape_a not in kb or props.combo_shape_b not in kb:
+        extras = [n.strip() for n in props.combo_extra_shapes.split(",") if n.strip()]
+        inputs = list(dict.fromkeys([props.combo_shape_a, props.combo_shape_b] + extras))
+        if len(inputs) < 2 or any(name not in kb for name in inputs):
              self.report({'ERROR'}, "Invalid Input Shapes")
              return {'CANCELLED'}
              
         # Create new shape
         new_shape = obj.shape_key_add(name=props.combo_name, from_mix=False)
         
-        # Add Driver
-        # Path: key_blocks["Name"].value
-        fcurve = obj.data.shape_keys.driver_add(f'key_blocks["{new_shape.name}"].value')
-        drv = fcurve.driver
-        drv.type = 'SCRIPTED'
-        drv.expression = "A * B"
-        
-        # Var A
-        varA = drv.variables.new()
-        varA.name = "A"
-        varA.type = 'SINGLE_PROP'
-        varA.targets[0].id_type = 'KEY'
-        varA.targets[0].id = obj.data.shape_keys
-        varA.targets[0].data_path = f'key_blocks["{props.combo_shape_a}"].value'
-        
-        # Var B
-        varB = drv.variables.new()
-        varB.name = "B"
-        varB.type = 'SINGLE_PROP'
-        varB.targets[0].id_type = 'KEY'
-        varB.targets[0].id = obj.data.shape_keys
-        varB.targets[0].data_path = f'key_blocks["{props.combo_shape_b}"].value'
+        # Add Driver: A * B (* C ...)
+        add_combo_driver(obj.data.shape_keys, new_shape.name, inputs)
+        
+        return {'FINISHED'}
+
+class BSETUP_OT_SculptCombo(bpy.types.Operator):
+    """Fill the active combo or in-between shape with the pose it corrects so the correction can be sculpted on top"""
+    bl_idname = "bsetup.sculpt_combo"
+    bl_label = "Sculpt Combo"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or obj.type != 'MESH' or not obj.data.shape_keys or not obj.active_shape_key:
+            self.report({'ERROR'}, "Select a Mesh with an active Combo or In-Between Shape")
+            return {'CANCELLED'}
+        
+        if not HAS_NUMPY:
+            self.report({'ERROR'}, "Sculpt Combo requires numpy")
+            return {'CANCELLED'}
+        from .shape_math import combo_mix
+        
+        key = obj.data.shape_keys
+        combo = obj.active_shape_key
+        parts = corrective_parts(key, combo.name)
+        if not parts:
+            self.report({'ERROR'}, f"'{combo.name}' is not a combo (product driver) or in-between shape")
+            return {'CANCELLED'}
+        
+        sculpting = key.get(COMBO_SCULPT_PROP, {})
+        if combo.name in sculpting:
+            self.report({'WARNING'}, f"'{combo.name}' is already being sculpted, commit it first")
+            return {'CANCELLED'}
+        
+        if obj.mode == 'EDIT':
+            obj.update_from_editmode()
+        
+        # Start from the current corrective, so an already committed residual is kept
+        deltas = [weight * shape_delta(obj, kb) for kb, weight in parts] + [shape_delta(obj, combo)]
+        write_coords(combo, combo_mix(basis_coords(obj), deltas))
+        
+        sculpting = dict(sculpting)
+        sculpting[combo.name] = int(obj.show_only_shape_key)
+        key[COMBO_SCULPT_PROP] = sculpting
+        
+        # What is shown is what gets edited: the corrective key alone
+        obj.show_only_shape_key = True
+        obj.data.update()
+        self.report({'INFO'}, f"Sculpt '{combo.name}' on top of {' + '.join(kb.name for kb, _ in parts)}, then Commit")
+        return {'FINISHED'}
+
+class BSETUP_OT_CommitCombo(bpy.types.Operator):
+    """Store only the sculpted correction by subtracting the shapes the combo or in-between sits on top of"""
+    bl_idname = "bsetup.commit_combo"
+    bl_label = "Commit Combo"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or obj.type != 'MESH' or not obj.data.shape_keys or not obj.active_shape_key:
+            self.report({'ERROR'}, "Select a Mesh with an active Combo or In-Between Shape")
+            return {'CANCELLED'}
+        
+        if not HAS_NUMPY:
+            self.report({'ERROR'}, "Commit Combo requires numpy")
+            return {'CANCELLED'}
+        from .shape_math import combo_residual
+        
+        key = obj.data.shape_keys
+        combo = obj.active_shape_key
+        sculpting = dict(key.get(COMBO_SCULPT_PROP, {}))
+        if combo.name not in sculpting:
+            self.report({'ERROR'}, f"'{combo.name}' was not captured with Sculpt Combo")
+            return {'CANCELLED'}
+        
+        parts = corrective_parts(key, combo.name)
+        if not parts:
+            self.report({'ERROR'}, f"'{combo.name}' is no longer a combo or in-between shape")
+            return {'CANCELLED'}
+        
+        if obj.mode == 'EDIT':
+            obj.update_from_editmode()
+        
+        n = len(obj.data.vertices)
+        basis = basis_coords(obj)
+        # Residual is relative to the corrective's own relative key
+        deltas = [weight * shape_delta(obj, kb) for kb, weight in parts]
+        residual = combo_residual(read_coords(combo.data, n), basis, deltas)
+        write_coords(combo, read_coords(combo.relative_key.data, n) + residual)
+        
+        obj.show_only_shape_key = bool(sculpting.pop(combo.name))
+        if sculpting:
+            key[COMBO_SCULPT_PROP] = sculpting
+        else:
+            del key[COMBO_SCULPT_PROP]
+        
+        obj.data.update()
+        self.report({'INFO'}, f"Committed '{combo.name}': residual over {len(parts)} shapes")
+        return {'FINISHED'}
+
+# Larger lattices need an explicit opt-in (400 bases up to triples would be ~10M keys)
+MAX_LATTICE_COMBOS = 1000
+
+class BSETUP_OT_BuildComboLattice(bpy.types.Operator):
+    """Create all pairwise (and triple) combo shapes of a set of base shapes with their product drivers, or prune unused ones"""
+    bl_idname = "bsetup.build_combo_lattice"
+    bl_label = "Build Combo Lattice"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('BUILD', "Build", "Create every missing combo of the base shapes"),
+            ('PRUNE', "Prune", "Remove combos of the base shapes whose sculpted correction stays under the threshold"),
+        ],
+        default='BUILD'
+    )
+    
+    base_shapes: bpy.props.StringProperty(
+        name="Base Shapes",
+        description="Comma separated base shape keys. Leave empty to use every shape key that is not a combo",
+        default=""
+    )
+    
+    max_order: bpy.props.IntProperty(
+        name="Max Order",
+        description="2: pairs only, 3: pairs and triples",
+        default=2,
+        min=2,
+        max=3
+    )
+    
+    separator: bpy.props.StringProperty(
+        name="Separator",
+        description="Joins the base shape names into the combo name (Smile_Blink)",
+        default="_"
+    )
+    
+    allow_large: bpy.props.BoolProperty(
+        name="Allow Large Lattice",
+        description=f"Build even when the lattice has more than {MAX_LATTICE_COMBOS} combos",
+        default=False
+    )
+    
+    prune_threshold: bpy.props.FloatProperty(
+        name="Threshold",
+        description="Combos whose largest vertex offset is below this are removed",
+        default=1e-4,
+        min=0.0,
+        precision=5
+    )
+    
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or obj.type != 'MESH' or not obj.data.shape_keys:
+            self.report({'ERROR'}, "Select a Mesh Object with Shape Keys")
+            return {'CANCELLED'}
+        
+        key = obj.data.shape_keys
+        key_blocks = key.key_blocks
+        combos = combo_map(key)
+        combo_names = set(combos.values())
+        
+        if self.base_shapes.strip():
+            bases = list(dict.fromkeys(n.strip() for n in self.base_shapes.split(",") if n.strip()))
+            missing = [n for n in bases if n not in key_blocks]
+            if missing:
+                self.report({'ERROR'}, f"Shape keys not found: {', '.join(missing)}")
+                return {'CANCELLED'}
+        else:
+            # In-betweens are part of their parent's curve, not bases of their own
+            bases = [kb.name for kb in key_blocks if kb != key.reference_key and kb.name not in combo_names
+                     and not inbetween_info(key, kb.name)]
+        
+        if len(bases) < 2:
+            self.report({'ERROR'}, "Need at least two base shapes")
+            return {'CANCELLED'}
+        
+        if self.mode == 'PRUNE':
+            # Only existing combos can be pruned, no need to enumerate the lattice
+            base_set = set(bases)
+            sets = [tuple(inputs) for inputs in combos if len(inputs) <= self.max_order and inputs <= base_set]
+        else:
+            count = sum(math.comb(len(bases), order) for order in range(2, self.max_order + 1))
+            if count > MAX_LATTICE_COMBOS and not self.allow_large:
+                self.report({'ERROR'}, f"{len(bases)} base shapes give {count} combos. List the Base Shapes or enable Allow Large Lattice")
+                return {'CANCELLED'}
+            sets = [c for order in range(2, self.max_order + 1) for c in itertools.combinations(bases, order)]
+        
+        with rig_build(context, message="Combo Lattice", push_undo=False):
+            if self.mode == 'PRUNE':
+                return self.prune(context, obj, combos, sets)
+            
+            created = existing = 0
+            clashes = []
+            for inputs in sets:
+                if frozenset(inputs) in combos:
+                    existing += 1
+                    continue
+                name = self.separator.join(inputs)
+                if name in key_blocks:
+                    clashes.append(name) # A plain shape with this name already exists
+                    continue
+                # Only missing combos are added, existing ones keep their sculpt
+                new_shape = obj.shape_key_add(name=name, from_mix=False)
+                new_shape.value = 0.0
+                add_combo_driver(key, new_shape.name, inputs)
+                created += 1
+            
+            request_update(context, obj)
         
+        for name in clashes:
+            print(f"[MayaShapeKeys] Combo lattice skipped '{name}': a non-combo shape key has this name")
+        self.report({'INFO'}, f"Combo lattice: {created} created, {existing} existing, {len(clashes)} skipped")
         return {'FINISHED'}
+    
+    def prune(self, context, obj, combos, sets):
+        if not HAS_NUMPY:
+            self.report({'ERROR'}, "Pruning requires numpy")
+            return {'CANCELLED'}
+        
+        key = obj.data.shape_keys
+        sculpting = key.get(COMBO_SCULPT_PROP, {})
+        removed = []
+        for inputs in sets:
+            name = combos.get(frozenset(inputs))
+            if not name or name in sculpting:
+                continue
+            delta = shape_delta(obj, key.key_blocks[name])
+            if np.sqrt((delta * delta).sum(axis=1)).max(initial=0.0) < self.prune_threshold:
+                key.driver_remove(f'key_blocks["{name}"].value')
+                obj.shape_key_remove(key.key_blocks[name])
+                removed.append(name)
+        
+        request_update(context, obj)
+        self.report({'INFO'}, f"Combo lattice: pruned {len(removed)} combos without a correction")
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
 
 class BSETUP_OT_CreateNamedShape(bpy.types.Operator):
     """Create a new named shape key (and Basis if needed)"""
@@ -77,9 +306,10 @@ class BSETUP_OT_CreateNamedShape(bpy.types.Operator):
         return {'FINISHED'}
 
 class BSETUP_OT_CreateInBetween(bpy.types.Operator):
-    """Create a corrective shape that activates at a specific value of the parent shape"""
+    """Create a corrective shape (or a whole chain of them) that activates at specific values of the parent shape"""
     bl_idname = "bsetup.create_in_between"
     bl_label = "Create In-Between"
+    bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
         props = context.scene.maya_shape_keys
@@ -88,66 +318,92 @@ class BSETUP_OT_CreateInBetween(bpy.types.Operator):
         if not obj or not obj.data.shape_keys:
              return {'CANCELLED'}
              
-        kb = obj.data.shape_keys.key_blocks
+        key = obj.data.shape_keys
+        kb = key.key_blocks
         if props.ib_source not in kb:
              self.report({'ERROR'}, "Parent Shape not found")
              return {'CANCELLED'}
              
         parent_name = props.ib_source
-        trigger_val = props.ib_value
         
-        # Create new shape
-        new_name = f"{parent_name}_{trigger_val:.2f}"
-        new_shape = obj.shape_key_add(name=new_name, from_mix=False)
-        
-        # Add Driver
-        fcurve = obj.data.shape_keys.driver_add(f'key_blocks["{new_shape.name}"].value')
-        drv = fcurve.driver
-        drv.type = 'SUM' # Use Mapping Curve
-        
-        # Var
-        var = drv.variables.new()
-        var.name = "var"
-        var.type = 'SINGLE_PROP'
-        var.targets[0].id_type = 'KEY'
-        var.targets[0].id = obj.data.shape_keys
-        var.targets[0].data_path = f'key_blocks["{parent_name}"].value'
-        
-        # Curve Points
-        # 0 -> 0
-        # trigger -> 1
-        # 0 or 1 -> 0 (depending on trigger)
-        
-        # Clean modifiers
-        for mod in fcurve.modifiers:
-            fcurve.modifiers.remove(mod)
-            
-        # Logic: Triangle with peak at trigger_val
-        # If trigger is 0.5:
-        # 0.0 -> 0
-        # 0.5 -> 1
-        # 1.0 -> 0
+        # Trigger values: a whole chain ("0.25, 0.5, 0.75") or the single Trigger At value
+        try:
+            triggers = [float(v) for v in props.ib_chain.split(",") if v.strip()] or [props.ib_value]
+        except ValueError:
+            self.report({'ERROR'}, f"Invalid trigger values: '{props.ib_chain}'")
+            return {'CANCELLED'}
+        if any(not 0.0 <= t <= 1.0 for t in triggers):
+            self.report({'ERROR'}, "Trigger values must be between 0 and 1")
+            return {'CANCELLED'}
         
-        fcurve.keyframe_points.insert(0.0, 0.0)
-        fcurve.keyframe_points.insert(trigger_val, 1.0)
+        # Existing in-betweens of the parent stay in the chain, same triggers are reused
+        chain = {round(t, 4): name for t, name in inbetween_chain(key, parent_name)}
+        created = []
+        for trigger_val in sorted(set(round(t, 4) for t in triggers)):
+            if trigger_val in chain:
+                continue
+            
+            # Create new shape
+            new_name = f"{parent_name}_{trigger_val:.2f}"
+            new_shape = obj.shape_key_add(name=new_name, from_mix=False)
+            
+            # Add Driver
+            fcurve = key.driver_add(f'key_blocks["{new_shape.name}"].value')
+            drv = fcurve.driver
+            drv.type = 'SUM' # Use Mapping Curve
+            
+            # Var
+            var = drv.variables.new()
+            var.name = "var"
+            var.type = 'SINGLE_PROP'
+            var.targets[0].id_type = 'KEY'
+            var.targets[0].id = key
+            var.targets[0].data_path = f'key_blocks["{parent_name}"].value'
+            
+            # Clean modifiers
+            for mod in list(fcurve.modifiers):
+                fcurve.modifiers.remove(mod)
+            
+            chain[trigger_val] = new_shape.name
+            created.append((trigger_val, new_shape))
         
-        # We need to clamp it back to 0 at the ends.
-        # If trigger < 1, key at 1 is 0.
-        if trigger_val < 1.0:
-            fcurve.keyframe_points.insert(1.0, 0.0)
+        # Piecewise-linear curves for the whole chain: each in-between peaks at its
+        # trigger and fades out at its neighbours, e.g. 0.0 -> 0, 0.5 -> 1, 1.0 -> 0
+        chain = sorted(chain.items())
+        set_inbetween_curves(key, chain)
         
-        # If trigger > 0, key at 0 is 0 (Already added).
+        if props.ib_capture and len(created) == 1:
+            if not HAS_NUMPY:
+                self.report({'WARNING'}, "Capture Mix requires numpy, created an empty in-between")
+            else:
+                self.capture_mix(obj, parent_name, chain, *created[0])
         
-        # Set interpolation to linear for the "triangle"
-        for kp in fcurve.keyframe_points:
-            kp.interpolation = 'LINEAR'
-            
+        self.report({'INFO'}, f"In-betweens of '{parent_name}': {len(created)} created, {len(chain)} in chain")
         return {'FINISHED'}
+    
+    def capture_mix(self, obj, parent_name, chain, trigger_val, new_shape):
+        """Store the current mix (parent at the trigger) minus the interpolated parent offset.
+
+        Other keys keep their current values, except keys whose drivers read the parent
+        (combos, correctives): their current value belongs to the parent's current value,
+        not to the trigger, so they are left out of the capture.
+        """
+        key = obj.data.shape_keys
+        values = {kb.name: kb.value for kb in key.key_blocks}
+        for name in keys_driven_by(key, [parent_name]) | {name for _, name in chain}:
+            values[name] = 0.0
+        values[parent_name] = trigger_val
+        
+        if obj.mode == 'EDIT':
+            obj.update_from_editmode()
+        parent_delta = trigger_val * shape_delta(obj, key.key_blocks[parent_name])
+        write_coords(new_shape, mix_coords(obj, values) - parent_delta)
+        obj.data.update()
 
 class BSETUP_OT_SplitShape(bpy.types.Operator):
-    """Split the current shape key into Left and Right sides using an auto-generated Vertex Group mask"""
+    """Split the current shape key into Left/Right sides or into any number of regions"""
     bl_idname = "bsetup.split_shape"
-    bl_label = "Split Shape L/R"
+    bl_label = "Split Shape"
     bl_options = {'REGISTER', 'UNDO'}
     
     threshold: bpy.props.FloatProperty(
@@ -156,6 +412,95 @@ class BSETUP_OT_SplitShape(bpy.types.Operator):
         description="Threshold for center vertices (X-axis)"
     )
     
+    split_mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('MASK', "Vertex Group Mask", "Hard 0/1 Split_Mask_L/R vertex groups referenced by the split keys"),
+            ('BAKED', "Baked Falloff", "Blend weights baked into the split keys, no vertex groups and no center seam"),
+            ('GROUPS', "Vertex Group Regions", "One key per listed vertex group, weights normalized to sum to the source"),
+            ('AXIS', "Axis Bands", "One key per equal band along an axis (e.g. inner/mid/outer)"),
+        ],
+        default='MASK'
+    )
+    
+    blend_width: bpy.props.FloatProperty(
+        name="Blend Width",
+        default=0.1,
+        min=0.0,
+        description="Width of the zone around each border where neighbouring pieces blend into each other"
+    )
+    
+    falloff: bpy.props.EnumProperty(
+        name="Falloff",
+        items=[
+            ('LINEAR', "Linear", "Linear blend across the border zone"),
+            ('SMOOTHSTEP', "Smooth", "Smoothstep blend across the border zone"),
+        ],
+        default='SMOOTHSTEP'
+    )
+    
+    region_groups: bpy.props.StringProperty(
+        name="Vertex Groups",
+        description="Comma separated vertex groups, one region key each (e.g. Brow_Inner, Brow_Mid, Brow_Outer)",
+        default=""
+    )
+    
+    region_axis: bpy.props.EnumProperty(
+        name="Axis",
+        items=[('X', "X", ""), ('Y', "Y", ""), ('Z', "Z", "")],
+        default='X'
+    )
+    
+    region_count: bpy.props.IntProperty(
+        name="Bands",
+        default=3,
+        min=2,
+        max=16
+    )
+    
+    region_names: bpy.props.StringProperty(
+        name="Band Names",
+        description="Optional comma separated names for the bands, lowest coordinate first (default: 01, 02, ...)",
+        default=""
+    )
+    
+    name_template: bpy.props.StringProperty(
+        name="Name Template",
+        description="Name of each region key. {name}: source key, {region}: group or band name, {index}: 1-based index",
+        default="{name}_{region}"
+    )
+    
+    copy_drivers: bpy.props.BoolProperty(
+        name="Copy Drivers",
+        description="Give every split key a copy of the source key's driver",
+        default=False
+    )
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "split_mode")
+        if self.split_mode == 'MASK':
+            layout.prop(self, "threshold")
+        elif self.split_mode == 'GROUPS':
+            layout.prop(self, "region_groups")
+            layout.prop(self, "name_template")
+        else:
+            if self.split_mode == 'AXIS':
+                row = layout.row(align=True)
+                row.prop(self, "region_axis", expand=True)
+                layout.prop(self, "region_count")
+                layout.prop(self, "region_names")
+                layout.prop(self, "name_template")
+            layout.prop(self, "blend_width")
+            layout.prop(self, "falloff")
+        layout.prop(self, "copy_drivers")
+    
+    def invoke(self, context, event):
+        # Region modes need their inputs first, the L/R modes run directly
+        if self.split_mode in {'GROUPS', 'AXIS'}:
+            return context.window_manager.invoke_props_dialog(self)
+        return self.execute(context)
+    
     def execute(self, context):
         obj = context.active_object
         if not obj or obj.type != 'MESH':
@@ -165,10 +510,19 @@ class BSETUP_OT_SplitShape(bpy.types.Operator):
         if not obj.data.shape_keys or not obj.active_shape_key:
             self.report({'ERROR'}, "No Active Shape Key")
             return {'CANCELLED'}
+        
+        if not HAS_NUMPY:
+            self.report({'ERROR'}, "Split Shape requires numpy")
+            return {'CANCELLED'}
             
         source_key = obj.active_shape_key
         source_name = source_key.name
         
+        if self.split_mode == 'BAKED':
+            return self.split_baked(obj, source_key)
+        if self.split_mode in {'GROUPS', 'AXIS'}:
+            return self.split_regions(obj, source_key)
+        
         # 1. GENERATE MASKS
         # Naming: Split_Mask_L (X >= 0), Split_Mask_R (X < 0)
         # Using standard conventions: +X is Left (Character Left), -X is Right.
@@ -191,58 +545,114 @@ class BSETUP_OT_SplitShape(bpy.types.Operator):
         
         # Only calculate if we created a new group (presumably empty)
         if create_l or create_r:
-            # Determine indices
-            # We perform this in Object Mode (implied) to access data safely
+            # One foreach_get for all positions, +X (and center within threshold) is Left
             mesh = obj.data
-            
-            # Prepare lists
-            indices_l = []
-            indices_r = []
-            
-            # Simple threshold check
-            t = self.threshold
-            for v in mesh.vertices:
-                if v.co.x >= -t: # Include 0 or near 0 in Left
-                    if create_l: indices_l.append(v.index)
-                else:
-                    if create_r: indices_r.append(v.index)
-                    
-            # Assign new weights
+            x = read_coords(mesh.vertices, len(mesh.vertices))[:, 0]
+            is_left = x >= -self.threshold
+
+            indices_l = np.flatnonzero(is_left).tolist()
+            indices_r = np.flatnonzero(~is_left).tolist()
             if create_l and indices_l: vg_l.add(indices_l, 1.0, 'REPLACE')
             if create_r and indices_r: vg_r.add(indices_r, 1.0, 'REPLACE')
         
         # 2. CREATE SPLIT KEYS
+        # Written directly as basis + source offset, so no slider values have to be
+        # zeroed and restored for a from_mix capture. Existing split keys are overwritten.
         key_blocks = obj.data.shape_keys.key_blocks
-        stored_values = {kb.name: kb.value for kb in key_blocks} # Backup
-        
-        # Reset all to 0
-        for kb in key_blocks: kb.value = 0.0
-        # Set source to 1.0
-        key_blocks[source_name].value = 1.0
-        
-        # Create Left
-        name_l = f"{source_name}_L"
-        obj.shape_key_add(name=name_l, from_mix=True)
-        kb_l = key_blocks[len(key_blocks)-1]
-        kb_l.name = name_l 
-        kb_l.vertex_group = group_l_name
-        kb_l.value = 0.0 
-        
-        # Create Right
-        name_r = f"{source_name}_R"
-        obj.shape_key_add(name=name_r, from_mix=True)
-        kb_r = key_blocks[len(key_blocks)-1]
-        kb_r.name = name_r
-        kb_r.vertex_group = group_r_name
-        kb_r.value = 0.0
-        
-        # Restore original values
-        for k, v in stored_values.items():
-            key_blocks[k].value = v
-            
+        split_co = basis_coords(obj) + shape_delta(obj, source_key)
+        
+        for name, group_name in ((f"{source_name}_L", group_l_name), (f"{source_name}_R", group_r_name)):
+            kb = key_blocks.get(name)
+            if kb is None:
+                kb = obj.shape_key_add(name=name, from_mix=False)
+            write_coords(kb, split_co)
+            kb.vertex_group = group_name
+            kb.value = 0.0
+        
+        if self.copy_drivers:
+            self.copy_source_driver(obj, source_key, [f"{source_name}_L", f"{source_name}_R"])
+        
+        obj.data.update()
         self.report({'INFO'}, f"Split '{source_name}' into L/R")
         return {'FINISHED'}
 
+    def split_baked(self, obj, source_key):
+        """L/R keys with weights computed from X, baked into the keys"""
+        from .shape_math import split_weights
+        
+        w_left = split_weights(basis_coords(obj)[:, 0], self.blend_width, self.falloff)
+        names = [f"{source_key.name}_L", f"{source_key.name}_R"]
+        self.write_split_keys(obj, source_key, names, np.stack([w_left, 1.0 - w_left]))
+        
+        self.report({'INFO'}, f"Split '{source_key.name}' into L/R (baked falloff)")
+        return {'FINISHED'}
+    
+    def split_regions(self, obj, source_key):
+        """N region keys from vertex groups or axis bands"""
+        from .shape_math import axis_band_weights, normalize_region_weights
+        
+        if self.split_mode == 'GROUPS':
+            regions = [g.strip() for g in self.region_groups.split(",") if g.strip()]
+            missing = [g for g in regions if g not in obj.vertex_groups]
+            if len(regions) < 2 or missing:
+                msg = f"Missing vertex groups: {', '.join(missing)}" if missing else "List at least two vertex groups"
+                self.report({'ERROR'}, msg)
+                return {'CANCELLED'}
+            raw = vertex_group_weight_matrix(obj, regions)
+        else:
+            axis = "XYZ".index(self.region_axis)
+            raw = axis_band_weights(basis_coords(obj)[:, axis], self.region_count, self.blend_width, self.falloff)
+            regions = [r.strip() for r in self.region_names.split(",") if r.strip()]
+            if len(regions) != self.region_count:
+                regions = [f"{i + 1:02d}" for i in range(self.region_count)]
+        
+        weights, uncovered = normalize_region_weights(raw)
+        try:
+            names = [self.name_template.format(name=source_key.name, region=r, index=i + 1) for i, r in enumerate(regions)]
+        except (KeyError, IndexError, ValueError) as e:
+            self.report({'ERROR'}, f"Invalid name template: {e}")
+            return {'CANCELLED'}
+        if len(set(names)) != len(names) or source_key.name in names:
+            self.report({'ERROR'}, "Name template must give every region a unique new name")
+            return {'CANCELLED'}
+        
+        self.write_split_keys(obj, source_key, names, weights)
+        
+        msg = f"Split '{source_key.name}' into {len(names)} regions"
+        if uncovered:
+            msg += f" ({uncovered} vertices outside all regions shared evenly)"
+        self.report({'INFO'}, msg)
+        return {'FINISHED'}
+    
+    def write_split_keys(self, obj, source_key, names, weights):
+        """Write one key per (V,) weight row in a single vectorized pass. Existing keys are overwritten."""
+        from .shape_math import split_region_coords
+        
+        key_blocks = obj.data.shape_keys.key_blocks
+        pieces = split_region_coords(basis_coords(obj), shape_delta(obj, source_key), weights)
+        
+        for name, co in zip(names, pieces):
+            kb = key_blocks.get(name)
+            if kb is None:
+                kb = obj.shape_key_add(name=name, from_mix=False)
+            write_coords(kb, co)
+            kb.vertex_group = ""
+            kb.value = 0.0
+        
+        if self.copy_drivers:
+            self.copy_source_driver(obj, source_key, names)
+        obj.data.update()
+    
+    def copy_source_driver(self, obj, source_key, names):
+        key = obj.data.shape_keys
+        src_fc = key.animation_data.drivers.find(f'key_blocks["{source_key.name}"].value') if key.animation_data else None
+        if not src_fc:
+            return
+        for name in names:
+            path = f'key_blocks["{name}"].value'
+            key.driver_remove(path)
+            copy_driver_to_fcurve(src_fc, key.driver_add(path), mirror_targets=False)
+
 
 class BSETUP_OT_CreateAsymShape(bpy.types.Operator):
     """Create a new shape key and enable Topology Mirroring for asymmetrical sculpting"""
@@ -328,45 +738,8 @@ class BSETUP_OT_MirrorShapeAndDriver(bpy.types.Operator):
              return {'CANCELLED'}
              
         # 1. MIRROR GEOMETRY
-        # If target exists, we update it. If not, create new.
-        
-        # To mirror geometry reliably using 'New Shape From Mix', we need to isolate the source shape.
-        # Store current values
-        key_blocks = obj.data.shape_keys.key_blocks
-        stored_values = {kb.name: kb.value for kb in key_blocks}
-        
-        # Mute all but source
-        for kb in key_blocks:
-            kb.value = 0.0
-            
-        key_blocks[source_key_name].value = 1.0
-        
-        # Create temp mix
-        # To make sure we don't mess up, we can use shape_key_add(from_mix=True)
-        # But wait, from_mix mixes EVERYTHING visible. 
-        # So setting others to 0 is correct.
-        
-        # Create new key
-        obj.shape_key_add(name=target_key_name, from_mix=True)
-        # The new key is added at the end, usually active index updates to it? NO.
-        new_key_block = key_blocks[len(key_blocks)-1]
-        new_key_block.name = target_key_name # Renaming might fail if exists, handled by Blender usually (Name.001)
-        
-        # If it was duplicate, we might want to replace the old one?
-        # If 'target_key_name' already existed, 'new_key_block.name' will be 'target_key_name.001'
-        if new_key_block.name != target_key_name:
-            # Reconstruct: delete old if exists?
-            # User might have done work, safer to NOT delete automatically, but for now let's assume 'overwrite' behavior is desired or manual cleanup.
-            # But the user renamed to .001. Let's just Mirror the .001 one.
-            pass
-
-        # Mirror it
-        obj.active_shape_key_index = key_blocks.find(new_key_block.name)
-        bpy.ops.object.shape_key_mirror(use_topology=self.use_topology)
-        
-        # Reset values
-        for k, v in stored_values.items():
-            key_blocks[k].value = v
+        # Written straight into the target key (created if missing) via the cached symmetry map
+        new_key_block = create_mirrored_shape(obj, source_key_name, target_key_name, self.use_topology)
             
         # 2. MIRROR DRIVER
         # Check if driver exists on source
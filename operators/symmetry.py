@@ -0,0 +1,95 @@
+import bpy
+import hashlib
+from mathutils.kdtree import KDTree
+import numpy as np
+from .shape_math import mirror_shape_coords, topology_marker_coords, topology_sym_map
+from .utils import read_coords, write_coords, basis_coords
+
+# Per-mesh vertex symmetry map (vertex index -> mirror vertex index, -1 if none).
+# Stored as an integer point attribute and rebuilt only when the basis geometry changes.
+SYMMETRY_ATTR = "sdk_mirror_index"
+SYMMETRY_HASH_PROP = "_sdk_mirror_hash"
+MIRROR_TOLERANCE = 1e-4
+
+def _geometry_hash(co, use_topology, tolerance):
+    h = hashlib.blake2b(co.tobytes(), digest_size=16)
+    h.update(f"{use_topology}:{tolerance}".encode())
+    return h.hexdigest()
+
+def _kdtree_map(co, tolerance):
+    """X-mirror partners by nearest neighbour of the mirrored position"""
+    tree = KDTree(len(co))
+    for i, v in enumerate(co.tolist()):
+        tree.insert(v, i)
+    tree.balance()
+
+    sym_map = np.full(len(co), -1, dtype=np.int32)
+    for i, (x, y, z) in enumerate(co.tolist()):
+        _, j, dist = tree.find((-x, y, z))
+        if j is not None and dist <= tolerance:
+            sym_map[i] = j
+    return sym_map
+
+def _topology_map(obj):
+    """Topology partners: mirror a temporary key that stores each vertex index in Y and a +1 marker in X"""
+    key_blocks = obj.data.shape_keys.key_blocks
+    n = len(obj.data.vertices)
+    active_index = obj.active_shape_key_index
+
+    tmp = obj.shape_key_add(name="_sdk_symmetry_tmp", from_mix=False)
+    write_coords(tmp, topology_marker_coords(n))
+
+    try:
+        obj.active_shape_key_index = key_blocks.find(tmp.name)
+        with bpy.context.temp_override(object=obj, active_object=obj):
+            bpy.ops.object.shape_key_mirror(use_topology=True)
+        # Unmatched vertices are left alone by the mirror, their X marker stays +1
+        sym_map = topology_sym_map(read_coords(tmp.data, n))
+    finally:
+        obj.shape_key_remove(tmp)
+        obj.active_shape_key_index = active_index
+
+    return sym_map
+
+def get_symmetry_map(obj, use_topology=False, tolerance=MIRROR_TOLERANCE):
+    """Cached symmetry map of a mesh object, rebuilt when the basis geometry changed"""
+    mesh = obj.data
+    n = len(mesh.vertices)
+    geo_hash = _geometry_hash(basis_coords(obj), use_topology, tolerance)
+
+    attr = mesh.attributes.get(SYMMETRY_ATTR)
+    if attr and attr.domain == 'POINT' and attr.data_type == 'INT' and mesh.get(SYMMETRY_HASH_PROP) == geo_hash:
+        sym_map = np.empty(n, dtype=np.int32)
+        attr.data.foreach_get("value", sym_map)
+        return sym_map
+
+    if use_topology and mesh.shape_keys:
+        sym_map = _topology_map(obj)
+    else:
+        sym_map = _kdtree_map(basis_coords(obj), tolerance)
+
+    if attr:
+        mesh.attributes.remove(attr)
+    attr = mesh.attributes.new(SYMMETRY_ATTR, 'INT', 'POINT')
+    attr.data.foreach_set("value", sym_map)
+    mesh[SYMMETRY_HASH_PROP] = geo_hash
+
+    print(f"[MayaShapeKeys] Built symmetry map for '{mesh.name}': {int((sym_map >= 0).sum())}/{n} vertices matched")
+    return sym_map
+
+def mirror_shape_key(obj, source_key_name, target_key_name, use_topology=False):
+    """Write the mirrored geometry of a shape key into the target key (created if missing)"""
+    key_blocks = obj.data.shape_keys.key_blocks
+    n = len(obj.data.vertices)
+
+    sym_map = get_symmetry_map(obj, use_topology)
+    basis = basis_coords(obj)
+    source = read_coords(key_blocks[source_key_name].data, n)
+
+    target = key_blocks.get(target_key_name)
+    if target is None:
+        target = obj.shape_key_add(name=target_key_name, from_mix=False)
+
+    write_coords(target, mirror_shape_coords(basis, source, sym_map))
+    obj.data.update()
+    return target
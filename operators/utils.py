@@ -1,50 +1,44 @@
 import bpy
 import re
+import math
+from .naming import flip_name, build_mirror_map
+from .sdk_range import range_mapping, value_to_frame, fit_frame_range
 
-def flip_name(name):
-    """Flip .L/.R, _L/_R, L_, R_, Left, Right naming conventions, preserving suffixes like .001"""
-    
-    # 1. Complex Patterns (Suffix sensitive)
-    # Matches _L or .L followed by end of string or a dot (for .001)
-    # Group 1: The separator (. or _)
-    # Group 2: The suffix (.001 or empty)
-    
-    # Check _L / _R
-    # Updated: Allow . or _ or end of string as delimiter
-    if re.search(r'(_[Ll])($|[\._])', name):
-        return re.sub(r'(_[Ll])($|[\._])', lambda m: m.group(1).replace('l', 'r').replace('L', 'R') + m.group(2), name)
-    if re.search(r'(_[Rr])($|[\._])', name):
-        return re.sub(r'(_[Rr])($|[\._])', lambda m: m.group(1).replace('r', 'l').replace('R', 'L') + m.group(2), name)
-
-    # Check .L / .R
-    if re.search(r'(\.[Ll])($|[\._])', name):
-        return re.sub(r'(\.[Ll])($|[\._])', lambda m: m.group(1).replace('l', 'r').replace('L', 'R') + m.group(2), name)
-    if re.search(r'(\.[Rr])($|[\._])', name):
-        return re.sub(r'(\.[Rr])($|[\._])', lambda m: m.group(1).replace('r', 'l').replace('R', 'L') + m.group(2), name)
-
-    # 2. Variable Separators (for middle occurrences)
-    # _L_ -> _R_
-    if '_L_' in name: return name.replace('_L_', '_R_')
-    if '_R_' in name: return name.replace('_R_', '_L_')
-    if '_l_' in name: return name.replace('_l_', '_r_')
-    if '_r_' in name: return name.replace('_r_', '_l_')
-    
-    # 3. Prefixes
-    if name.startswith('L_'): return 'R_' + name[2:]
-    if name.startswith('R_'): return 'L_' + name[2:]
-    if name.startswith('L.'): return 'R.' + name[2:]
-    if name.startswith('R.'): return 'L.' + name[2:]
-    
-    # 4. Words
-    if "Left" in name: return name.replace("Left", "Right")
-    if "Right" in name: return name.replace("Right", "Left")
-    if "left" in name: return name.replace("left", "right")
-    # if "right" in name: return name.replace("right", "left")
+# Try importing numpy
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-    return None
+def rig_mirror_map(armature):
+    """L<->R maps for an armature: (bones, shape keys of its meshes, actions), built in one pass.
+
+    The maps are cached against each name set, so repeated mirror calls are lookups.
+    """
+    bones = build_mirror_map(armature.pose.bones.keys() if armature.type == 'ARMATURE' else ())
+    actions = build_mirror_map(bpy.data.actions.keys())
+
+    key_names = set()
+    for obj in bpy.data.objects:
+        if obj.type != 'MESH' or not obj.data.shape_keys:
+            continue
+        if obj.parent == armature or any(m.type == 'ARMATURE' and m.object == armature for m in obj.modifiers):
+            key_names.update(obj.data.shape_keys.key_blocks.keys())
+
+    return bones, build_mirror_map(key_names), actions
+
+def flip_bone_name(armature, name):
+    """Mirrored bone name, preferring the partner that exists on the armature; unchanged if unsided"""
+    if armature and armature.type == 'ARMATURE':
+        return build_mirror_map(armature.pose.bones.keys()).flip(name) or name
+    return flip_name(name) or name
 
-def copy_driver_to_fcurve(source_fcurve, target_fcurve, invert_values=False):
-    """Copy all driver settings and keyframes from source to target fcurve"""
+def copy_driver_to_fcurve(source_fcurve, target_fcurve, invert_values=False, mirror_targets=True):
+    """Copy all driver settings and keyframes from source to target fcurve
+    
+    mirror_targets: flip L/R names of variable targets (disable for a plain duplicate)
+    """
     target_drv = target_fcurve.driver
     source_drv = source_fcurve.driver
     
@@ -59,9 +53,22 @@ def copy_driver_to_fcurve(source_fcurve, target_fcurve, invert_values=False):
         
         for i, src_tgt in enumerate(src_var.targets):
             tgt = new_var.targets[i]
-            # tgt.id_type is read-only. Setting .id usually sets id_type implicitly.
+            # tgt.id_type is only writable for SINGLE_PROP. Setting .id usually sets id_type implicitly.
+            if src_var.type == 'SINGLE_PROP' and tgt.id_type != src_tgt.id_type:
+                tgt.id_type = src_tgt.id_type
             tgt.id = src_tgt.id
             
+            if not mirror_targets:
+                if src_var.type == 'TRANSFORMS':
+                    tgt.transform_type = src_tgt.transform_type
+                    tgt.transform_space = src_tgt.transform_space
+                    tgt.rotation_mode = src_tgt.rotation_mode
+                else:
+                    tgt.data_path = src_tgt.data_path
+                if src_tgt.bone_target:
+                    tgt.bone_target = src_tgt.bone_target
+                continue
+            
             # 1. Try to flip Identifier (Object)
             if src_tgt.id and hasattr(src_tgt.id, "name"):
                 flipped_id_name = flip_name(src_tgt.id.name)
@@ -79,55 +86,428 @@ def copy_driver_to_fcurve(source_fcurve, target_fcurve, invert_values=False):
                 tgt.transform_space = src_tgt.transform_space
                 # Flip bone target
                 if src_tgt.bone_target:
-                    tgt.bone_target = flip_name(src_tgt.bone_target)
-                    
-                    if not tgt.bone_target:
-                        # Fallback: simple replace
-                        val = src_tgt.bone_target
-                        if ".L" in val: tgt.bone_target = val.replace(".L", ".R")
-                        elif ".R" in val: tgt.bone_target = val.replace(".R", ".L")
-                        elif "_L" in val: tgt.bone_target = val.replace("_L", "_R")
-                        elif "_R" in val: tgt.bone_target = val.replace("_R", "_L")
-                        else:
-                             tgt.bone_target = src_tgt.bone_target
+                    tgt.bone_target = flip_bone_name(tgt.id, src_tgt.bone_target)
             else:
                 tgt.data_path = src_tgt.data_path
                 # Flip Data Path string if it contains stereo naming
                 if src_tgt.data_path:
-                    # Naive replace for common patterns if flip_name fails on full string
-                    # Try flipping segments or full string
-                    flipped_path = flip_name(src_tgt.data_path)
+                    # Only the quoted ["..."] names are flipped, e.g. ["Key.L"] -> ["Key.R"]
+                    flipped_path = flip_data_path(src_tgt.data_path)
+                    if not flipped_path and "[" not in src_tgt.data_path:
+                        flipped_path = flip_name(src_tgt.data_path) # Plain property name, e.g. "squash_L"
                     if flipped_path:
                         tgt.data_path = flipped_path
-                    else:
-                        # Try manual sub-string replace (safer)
-                        # e.g. ["Key.L"] -> ["Key.R"]
-                        val = src_tgt.data_path
-                        if ".L" in val: tgt.data_path = val.replace(".L", ".R")
-                        elif ".R" in val: tgt.data_path = val.replace(".R", ".L")
-                        elif "_L" in val: tgt.data_path = val.replace("_L", "_R")
-                        elif "_R" in val: tgt.data_path = val.replace("_R", "_L")
+                    
+                    # Mirrored hub inputs must exist on the opposite bone
+                    ensure_hub_for_path(tgt.id, tgt.data_path)
                         
                 if src_tgt.bone_target:
-                    tgt.bone_target = flip_name(src_tgt.bone_target) or src_tgt.bone_target
+                    tgt.bone_target = flip_bone_name(tgt.id, src_tgt.bone_target)
     
     # Remove modifiers
-    for mod in target_fcurve.modifiers:
+    for mod in list(target_fcurve.modifiers):
         target_fcurve.modifiers.remove(mod)
         
     # Copy keyframes
     # Flip X values if inverted (e.g. Rotate Z -> -Rotate Z)
-    for kp in source_fcurve.keyframe_points:
-        x_val = -kp.co[0] if invert_values else kp.co[0]
-        target_fcurve.keyframe_points.insert(x_val, kp.co[1])
-        
-    # Set interpolation
-    for i, kp in enumerate(target_fcurve.keyframe_points):
-        if i < len(source_fcurve.keyframe_points):
-            kp.interpolation = source_fcurve.keyframe_points[i].interpolation
+    if HAS_NUMPY:
+        keys = read_keyframes(source_fcurve)
+        if invert_values:
+            keys = reflect_keyframes(keys, 0.0)
+        write_keyframes(target_fcurve, keys)
+    else:
+        for kp in source_fcurve.keyframe_points:
+            x_val = -kp.co[0] if invert_values else kp.co[0]
+            target_fcurve.keyframe_points.insert(x_val, kp.co[1])
             
+        # Set interpolation
+        for i, kp in enumerate(target_fcurve.keyframe_points):
+            if i < len(source_fcurve.keyframe_points):
+                kp.interpolation = source_fcurve.keyframe_points[i].interpolation
+            
+    target_fcurve.extrapolation = source_fcurve.extrapolation
     target_fcurve.update()
 
+# --- BULK KEYFRAME ARRAYS ---
+# Whole F-Curves are read and written with foreach_get/foreach_set.
+# Segment attributes (interpolation, easing, back ...) belong to the key that starts the segment.
+KEYFRAME_VECTOR_ATTRS = ("co", "handle_left", "handle_right")
+KEYFRAME_SEGMENT_ATTRS = ("interpolation", "easing", "back", "amplitude", "period")
+KEYFRAME_HANDLE_TYPE_ATTRS = ("handle_left_type", "handle_right_type")
+_INT_ATTRS = {"interpolation", "easing", "handle_left_type", "handle_right_type"}
+
+def _keyframe_enum_value(attr, identifier):
+    return bpy.types.Keyframe.bl_rna.properties[attr].enum_items[identifier].value
+
+def _easing_value(identifier):
+    return _keyframe_enum_value("easing", identifier)
+
+def read_keyframes(fcurve):
+    """All keyframe data of an F-Curve as numpy arrays (vectors shaped (n, 2))"""
+    kps = fcurve.keyframe_points
+    n = len(kps)
+    keys = {}
+    for attr in KEYFRAME_VECTOR_ATTRS:
+        arr = np.empty(n * 2, dtype=np.float32)
+        kps.foreach_get(attr, arr)
+        keys[attr] = arr.reshape(n, 2)
+    for attr in KEYFRAME_SEGMENT_ATTRS + KEYFRAME_HANDLE_TYPE_ATTRS:
+        arr = np.empty(n, dtype=np.int32 if attr in _INT_ATTRS else np.float32)
+        kps.foreach_get(attr, arr)
+        keys[attr] = arr
+    return keys
+
+def write_keyframes(fcurve, keys):
+    """Replace all keyframes of an F-Curve with 'keys' (as returned by read_keyframes)"""
+    kps = fcurve.keyframe_points
+    if hasattr(kps, "clear"):
+        kps.clear()
+    else:
+        for kp in reversed(list(kps)):
+            kps.remove(kp, fast=True)
+            
+    n = len(keys["co"])
+    if n:
+        kps.add(n)
+        for attr in KEYFRAME_VECTOR_ATTRS:
+            kps.foreach_set(attr, np.ascontiguousarray(keys[attr], dtype=np.float32).ravel())
+        for attr in KEYFRAME_SEGMENT_ATTRS + KEYFRAME_HANDLE_TYPE_ATTRS:
+            kps.foreach_set(attr, np.ascontiguousarray(keys[attr]))
+    fcurve.update()
+
+def linear_keyframes(co):
+    """Keyframe arrays (for write_keyframes) of linearly interpolated keys at the (n, 2) points 'co'"""
+    co = np.ascontiguousarray(co, dtype=np.float32)
+    n = len(co)
+    keys = {"co": co, "handle_left": co.copy(), "handle_right": co.copy()}
+    for attr, identifier in (("interpolation", 'LINEAR'), ("easing", 'AUTO'),
+                             ("handle_left_type", 'VECTOR'), ("handle_right_type", 'VECTOR')):
+        keys[attr] = np.full(n, _keyframe_enum_value(attr, identifier), dtype=np.int32)
+    for attr in ("back", "amplitude", "period"):
+        keys[attr] = np.full(n, bpy.types.Keyframe.bl_rna.properties[attr].default, dtype=np.float32)
+    return keys
+
+def reflect_keyframes(keys, pivot_sum):
+    """Mirror keyframe arrays in time (x -> pivot_sum - x), keeping keys sorted.
+
+    The key order is reversed, left/right handles and handle types swap, and segment
+    attributes move to the new segment start with EASE_IN/EASE_OUT exchanged.
+    """
+    out = {}
+    co = keys["co"][::-1].copy()
+    co[:, 0] = pivot_sum - co[:, 0]
+    out["co"] = co
+    for new, old in (("handle_left", "handle_right"), ("handle_right", "handle_left")):
+        h = keys[old][::-1].copy()
+        h[:, 0] = pivot_sum - h[:, 0]
+        out[new] = h
+    out["handle_left_type"] = keys["handle_right_type"][::-1].copy()
+    out["handle_right_type"] = keys["handle_left_type"][::-1].copy()
+    
+    # Segment i of the reflected curve is old segment n-2-i
+    for attr in KEYFRAME_SEGMENT_ATTRS:
+        out[attr] = np.roll(keys[attr][::-1], -1)
+        
+    easing = out["easing"]
+    ease_in, ease_out = _easing_value('EASE_IN'), _easing_value('EASE_OUT')
+    out["easing"] = np.where(easing == ease_in, ease_out, np.where(easing == ease_out, ease_in, easing)).astype(np.int32)
+    return out
+
+# --- SHAPE KEY ARRAYS ---
+def read_coords(data, count):
+    """(count, 3) float32 array of 'co' from vertices or shape key data"""
+    arr = np.empty(count * 3, dtype=np.float32)
+    data.foreach_get("co", arr)
+    return arr.reshape(count, 3)
+
+def write_coords(key_block, co):
+    key_block.data.foreach_set("co", np.ascontiguousarray(co, dtype=np.float32).ravel())
+
+def vertex_group_weight_matrix(obj, group_names):
+    """(K, V) weights of K vertex groups read in one pass over the vertices, 0.0 where unassigned"""
+    weights = np.zeros((len(group_names), len(obj.data.vertices)), dtype=np.float32)
+    rows = {}
+    for row, name in enumerate(group_names):
+        vg = obj.vertex_groups.get(name)
+        if vg is not None:
+            rows[vg.index] = row
+    if not rows:
+        return weights
+    for v in obj.data.vertices:
+        for g in v.groups:
+            row = rows.get(g.group)
+            if row is not None:
+                weights[row, v.index] = g.weight
+    return weights
+
+def vertex_group_weights(obj, group_name):
+    """(V,) weights of a vertex group, 0.0 for vertices not in the group"""
+    return vertex_group_weight_matrix(obj, [group_name])[0]
+
+def shape_delta(obj, key_block):
+    """Offset a key adds at value 1.0: (key - relative key), scaled by the key's vertex group"""
+    n = len(obj.data.vertices)
+    delta = read_coords(key_block.data, n) - read_coords(key_block.relative_key.data, n)
+    if key_block.vertex_group:
+        delta *= vertex_group_weights(obj, key_block.vertex_group)[:, None]
+    return delta
+
+def basis_coords(obj):
+    """Rest shape of a mesh: the reference key if there are shape keys, else the vertices"""
+    mesh = obj.data
+    n = len(mesh.vertices)
+    if mesh.shape_keys:
+        return read_coords(mesh.shape_keys.reference_key.data, n)
+    return read_coords(mesh.vertices, n)
+
+# Key custom property listing combos captured for sculpting: {combo key name: show_only_shape_key before}
+COMBO_SCULPT_PROP = "_sdk_combo_sculpt"
+
+def add_combo_driver(key, shape_name, inputs):
+    """Drive a shape key by the product of the input shape key values: A * B (* C ...)"""
+    fcurve = key.driver_add(f'key_blocks["{shape_name}"].value')
+    drv = fcurve.driver
+    drv.type = 'SCRIPTED'
+
+    var_names = []
+    for i, input_name in enumerate(inputs):
+        var = drv.variables.new()
+        var.name = chr(ord("A") + i)
+        var.type = 'SINGLE_PROP'
+        var.targets[0].id_type = 'KEY'
+        var.targets[0].id = key
+        var.targets[0].data_path = f'key_blocks["{input_name}"].value'
+        var_names.append(var.name)
+
+    drv.expression = " * ".join(var_names)
+    return fcurve
+
+def combo_map(key):
+    """{frozenset of input names: combo key name} for every combo key of a Key datablock"""
+    combos = {}
+    for kb in key.key_blocks:
+        inputs = combo_inputs(key, kb.name)
+        if inputs:
+            combos.setdefault(frozenset(inputs), kb.name)
+    return combos
+
+def combo_inputs(key, key_name):
+    """Input shape key names of a combo key (driver = product of shape key values), or None"""
+    if not key.animation_data:
+        return None
+    fc = key.animation_data.drivers.find(f'key_blocks["{key_name}"].value')
+    if not fc or fc.driver.type != 'SCRIPTED' or len(fc.driver.variables) < 2:
+        return None
+
+    inputs = {}
+    for var in fc.driver.variables:
+        tgt = var.targets[0]
+        if var.type != 'SINGLE_PROP' or tgt.id != key or not tgt.data_path.startswith('key_blocks["'):
+            return None
+        inputs[var.name] = tgt.data_path[len('key_blocks["'):-len('"].value')]
+
+    factors = [f.strip() for f in fc.driver.expression.split("*")]
+    if sorted(factors) != sorted(inputs):
+        return None
+    return [inputs[f] for f in factors]
+
+def combo_lower_orders(key, inputs):
+    """Combo keys built from a strict subset of 'inputs' (fully active whenever all inputs are)"""
+    wanted = set(inputs)
+    lower = []
+    for kb in key.key_blocks:
+        sub = combo_inputs(key, kb.name)
+        if sub and set(sub) < wanted:
+            lower.append(kb)
+    return lower
+
+def inbetween_info(key, key_name):
+    """(parent shape key name, trigger value) of an in-between key, or None"""
+    if not key.animation_data:
+        return None
+    fc = key.animation_data.drivers.find(f'key_blocks["{key_name}"].value')
+    if not fc or fc.driver.type != 'SUM' or len(fc.driver.variables) != 1:
+        return None
+
+    var = fc.driver.variables[0]
+    tgt = var.targets[0]
+    if var.type != 'SINGLE_PROP' or tgt.id != key or not tgt.data_path.startswith('key_blocks["'):
+        return None
+
+    peaks = [kp.co[0] for kp in fc.keyframe_points if kp.co[1] == 1.0]
+    if len(peaks) != 1:
+        return None
+    return tgt.data_path[len('key_blocks["'):-len('"].value')], peaks[0]
+
+def inbetween_chain(key, parent_name):
+    """[(trigger, key name)] of all in-betweens of a parent shape, sorted by trigger"""
+    chain = []
+    for kb in key.key_blocks:
+        info = inbetween_info(key, kb.name)
+        if info and info[0] == parent_name:
+            chain.append((info[1], kb.name))
+    return sorted(chain)
+
+def inbetween_curve_points(triggers):
+    """Piecewise-linear driver points for a sorted chain of in-between triggers.
+
+    Each in-between peaks at its trigger and fades to 0 at the neighbouring triggers
+    (0.0 and 1.0 at the ends), so exactly one in-between is fully on at each trigger.
+    """
+    points = []
+    for i, t in enumerate(triggers):
+        lo = triggers[i - 1] if i else 0.0
+        hi = triggers[i + 1] if i + 1 < len(triggers) else 1.0
+        pts = [(t, 1.0)]
+        if lo < t:
+            pts.insert(0, (lo, 0.0))
+        if hi > t:
+            pts.append((hi, 0.0))
+        points.append(pts)
+    return points
+
+def set_inbetween_curves(key, chain):
+    """Rewrite the driver curves of a whole in-between chain [(trigger, key name)] in one go"""
+    for (_, name), pts in zip(chain, inbetween_curve_points([t for t, _ in chain])):
+        fcurve = key.animation_data.drivers.find(f'key_blocks["{name}"].value')
+        kps = fcurve.keyframe_points
+        for kp in reversed(list(kps)):
+            kps.remove(kp, fast=True)
+        kps.add(len(pts))
+        for kp, co in zip(kps, pts):
+            kp.co = co
+            kp.interpolation = 'LINEAR'
+        fcurve.update()
+
+def corrective_parts(key, key_name):
+    """[(shape key, weight)] that a corrective is sculpted on top of, or None if it is no corrective.
+
+    Combos: their inputs and lower-order combos at 1.0. In-betweens: their parent at the trigger.
+    """
+    inputs = combo_inputs(key, key_name)
+    if inputs:
+        return [(key.key_blocks[n], 1.0) for n in inputs] + [(kb, 1.0) for kb in combo_lower_orders(key, inputs)]
+    info = inbetween_info(key, key_name)
+    if info and info[0] in key.key_blocks:
+        return [(key.key_blocks[info[0]], info[1])]
+    return None
+
+def mix_coords(obj, values):
+    """Shape mix for the given {key name: value}, keys not listed at 0.
+
+    Relative keys, vertex groups and mute are respected and values are clamped to the
+    slider range. Drivers are not evaluated: the values are used as given. Only keys with
+    a non-zero value (and their relative keys) are read.
+    """
+    key = obj.data.shape_keys
+    key_blocks = key.key_blocks
+    n = len(obj.data.vertices)
+
+    active = []
+    for name, value in values.items():
+        kb = key_blocks.get(name)
+        if kb is None or kb == key.reference_key or kb.mute:
+            continue
+        value = min(max(value, kb.slider_min), kb.slider_max)
+        if value != 0.0:
+            active.append((kb, value))
+
+    coords = {key.reference_key.name: basis_coords(obj)}
+    def read(kb):
+        if kb.name not in coords:
+            coords[kb.name] = read_coords(kb.data, n)
+        return coords[kb.name]
+
+    # All vertex groups of the active keys in one pass over the vertices
+    groups = sorted({kb.vertex_group for kb, _ in active if kb.vertex_group})
+    weights = dict(zip(groups, vertex_group_weight_matrix(obj, groups))) if groups else {}
+
+    result = coords[key.reference_key.name].copy()
+    for kb, value in active:
+        delta = read_coords(kb.data, n) - read(kb.relative_key)
+        if kb.vertex_group:
+            delta *= weights[kb.vertex_group][:, None]
+        result += value * delta
+    return result
+
+def keys_driven_by(key, names):
+    """Names of the keys of 'key' whose value drivers read any of 'names', directly or through other driven keys"""
+    if not key.animation_data:
+        return set()
+    readers = {}
+    for fc in key.animation_data.drivers:
+        if fc.data_path.startswith('key_blocks["') and fc.data_path.endswith('"].value'):
+            paths = [tgt.data_path for var in fc.driver.variables for tgt in var.targets]
+            readers[fc.data_path[len('key_blocks["'):-len('"].value')]] = paths
+
+    found, pending = set(), set(names)
+    while pending:
+        tokens = [f'key_blocks["{n}"]' for n in pending]
+        pending = {name for name, paths in readers.items()
+                   if name not in found and any(t in p for p in paths for t in tokens)}
+        found |= pending
+    return found
+
+def shape_key_reference_count(key, key_name):
+    """Number of driver variables that read the given shape key"""
+    return sum(1 for _ in _shape_key_targets(key, key_name))
+
+def repoint_shape_key_references(key, old_name, new_name):
+    """Make driver variables reading key_blocks["old_name"] read key_blocks["new_name"]. Returns the count."""
+    old_token, new_token = f'key_blocks["{old_name}"]', f'key_blocks["{new_name}"]'
+    targets = list(_shape_key_targets(key, old_name))
+    for tgt in targets:
+        tgt.data_path = tgt.data_path.replace(old_token, new_token)
+    return len(targets)
+
+# Object custom property enabling the live mirror link (value: 'LEFT' / 'RIGHT' source side)
+MIRROR_LINK_PROP = "_sdk_mirror_link"
+
+# Transform channels whose value changes sign on the mirrored (X-flipped) side
+MIRROR_FLIP_CHANNELS = {'LOC_X', 'ROT_Y', 'ROT_Z', 'ROT_W'}
+
+def mirrored_input_flip(driver):
+    """Transform channel that makes the mirrored driver input move the opposite way, or None"""
+    if driver.type not in {'SCRIPTED', 'AVERAGE'}:
+        return None
+    for v in driver.variables:
+        tt = None
+        if v.type == 'TRANSFORMS':
+            tt = v.targets[0].transform_type
+        elif v.type == 'SINGLE_PROP':
+            # Driver hub input carries its channel in the property name
+            tt = hub_transform_type(v.targets[0].data_path)
+        if tt in MIRROR_FLIP_CHANNELS:
+            return tt
+    return None
+
+def create_mirrored_shape(obj, source_key_name, target_key_name, use_topology=False):
+    """Write a mirrored copy of a shape key (geometry only) and return the target key block.
+
+    With numpy the cached symmetry map is used and an existing target key is overwritten.
+    Without it the key is mirrored with the shape_key_mirror operator into a new key.
+    """
+    if HAS_NUMPY:
+        from .symmetry import mirror_shape_key
+        return mirror_shape_key(obj, source_key_name, target_key_name, use_topology)
+        
+    key_blocks = obj.data.shape_keys.key_blocks
+    stored_values = {kb.name: kb.value for kb in key_blocks}
+    
+    # Isolate the source so 'from_mix' only captures it
+    for kb in key_blocks:
+        kb.value = 0.0
+    key_blocks[source_key_name].value = 1.0
+    
+    new_key_block = obj.shape_key_add(name=target_key_name, from_mix=True)
+    
+    obj.active_shape_key_index = key_blocks.find(new_key_block.name)
+    bpy.ops.object.shape_key_mirror(use_topology=use_topology)
+    
+    for k, v in stored_values.items():
+        key_blocks[k].value = v
+    return new_key_block
+
 def mirror_shape_driver_logic(self, context, driver_obj, driven_obj, source_key_name, target_key_name, invert_values=False):
     """Specific logic for mirroring Shape Key drivers"""
     key_data = driven_obj.data.shape_keys
@@ -157,3 +537,496 @@ def mirror_shape_driver_logic(self, context, driver_obj, driven_obj, source_key_
     copy_driver_to_fcurve(source_fcurve, target_fcurve, invert_values)
     
     return True, "Success"
+
+def iter_sdk_drivers():
+    """Yield (owner_id, fcurve, kind) for every driver created by this addon.
+
+    kind is 'SHAPE' for shape key value drivers, 'INFLUENCE' for SDK Action constraint drivers
+    and 'HUB' for driver hub channel properties.
+    """
+    for key in bpy.data.shape_keys:
+        if not key.animation_data:
+            continue
+        for fc in key.animation_data.drivers:
+            if fc.data_path.startswith('key_blocks["') and fc.data_path.endswith('.value'):
+                yield key, fc, 'SHAPE'
+
+    for obj in bpy.data.objects:
+        if not obj.animation_data:
+            continue
+        for fc in obj.animation_data.drivers:
+            if '.constraints["SDK' in fc.data_path and fc.data_path.endswith('.influence'):
+                yield obj, fc, 'INFLUENCE'
+            elif HUB_PREFIX in fc.data_path:
+                yield obj, fc, 'HUB'
+
+def simplify_driver_expression(drv):
+    """Rewrite a SCRIPTED driver into simple-expression form if possible. Returns True if changed."""
+    from .expressions import simplify_expression
+    
+    if drv.type != 'SCRIPTED' or drv.is_simple_expression:
+        return False
+        
+    old_expr = drv.expression
+    new_expr = simplify_expression(old_expr, [v.name for v in drv.variables])
+    if not new_expr:
+        return False
+        
+    drv.expression = new_expr
+    if not drv.is_simple_expression:
+        # Blender disagrees with our grammar check, keep the original
+        drv.expression = old_expr
+        return False
+    return True
+
+def set_influence_mapping(fcurve, rest, target, mode='EXPRESSION'):
+    """Map the driver input linearly to 0..1 between 'rest' and 'target' (clamped).
+
+    EXPRESSION: SCRIPTED clamp((var - rest) / denom, 0, 1)
+    FCURVE: AVERAGE driver + two LINEAR keys, clamped by CONSTANT extrapolation
+    """
+    drv = fcurve.driver
+    
+    # Safety: Avoid division by zero / overlapping keys
+    denom = target - rest
+    if abs(denom) < 0.0001:
+        denom = 1.0
+        target = rest + denom
+    
+    # Default driver Generator modifier would override the keyframes
+    for mod in list(fcurve.modifiers):
+        fcurve.modifiers.remove(mod)
+        
+    while len(fcurve.keyframe_points) > 0:
+        fcurve.keyframe_points.remove(fcurve.keyframe_points[0])
+        
+    if mode == 'FCURVE':
+        drv.type = 'AVERAGE'
+        
+        for x, y in ((rest, 0.0), (target, 1.0)):
+            kp = fcurve.keyframe_points.insert(x, y)
+            kp.interpolation = 'LINEAR'
+            
+        fcurve.extrapolation = 'CONSTANT'
+    else:
+        drv.type = 'SCRIPTED'
+        drv.expression = f"clamp((var - {rest:.3f}) / {denom:.4f}, 0, 1)"
+        
+    fcurve.update()
+
+_INFLUENCE_EXPR = re.compile(r'clamp\(\((\(-var\)|var) - (-?[\d.]+)\) / (-?[\d.]+), 0, 1\)')
+
+def read_influence_mapping(fcurve):
+    """Return (rest, target) driver values of an influence mapping, or None if unrecognized"""
+    kps = fcurve.keyframe_points
+    if len(kps) >= 2:
+        # F-Curve mapping: the 0 key is rest, the 1 key is target
+        rest = target = None
+        for kp in kps:
+            if abs(kp.co[1]) < 1e-6 and rest is None: rest = kp.co[0]
+            elif abs(kp.co[1] - 1.0) < 1e-6 and target is None: target = kp.co[0]
+        if rest is not None and target is not None:
+            return rest, target
+        return None
+        
+    if fcurve.driver.type != 'SCRIPTED':
+        return None
+        
+    m = _INFLUENCE_EXPR.search(fcurve.driver.expression)
+    if not m:
+        return None
+        
+    rest = float(m.group(2))
+    target = rest + float(m.group(3))
+    if m.group(1) == "(-var)":
+        # Mirrored with inverted input: clamp((-var - r) / d) == clamp((var + r) / -d)
+        rest, target = -rest, -target
+    return rest, target
+
+# --- DRIVER INPUT HUB ---
+# One custom property per driver channel, driven once by a TRANSFORMS variable.
+# SDK drivers read it with a cheap SINGLE_PROP variable instead of re-decomposing the matrix.
+HUB_PREFIX = "_SDK_HUB_"
+_HUB_PATH = re.compile(r'\["' + HUB_PREFIX + r'(\w+)"\]$')
+
+def hub_data_path(driver_obj, bone_name, transform_type):
+    """Data path (relative to driver_obj) of the hub property for a channel"""
+    prop_name = f"{HUB_PREFIX}{transform_type}"
+    if driver_obj.type == 'ARMATURE' and bone_name:
+        return f'pose.bones["{bone_name}"]["{prop_name}"]'
+    return f'["{prop_name}"]'
+
+def hub_transform_type(data_path):
+    """Return the transform type encoded in a hub data path, or None"""
+    m = _HUB_PATH.search(data_path or "")
+    return m.group(1) if m else None
+
+def ensure_driver_hub(driver_obj, bone_name, transform_type):
+    """Create the hub property and its driver if missing. Returns the hub data path."""
+    prop_name = f"{HUB_PREFIX}{transform_type}"
+    full_path = hub_data_path(driver_obj, bone_name, transform_type)
+    
+    owner = driver_obj
+    if driver_obj.type == 'ARMATURE' and bone_name:
+        owner = driver_obj.pose.bones.get(bone_name)
+        if owner is None:
+            return None
+            
+    if prop_name not in owner:
+        owner[prop_name] = 0.0
+        
+    # Already driven?
+    if driver_obj.animation_data:
+        for fc in driver_obj.animation_data.drivers:
+            if fc.data_path == full_path:
+                return full_path
+                
+    fc = owner.driver_add(f'["{prop_name}"]')
+    drv = fc.driver
+    drv.type = 'AVERAGE'
+    
+    var = drv.variables[0] if len(drv.variables) > 0 else drv.variables.new()
+    var.name = "var"
+    var.type = 'TRANSFORMS'
+    target = var.targets[0]
+    target.id = driver_obj
+    if driver_obj.type == 'ARMATURE' and bone_name:
+        target.bone_target = bone_name
+    target.transform_type = transform_type
+    target.transform_space = 'LOCAL_SPACE'
+    
+    return full_path
+
+def ensure_hub_for_path(driver_obj, data_path):
+    """Make sure a (mirrored) hub path read by a SINGLE_PROP variable actually exists"""
+    transform_type = hub_transform_type(data_path)
+    if not transform_type or not driver_obj or not hasattr(driver_obj, "pose"):
+        return
+    m = re.match(r'pose\.bones\["(.+?)"\]', data_path)
+    ensure_driver_hub(driver_obj, m.group(1) if m else "", transform_type)
+
+def flip_data_path(path):
+    """Flip L/R names inside the quoted ["..."] segments of an RNA path only"""
+    changed = False
+    
+    def repl(m):
+        nonlocal changed
+        flipped = flip_name(m.group(1))
+        if flipped and not flipped.startswith(HUB_PREFIX):
+            changed = True
+            return f'["{flipped}"]'
+        return m.group(0)
+        
+    new_path = re.sub(r'\["(.+?)"\]', repl, path)
+    return new_path if changed else None
+
+# --- MULTI-KEY POSE SDKs ---
+# Driver values map to action frames through the constraint's min/max range (or its
+# eval_time driver curve), so any number of poses fit in one action. New SDKs start on
+# the identity frames (frame = value * frames_per_unit); mirrored ones keep their own
+# reflected / inverted mapping (see sdk_range).
+MULTIKEY_FRAMES_PER_UNIT = 100.0
+MULTIKEY_FRAMES_PER_DEGREE = 10.0 # Action constraint reads rotation channels in degrees
+
+def is_multikey_sdk(armature, pb, const):
+    """Multi-key SDKs map the driver through the constraint range instead of driving influence"""
+    if const.type != 'ACTION' or not const.action:
+        return False
+    if not const.use_eval_time:
+        return True
+    # Custom property inputs drive eval_time instead
+    if armature.animation_data:
+        return armature.animation_data.drivers.find(f'pose.bones["{pb.name}"].constraints["{const.name}"].eval_time') is not None
+    return False
+
+def multikey_reflect_pivot(armature, pb, const, invert=False):
+    """Time pivot (frame_start + frame_end) for mirroring a channel-range multi-key SDK, or None.
+
+    The mirrored input of X-Location / Y/Z-Rotation channels moves the opposite way,
+    so the mirrored keys are reflected in time around the constraint range.
+    """
+    if const.use_eval_time or not is_multikey_sdk(armature, pb, const):
+        return None
+    if invert or const.transform_channel in {'LOCATION_X', 'ROTATION_Y', 'ROTATION_Z'}:
+        return const.frame_start + const.frame_end
+    return None
+
+def _multikey_rotation(const):
+    return not const.use_eval_time and const.transform_channel.startswith('ROTATION')
+
+def _multikey_eval_fcurve(armature, pb, const):
+    if not armature.animation_data:
+        return None
+    return armature.animation_data.drivers.find(f'pose.bones["{pb.name}"].constraints["{const.name}"].eval_time')
+
+def multikey_mapping(armature, pb, const, fresh=False):
+    """(scale, offset) driver value -> action frame mapping of a multi-key SDK.
+
+    Read from the constraint range (eval_time: its driver curve) once the action has keys,
+    the identity frames for a fresh SDK. Rotation channel values are in degrees.
+    """
+    identity = (MULTIKEY_FRAMES_PER_DEGREE if _multikey_rotation(const) else MULTIKEY_FRAMES_PER_UNIT, 0.0)
+    if fresh or not any(len(fc.keyframe_points) for fc in const.action.fcurves):
+        return identity
+
+    if const.use_eval_time:
+        eval_fc = _multikey_eval_fcurve(armature, pb, const)
+        values = read_influence_mapping(eval_fc) if eval_fc else None
+    else:
+        values = (const.min, const.max)
+    mapping = range_mapping(*values, const.frame_start, const.frame_end) if values else None
+    return mapping or identity
+
+def multikey_frame(armature, pb, const, driver_value, mapping=None):
+    """Action frame holding the pose for a driver value"""
+    if mapping is None:
+        mapping = multikey_mapping(armature, pb, const)
+    return value_to_frame(mapping, math.degrees(driver_value) if _multikey_rotation(const) else driver_value)
+
+def update_multikey_range(armature, pb, const, mapping=None):
+    """Fit the constraint range around all keys of its action.
+
+    'mapping' is the one the keys were placed with (default: the current one); it is kept,
+    so mirrored and inverted SDKs keep their sign and direction.
+    """
+    frames = [kp.co[0] for fc in const.action.fcurves for kp in fc.keyframe_points]
+    if not frames:
+        return
+    if mapping is None:
+        mapping = multikey_mapping(armature, pb, const)
+        
+    start, end, value_start, value_end = fit_frame_range(mapping, frames)
+    const.frame_start = start
+    const.frame_end = end
+    
+    if const.use_eval_time:
+        # eval_time is a 0..1 factor: map driver range -> factor with a linear F-Curve
+        eval_fc = _multikey_eval_fcurve(armature, pb, const)
+        if eval_fc:
+            set_influence_mapping(eval_fc, value_start, value_end, 'FCURVE')
+        return
+        
+    const.min = value_start
+    const.max = value_end
+
+def find_action_fcurve(action, path, index):
+    """Find an action F-Curve by property name (full 'pose.bones[..].prop' or relative 'prop' path)"""
+    for fc in action.fcurves:
+        if fc.array_index == index and (fc.data_path == path or fc.data_path.endswith("." + path)):
+            return fc
+    return None
+
+def reflect_fcurve_time(fcurve, pivot_sum):
+    """Mirror keyframes in time: x -> pivot_sum - x (handles swap sides)"""
+    mirror_fcurve_keys(fcurve, 1.0, pivot_sum)
+
+def mirror_channel_sign(data_path, index):
+    """-1.0 for pose channels whose value changes sign on the X-mirrored side, else 1.0"""
+    if "location" in data_path and index == 0: return -1.0
+    if "rotation_euler" in data_path and index in {1, 2}: return -1.0
+    # Quaternion / Axis Angle (W, X, Y, Z): X-mirror flips the Y and Z components
+    if "rotation_quaternion" in data_path and index in {2, 3}: return -1.0
+    if "rotation_axis_angle" in data_path and index in {2, 3}: return -1.0
+    return 1.0
+
+def mirror_fcurve_keys(fcurve, sign=1.0, pivot_sum=None):
+    """Scale key values by 'sign' and optionally reflect the keys in time, in one bulk read/write"""
+    if sign == 1.0 and pivot_sum is None:
+        return
+        
+    if HAS_NUMPY:
+        keys = read_keyframes(fcurve)
+        if pivot_sum is not None:
+            keys = reflect_keyframes(keys, pivot_sum)
+        for attr in KEYFRAME_VECTOR_ATTRS:
+            keys[attr][:, 1] *= sign
+        write_keyframes(fcurve, keys)
+        return
+        
+    for kp in fcurve.keyframe_points:
+        left, right = kp.handle_left[:], kp.handle_right[:]
+        left_type, right_type = kp.handle_left_type, kp.handle_right_type
+        kp.co[1] *= sign
+        if pivot_sum is not None:
+            kp.co[0] = pivot_sum - kp.co[0]
+            left, right = (pivot_sum - right[0], right[1]), (pivot_sum - left[0], left[1])
+            left_type, right_type = right_type, left_type
+        kp.handle_left = (left[0], left[1] * sign)
+        kp.handle_right = (right[0], right[1] * sign)
+        kp.handle_left_type = left_type
+        kp.handle_right_type = right_type
+    fcurve.update()
+
+# --- IN-PLACE KEY EDITING ---
+AUTO_HANDLE_TYPES = {'AUTO', 'AUTO_CLAMPED'}
+
+def find_keyframe(fcurve, x, tolerance=1e-4):
+    """Binary search the (sorted) keyframes of an F-Curve for a key at x"""
+    kps = fcurve.keyframe_points
+    lo, hi = 0, len(kps) - 1
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        mx = kps[mid].co[0]
+        if abs(mx - x) <= tolerance:
+            return kps[mid]
+        if mx < x:
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    return None
+
+def set_keyframe_value(fcurve, kp, value):
+    """Overwrite a key value in place, moving its handles with it"""
+    dy = value - kp.co[1]
+    kp.co[1] = value
+    kp.handle_left[1] += dy
+    kp.handle_right[1] += dy
+    
+    # Auto handles depend on the neighbours, only those need a recalculation
+    if kp.interpolation == 'BEZIER' and (kp.handle_left_type in AUTO_HANDLE_TYPES or kp.handle_right_type in AUTO_HANDLE_TYPES):
+        fcurve.update()
+
+def compose_pose_value(current, base_val, path, index):
+    """Visible pose value: SDK action value combined with the bone's base transform offset"""
+    if "scale" in path:
+        return current * base_val
+    identity = 1.0 if ("quaternion" in path and index == 0) else 0.0
+    return current + (base_val - identity)
+
+def decompose_pose_value(visible, base_val, path, index):
+    """Inverse of compose_pose_value: SDK action value that produces 'visible' on top of the base"""
+    if "scale" in path:
+        return visible / base_val if abs(base_val) > 1e-6 else visible
+    identity = 1.0 if ("quaternion" in path and index == 0) else 0.0
+    return visible - (base_val - identity)
+
+# --- RIG BUILD TRANSACTIONS ---
+# While a transaction is open, depsgraph updates and debug output are deferred
+# and the commit performs a single view layer update and undo push.
+# The state is reset on file load and (re)registration; the deferred ID references
+# are dropped on undo/redo, which invalidates them (see batch_ops handlers).
+_batch_state = {"depth": 0, "dirty": set()}
+
+def batch_active():
+    return _batch_state["depth"] > 0
+
+def batch_depth():
+    return _batch_state["depth"]
+
+def reset_batch():
+    """Forget any open transaction without flushing it"""
+    _batch_state["depth"] = 0
+    _batch_state["dirty"].clear()
+
+def drop_batch_ids():
+    """Drop deferred ID references (stale after undo, redo or file load); the commit still updates the view layer"""
+    _batch_state["dirty"].clear()
+
+def log_debug(msg):
+    """Debug output, silenced while a rig build transaction is open"""
+    if not batch_active():
+        print(msg)
+
+def request_update(context, *ids):
+    """Tag IDs and update the view layer, or defer both to the transaction commit"""
+    if batch_active():
+        _batch_state["dirty"].update(i for i in ids if i)
+        return
+    for id_data in ids:
+        if id_data:
+            id_data.update_tag()
+    context.view_layer.update()
+
+def begin_batch():
+    _batch_state["depth"] += 1
+
+def end_batch(context, push_undo=True, message="Rig Build", close_all=False):
+    """Close a transaction (or every nested one). The outermost commit flushes all deferred updates."""
+    if _batch_state["depth"] == 0:
+        return False
+    _batch_state["depth"] = 0 if close_all else _batch_state["depth"] - 1
+    if _batch_state["depth"] > 0:
+        return False
+        
+    for id_data in _batch_state["dirty"]:
+        try:
+            id_data.update_tag()
+        except ReferenceError:
+            # Removed during the build
+            pass
+    _batch_state["dirty"].clear()
+    
+    context.view_layer.update()
+    if push_undo:
+        bpy.ops.ed.undo_push(message=message)
+    return True
+
+# --- DRIVER INPUT ---
+_TRANSFORM_PREFIXES = (("location", 'LOC'), ("rotation", 'ROT'), ("scale", 'SCALE'))
+
+def parse_transform_path(raw_path):
+    """Return (is_transform, transform_type, component) for a driver data path like 'rotation_euler[1]'"""
+    for prefix, t_prefix in _TRANSFORM_PREFIXES:
+        if raw_path.startswith(prefix): # rotation_euler / rotation_quaternion alike
+            for i, axis in enumerate("XYZ"):
+                if f"[{i}]" in raw_path:
+                    return True, f"{t_prefix}_{axis}", i
+            return True, None, 0
+    return False, None, 0
+
+def read_driver_input(driver_obj, bone_name, raw_path):
+    """Current value of the driver channel, matching what a LOCAL_SPACE TRANSFORMS variable reads.
+
+    Raises ValueError if the path cannot be resolved.
+    """
+    is_transform, transform_type, component = parse_transform_path(raw_path)
+    
+    pb = None
+    if driver_obj.type == 'ARMATURE' and bone_name:
+        pb = driver_obj.pose.bones.get(bone_name)
+        
+    if is_transform and transform_type:
+        if pb:
+            matrix, rot_mode = pb.matrix_basis, pb.rotation_mode
+        elif driver_obj.type == 'ARMATURE' and bone_name:
+            return 0.0
+        else:
+            matrix, rot_mode = driver_obj.matrix_basis, driver_obj.rotation_mode
+            
+        if transform_type.startswith("LOC"):
+            return matrix.to_translation()[component]
+        if transform_type.startswith("ROT"):
+            safe_mode = rot_mode if rot_mode in {'XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX'} else 'XYZ'
+            return matrix.to_euler(safe_mode)[component]
+        return matrix.to_scale()[component]
+        
+    # Fallback: Custom properties / arbitrary paths
+    try:
+        if pb:
+            try:
+                return pb.path_resolve(raw_path)
+            except:
+                return driver_obj.path_resolve(raw_path) # Fallback to Obj if bone fails
+        return driver_obj.path_resolve(raw_path)
+    except:
+        raise ValueError(raw_path)
+
+def driver_id_string(driver_obj, props):
+    """Generate a unique ID for the driver source (used in SDK constraint/action names)"""
+    # Sanitization Helper
+    def clean(s):
+        return "".join([c if c.isalnum() else "_" for c in s])
+        
+    d_name = clean(driver_obj.name)
+    d_sub = clean(props.driver_bone) if (driver_obj.type == 'ARMATURE' and props.driver_bone) else ""
+    d_path = clean(props.driver_data_path)
+    
+    full = f"{d_name}_{d_sub}_{d_path}"
+    return re.sub(r'_+', '_', full).strip('_')
+
+def sdk_constraint_name(driver_obj, props):
+    """Name of the SDK constraint Key Driver creates for the current settings"""
+    custom_name = props.pose_action_name.strip() if hasattr(props, "pose_action_name") else ""
+    if custom_name:
+        return f"SDK_{custom_name}"
+    return f"SDK_{driver_id_string(driver_obj, props)}"
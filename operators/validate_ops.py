@@ -0,0 +1,63 @@
+import bpy
+from .utils import iter_sdk_drivers, simplify_driver_expression
+from .expressions import SIMPLE_EVAL_COST_US, measure_python_cost
+
+class BSETUP_OT_ValidateDriverExpressions(bpy.types.Operator):
+    """Scan all addon-created drivers for expressions that fall back to the Python interpreter"""
+    bl_idname = "bsetup.validate_driver_expressions"
+    bl_label = "Validate Driver Expressions"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    auto_fix: bpy.props.BoolProperty(
+        name="Auto Rewrite",
+        description="Rewrite slow expressions into simple-expression form where an equivalent exists",
+        default=False
+    )
+
+    def execute(self, context):
+        namespace = bpy.app.driver_namespace
+
+        total = 0
+        slow = []
+        fixed = 0
+        cost_us = 0.0
+
+        for owner, fc, kind in iter_sdk_drivers():
+            drv = fc.driver
+            total += 1
+
+            # AVERAGE / SUM / MIN / MAX never touch the expression evaluator
+            if drv.type != 'SCRIPTED':
+                cost_us += SIMPLE_EVAL_COST_US
+                continue
+
+            if drv.is_simple_expression:
+                cost_us += SIMPLE_EVAL_COST_US
+                continue
+
+            if self.auto_fix and not drv.use_self and simplify_driver_expression(drv):
+                fixed += 1
+                cost_us += SIMPLE_EVAL_COST_US
+                print(f"[MayaShapeKeys] Rewrote {owner.name}: {fc.data_path} -> '{drv.expression}'")
+                continue
+
+            var_names = [v.name for v in drv.variables]
+            est = measure_python_cost(drv.expression, var_names, namespace)
+            if est is None:
+                est = 0.0
+            cost_us += est
+            slow.append((owner.name, fc.data_path, drv.expression, est, drv.use_self))
+
+        # Detailed listing goes to the console, summary to the status bar
+        for owner_name, path, expr, est, use_self in slow:
+            reason = " (uses 'self')" if use_self else ""
+            print(f"[MayaShapeKeys] Python driver{reason}: {owner_name}: {path} = '{expr}' (~{est:.1f} us)")
+
+        print(f"[MayaShapeKeys] Scanned {total} drivers, {len(slow)} on Python path, est. {cost_us:.1f} us/frame")
+
+        if slow:
+            self.report({'WARNING'}, f"{len(slow)}/{total} drivers use Python expressions (~{cost_us:.0f} us/frame). See console.")
+        else:
+            self.report({'INFO'}, f"All {total} drivers use simple expressions (Fixed {fixed}, ~{cost_us:.0f} us/frame)")
+
+        return {'FINISHED'}
@@ -50,6 +50,32 @@ class DriverToolSettings(bpy.types.PropertyGroup):
     drive_rotation: bpy.props.BoolProperty(name="Rotation", default=True)
     drive_scale: bpy.props.BoolProperty(name="Scale", default=False)
     
+    # Pose SDK Type
+    pose_sdk_mode: bpy.props.EnumProperty(
+        name="SDK Mode",
+        items=[
+            ('INFLUENCE', "Rest + Pose", "One pose per constraint, blended in by a driven influence"),
+            ('MULTI_KEY', "Multi-Key", "Add further keys to the SDK action, mapping driver values to action frames through the constraint range"),
+        ],
+        default='INFLUENCE'
+    )
+    
+    # Influence Driver Evaluation
+    influence_mode: bpy.props.EnumProperty(
+        name="Influence Mode",
+        items=[
+            ('EXPRESSION', "Expression", "Scripted clamp((var - rest) / range, 0, 1) expression"),
+            ('FCURVE', "F-Curve", "Average driver with a clamped two-key linear F-Curve (no expression evaluation)"),
+        ],
+        default='EXPRESSION'
+    )
+    
+    use_driver_hub: bpy.props.BoolProperty(
+        name="Driver Hub",
+        description="Evaluate each driver channel once into a custom property on the driver bone and let all SDK drivers read it (cheaper playback for heavily shared controllers)",
+        default=False
+    )
+    
     # Pose Action Naming
     pose_action_name: bpy.props.StringProperty(
         name="Action Name",
@@ -64,6 +90,7 @@ class DriverToolSettings(bpy.types.PropertyGroup):
     # Combo / Corrective Shape Tool
     combo_shape_a: bpy.props.StringProperty(name="Shape A", description="First shape key")
     combo_shape_b: bpy.props.StringProperty(name="Shape B", description="Second shape key")
+    combo_extra_shapes: bpy.props.StringProperty(name="More Shapes", description="Comma separated further input shape keys for N-way combos")
     combo_name: bpy.props.StringProperty(name="New Shape Name", description="Name of the corrective shape", default="Corrective")
     
     # Creation Tool
@@ -72,6 +99,8 @@ class DriverToolSettings(bpy.types.PropertyGroup):
     # In-Between Tool
     ib_source: bpy.props.StringProperty(name="Parent Shape", description="Shape key to add in-between for")
     ib_value: bpy.props.FloatProperty(name="Trigger Value", default=0.5, min=0.0, max=1.0)
+    ib_chain: bpy.props.StringProperty(name="Chain", description="Comma separated trigger values (e.g. 0.25, 0.5, 0.75) to create a whole in-between chain at once. Overrides Trigger Value")
+    ib_capture: bpy.props.BoolProperty(name="Capture Mix", description="Store the current shape mix (parent at the trigger value) as the correction of a single new in-between. Keys driven by the parent (combos, correctives) are left out", default=False)
 
     # Asymmetry Tool
     asym_shape_name: bpy.props.StringProperty(name="Asym Shape Name", description="Name for the asymmetrical shape key")
@@ -0,0 +1,42 @@
+import importlib.util
+import os
+
+# Load the module directly (operators/__init__.py needs bpy)
+_path = os.path.join(os.path.dirname(__file__), "..", "operators", "expressions.py")
+_spec = importlib.util.spec_from_file_location("expressions", _path)
+expressions = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(expressions)
+
+
+def test_generated_expressions_are_simple():
+    assert expressions.is_simple_expression("clamp((var - 0.000) / 1.5708, 0, 1)", ["var"])
+    assert expressions.is_simple_expression("clamp(((-var) - 1.000) / 0.5000, 0, 1)", ["var"])
+    assert expressions.is_simple_expression("A * B", ["A", "B"])
+    assert expressions.is_simple_expression("var if var > 0 else -var", ["var"])
+
+
+def test_python_only_expressions():
+    assert not expressions.is_simple_expression("var ** 2", ["var"])
+    assert not expressions.is_simple_expression("math.sin(var)", ["var"])
+    assert not expressions.is_simple_expression("other * 2", ["var"])
+    assert not expressions.is_simple_expression("var[0]", ["var"])
+
+
+def test_rewrites():
+    assert expressions.simplify_expression("var ** 2", ["var"]) == "pow(var, 2)"
+    assert expressions.simplify_expression("math.sin(var) * math.pi", ["var"]) == "sin(var) * pi"
+    assert expressions.simplify_expression("np.clip(var, 0, 1)", ["var"]) == "clamp(var, 0, 1)"
+    assert expressions.simplify_expression("var", ["var"]) is None
+    assert expressions.simplify_expression("foo(var)", ["var"]) is None
+
+
+def test_measure_cost():
+    assert expressions.measure_python_cost("var * 2", ["var"], repeat=10) > 0
+    assert expressions.measure_python_cost("var +", ["var"]) is None
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_"):
+            func()
+            print(f"{name}: OK")
@@ -0,0 +1,84 @@
+import importlib.util
+import os
+
+# Load the module directly (operators/__init__.py needs bpy)
+_path = os.path.join(os.path.dirname(__file__), "..", "operators", "naming.py")
+_spec = importlib.util.spec_from_file_location("naming", _path)
+naming = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(naming)
+
+
+def test_flip_conventions():
+    cases = {
+        "Bone.L": "Bone.R",
+        "Bone_R": "Bone_L",
+        "Leg_L_01": "Leg_R_01",
+        "Arm.L.002": "Arm.R.002",
+        "index_01_l.001": "index_01_r.001",
+        "L_Arm": "R_Arm",
+        "R.Arm": "L.Arm",
+        "LeftArm": "RightArm",
+        "arm_right": "arm_left",
+        "left_brow.001": "right_brow.001",
+        "Brow_LeftUp": "Brow_RightUp",
+        "eyeBlinkLeft": "eyeBlinkRight",
+        "mouthSmileRight": "mouthSmileLeft",
+        "cheekPuffLeft": "cheekPuffRight",
+        "jawLeft": "jawRight",
+        "armLeft": "armRight",
+        "Brow_UpLeft": "Brow_UpRight",
+        "Bright_left": "Bright_right",
+        "SDK_ACT_Bone.L_Key": "SDK_ACT_Bone.R_Key",
+    }
+    for name, flipped in cases.items():
+        assert naming.flip_name(name) == flipped, name
+        assert naming.flip_name(flipped) == name, flipped
+
+
+def test_unsided_names():
+    for name in ("Spine", "Lower", "L", "Basis", "Leaf.001", "Bright", "Brightness", "mouth_cleft", "brow_upright", "Leftover"):
+        assert naming.flip_name(name) is None, name
+
+
+def test_rule_priority():
+    # Suffixes win over words, only the first matching rule is applied
+    assert naming.flip_name("Left_Arm_L") == "Left_Arm_R"
+    assert naming.flip_name("Arm_L.L") == "Arm_R.L"
+
+
+def test_side():
+    conv = naming.DEFAULT_CONVENTION
+    assert conv.side("Arm.L") == 'LEFT'
+    assert conv.side("R_Arm") == 'RIGHT'
+    assert conv.side("arm_right") == 'RIGHT'
+    assert conv.side("Spine") is None
+
+
+def test_custom_convention():
+    conv = naming.NamingConvention(((r'^{side}', ("lf",), ("rt",)),))
+    assert conv.flip("lfArm") == "rtArm"
+    assert conv.flip("rtArm") == "lfArm"
+    assert conv.flip("Arm.L") is None
+
+
+def test_mirror_map():
+    names = ["Arm.L", "Arm.R", "Hand.L", "Spine", "Smile_L", "Smile_R"]
+    m = naming.build_mirror_map(names)
+    assert m.partner("Arm.L") == "Arm.R"
+    assert m.partner("Arm.R") == "Arm.L"
+    assert m.partner("Hand.L") is None
+    assert m.flip("Hand.L") == "Hand.R"
+    assert m.unpaired == {"Hand.L"}
+    assert m.centers == {"Spine"}
+    assert len(m) == 4
+
+    # Cached against the name set, not the order
+    assert naming.build_mirror_map(reversed(names)) is m
+    assert naming.build_mirror_map(names + ["Hand.R"]) is not m
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_"):
+            func()
+            print(f"{name}: OK")
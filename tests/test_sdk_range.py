@@ -0,0 +1,59 @@
+import importlib.util
+import os
+
+# Load the module directly (operators/__init__.py needs bpy)
+_path = os.path.join(os.path.dirname(__file__), "..", "operators", "sdk_range.py")
+_spec = importlib.util.spec_from_file_location("sdk_range", _path)
+sdk_range = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sdk_range)
+
+FPU = 100.0
+
+
+def _mirror_channel_range(value_min, value_max, frame_start, frame_end):
+    # pose_ops MirrorPoseDriver: range negated, keys reflected about frame_start + frame_end
+    return -value_max, -value_min, frame_start, frame_end
+
+
+def test_identity_range():
+    mapping = sdk_range.range_mapping(-0.2, 0.5, -20, 50)
+    assert abs(sdk_range.value_to_frame(mapping, 0.3) - 30.0) < 1e-9
+    assert abs(sdk_range.frame_to_value(mapping, 30.0) - 0.3) < 1e-9
+    assert sdk_range.range_mapping(0.5, 0.5, 0, 10) is None
+
+
+def test_mirrored_constraint_roundtrip():
+    value_min, value_max, frame_start, frame_end = -0.2, 0.5, -20, 50
+    src_frame = 0.3 * FPU
+
+    m_min, m_max, m_start, m_end = _mirror_channel_range(value_min, value_max, frame_start, frame_end)
+    mapping = sdk_range.range_mapping(m_min, m_max, m_start, m_end)
+    # The mirrored input (-0.3) lands on the reflected key, not on the identity frame -30
+    frame = sdk_range.value_to_frame(mapping, -0.3)
+    assert abs(frame - (frame_start + frame_end - src_frame)) < 1e-9
+    assert abs(sdk_range.frame_to_value(mapping, frame) + 0.3) < 1e-9
+
+    # Refitting around a new key keeps the mapping: old poses stay at their driver values
+    start, end, v_start, v_end = sdk_range.fit_frame_range(mapping, [frame, -20.0, 80.0])
+    assert (start, end) == (-20, 80)
+    refit = sdk_range.range_mapping(v_start, v_end, start, end)
+    assert abs(sdk_range.value_to_frame(refit, -0.3) - frame) < 1e-9
+
+
+def test_inverted_eval_time_keeps_direction():
+    # eval_time curve copied with invert: driver rest/target negated (scale < 0)
+    mapping = sdk_range.range_mapping(-0.0, -0.8, 0, 80)
+    frame = sdk_range.value_to_frame(mapping, -0.4)
+    assert abs(frame - 40.0) < 1e-9
+
+    start, end, v_start, v_end = sdk_range.fit_frame_range(mapping, [0.0, 80.0, 120.0])
+    assert (start, end) == (0, 120)
+    assert v_start > v_end
+    assert abs(sdk_range.value_to_frame(sdk_range.range_mapping(v_start, v_end, start, end), -0.4) - frame) < 1e-9
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_"):
+            func()
+            print(f"{name}: OK")
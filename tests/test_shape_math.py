@@ -0,0 +1,205 @@
+import importlib.util
+import os
+
+import numpy as np
+
+# Load the module directly (operators/__init__.py needs bpy)
+_path = os.path.join(os.path.dirname(__file__), "..", "operators", "shape_math.py")
+_spec = importlib.util.spec_from_file_location("shape_math", _path)
+shape_math = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(shape_math)
+
+
+def _symmetric_basis():
+    # 0: left, 1: right partner of 0, 2: center, 3: unmatched
+    basis = np.array([[1.0, 0.0, 0.0], [-1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [2.0, 2.0, 0.0]], dtype=np.float32)
+    sym_map = np.array([1, 0, 2, -1], dtype=np.int32)
+    return basis, sym_map
+
+
+def test_mirror_moves_offsets_to_partner():
+    basis, sym_map = _symmetric_basis()
+    source = basis.copy()
+    source[0] += (0.5, 0.2, 0.1) # Left vertex pushed outwards, up and forward
+
+    out = shape_math.mirror_shape_coords(basis, source, sym_map)
+    assert np.allclose(out[1], basis[1] + (-0.5, 0.2, 0.1))
+    assert np.allclose(out[0], basis[0])
+
+
+def test_mirror_center_and_unmatched():
+    basis, sym_map = _symmetric_basis()
+    source = basis.copy()
+    source[2] += (0.3, 0.0, 0.0)
+    source[3] += (0.0, 0.0, 1.0)
+
+    out = shape_math.mirror_shape_coords(basis, source, sym_map)
+    assert np.allclose(out[2], basis[2] + (-0.3, 0.0, 0.0))
+    assert np.allclose(out[3], source[3])
+
+
+def test_mirror_twice_is_identity():
+    basis, sym_map = _symmetric_basis()
+    rng = np.random.default_rng(0)
+    source = basis + rng.normal(size=basis.shape).astype(np.float32)
+
+    twice = shape_math.mirror_shape_coords(basis, shape_math.mirror_shape_coords(basis, source, sym_map), sym_map)
+    assert np.allclose(twice, source, atol=1e-6)
+
+
+def test_topology_sym_map_unmatched():
+    # 0 <-> 1 swapped, 2 center, 3 unmatched: what Blender's topology mirror does to the markers
+    co = shape_math.topology_marker_coords(4)
+    mirrored = co[[1, 0, 2, 3]].copy()
+    mirrored[:3, 0] *= -1.0
+
+    assert shape_math.topology_sym_map(mirrored).tolist() == [1, 0, 2, -1]
+
+
+def test_partial_matches_full_mirror():
+    basis, sym_map = _symmetric_basis()
+    rng = np.random.default_rng(1)
+    old = basis + rng.normal(size=basis.shape).astype(np.float32)
+    target = shape_math.mirror_shape_coords(basis, old, sym_map)
+
+    new = old.copy()
+    new[0] += (0.1, 0.2, 0.3)
+    new[3] += (1.0, 0.0, 0.0)
+    changed = shape_math.changed_vertices(old, new)
+    assert changed.tolist() == [0, 3]
+
+    shape_math.mirror_shape_coords_partial(basis, new, target, sym_map, changed)
+    assert np.allclose(target, shape_math.mirror_shape_coords(basis, new, sym_map), atol=1e-6)
+
+
+def test_split_weights():
+    x = np.array([-2.0, -0.5, -0.25, 0.0, 0.25, 0.5, 2.0])
+    hard = shape_math.split_weights(x)
+    assert hard.tolist() == [0.0, 0.0, 0.0, 0.5, 1.0, 1.0, 1.0]
+
+    for curve in ('LINEAR', 'SMOOTHSTEP'):
+        w = shape_math.split_weights(x, blend_width=1.0, curve=curve)
+        assert w[0] == 0.0 and w[-1] == 1.0 and w[3] == 0.5
+        assert np.all(np.diff(w) >= 0.0)
+        # Mirrored positions get complementary weights, so L + R is the full shape
+        assert np.allclose(w + w[::-1], 1.0)
+
+    assert np.isclose(shape_math.split_weights(np.array([0.25]), 1.0)[0], 0.75)
+    assert np.isclose(shape_math.split_weights(np.array([0.25]), 1.0, 'SMOOTHSTEP')[0], 0.84375)
+
+
+def test_axis_bands_partition():
+    coord = np.linspace(-1.0, 2.0, 31)
+    for width in (0.0, 0.5):
+        bands = shape_math.axis_band_weights(coord, 3, width, 'SMOOTHSTEP')
+        assert bands.shape == (3, 31)
+        assert np.all(bands >= 0.0)
+        assert np.allclose(bands.sum(axis=0), 1.0)
+    hard = shape_math.axis_band_weights(coord, 3)
+    assert hard[0, 0] == 1.0 and hard[1, 15] == 1.0 and hard[2, -1] == 1.0
+
+
+def test_region_split_sums_to_source():
+    rng = np.random.default_rng(2)
+    basis = rng.normal(size=(5, 3)).astype(np.float32)
+    delta = rng.normal(size=(5, 3)).astype(np.float32)
+    raw = np.array([[1.0, 0.5, 0.0, 0.0, 0.2], [0.0, 0.5, 2.0, 0.0, 0.2]])
+
+    weights, uncovered = shape_math.normalize_region_weights(raw)
+    assert uncovered == 1
+    assert np.allclose(weights.sum(axis=0), 1.0)
+    assert np.allclose(weights[:, 3], 0.5)
+
+    pieces = shape_math.split_region_coords(basis, delta, weights)
+    assert pieces.shape == (2, 5, 3)
+    assert np.allclose((pieces - basis).sum(axis=0), delta, atol=1e-6)
+
+
+def test_combo_residual_roundtrip():
+    rng = np.random.default_rng(3)
+    basis = rng.normal(size=(6, 3)).astype(np.float32)
+    deltas = [rng.normal(size=(6, 3)).astype(np.float32) for _ in range(3)]
+    fix = rng.normal(size=(6, 3)).astype(np.float32)
+
+    captured = shape_math.combo_mix(basis, deltas)
+    assert np.allclose(captured, basis + deltas[0] + deltas[1] + deltas[2], atol=1e-6)
+    assert not np.shares_memory(captured, basis)
+
+    residual = shape_math.combo_residual(captured + fix, basis, deltas)
+    assert np.allclose(residual, fix, atol=1e-5)
+    assert np.allclose(shape_math.combo_residual(captured, basis, deltas), 0.0, atol=1e-5)
+
+
+def test_mix_shapes():
+    rng = np.random.default_rng(4)
+    basis = rng.normal(size=(7, 3)).astype(np.float32)
+    deltas = rng.normal(size=(4, 7, 3)).astype(np.float32)
+    values = np.array([0.5, 0.0, 2.0, -1.0], dtype=np.float32)
+
+    expected = basis + sum(v * d for v, d in zip(values, deltas))
+    assert np.allclose(shape_math.mix_shapes(basis, deltas, values), expected, atol=1e-5)
+
+    # Slider ranges clamp the values
+    lo, hi = np.zeros(4, dtype=np.float32), np.ones(4, dtype=np.float32)
+    clamped = basis + 0.5 * deltas[0] + deltas[2]
+    assert np.allclose(shape_math.mix_shapes(basis, deltas, values, lo, hi), clamped, atol=1e-5)
+
+    # A batch of mixes, including an all-zero one
+    batch = np.stack([values, np.zeros(4, dtype=np.float32)])
+    mixed = shape_math.mix_shapes(basis, deltas, batch)
+    assert mixed.shape == (2, 7, 3)
+    assert np.allclose(mixed[0], expected, atol=1e-5) and np.allclose(mixed[1], basis)
+    assert np.allclose(shape_math.mix_shapes(basis, deltas, np.zeros(4)), basis)
+
+
+def test_sparse_roundtrip_and_stats():
+    deltas = np.zeros((3, 10, 3), dtype=np.float32)
+    deltas[0, [1, 4]] = (0.5, 0.0, 0.0)
+    deltas[0, 7] = (1e-8, 0.0, 0.0) # Below tolerance: dropped
+    deltas[2, 9] = (0.0, 3.0, 4.0)
+
+    moved, max_disp, dense, sparse = shape_math.sparse_shape_stats(deltas)
+    assert moved.tolist() == [2, 0, 1]
+    assert np.allclose(max_disp, [0.5, 0.0, 5.0])
+    assert dense.tolist() == [120, 120, 120]
+    assert sparse.tolist() == [2 * shape_math.SPARSE_ENTRY_BYTES, 0, shape_math.SPARSE_ENTRY_BYTES]
+
+    offsets, indices, values = shape_math.pack_sparse_shapes(deltas)
+    assert offsets.tolist() == [0, 2, 2, 3]
+    assert indices.tolist() == [1, 4, 9]
+    assert values.shape == (3, 3)
+
+    restored = shape_math.unpack_sparse_shapes(offsets, indices, values, 10)
+    expected = deltas.copy()
+    expected[0, 7] = 0.0
+    assert np.array_equal(restored, expected)
+
+
+def test_zero_noise():
+    deltas = np.zeros((2, 4, 3), dtype=np.float32)
+    deltas[0, 0] = (1e-5, 0.0, 0.0)
+    deltas[0, 1] = (0.5, 0.0, 0.0)
+    deltas[1, 2] = (0.0, 2e-5, 0.0)
+
+    cleaned, zeroed = shape_math.zero_noise(deltas, 1e-4)
+    assert zeroed.tolist() == [1, 1]
+    assert np.array_equal(cleaned[0, 1], deltas[0, 1])
+    assert not cleaned[0, 0].any() and not cleaned[1].any()
+
+
+def test_find_duplicate_groups():
+    rng = np.random.default_rng(5)
+    base = rng.normal(size=(6, 20, 3)).astype(np.float32)
+    deltas = np.concatenate([base, base[[1]], base[[1]] + 2e-6, base[[4]] + 3e-6, base[[1]]])
+    deltas[9, 0, 0] += 1e-3 # Too far from key 1
+
+    assert shape_math.find_duplicate_groups(deltas, tolerance=1e-5) == [[1, 6, 7], [4, 8]]
+    assert shape_math.find_duplicate_groups(deltas, 1e-5, candidates=[0, 2, 3]) == []
+    assert shape_math.find_duplicate_groups(deltas[:0]) == []
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_"):
+            func()
+            print(f"{name}: OK")
@@ -1,4 +1,5 @@
 import bpy
+from .operators.utils import batch_depth
 
 # --- UI List for Shape Keys ---
 class BSETUP_UL_ShapeKeyList(bpy.types.UIList):
@@ -66,6 +67,16 @@ class BSETUP_PT_DriverTool(bpy.types.Panel):
         scene = context.scene
         props = scene.maya_shape_keys
 
+        # --- OPEN RIG BUILD ---
+        depth = batch_depth()
+        if depth:
+            box = layout.box()
+            box.alert = True
+            box.label(text=f"Rig Build open ({depth} level{'s' if depth > 1 else ''}): updates deferred", icon='ERROR')
+            row = box.row(align=True)
+            row.operator("bsetup.batch_commit", text="Commit", icon='CHECKMARK')
+            row.operator("bsetup.batch_abort", text="Abort", icon='X')
+
         # --- DRIVER SECTION ---
         box = layout.box()
         col = box.column(align=True)
@@ -107,6 +118,8 @@ class BSETUP_PT_DriverTool(bpy.types.Panel):
             row.prop(props, "driver_value", text="Current Val")
             row.operator("bsetup.update_driver_val", text="", icon='FILE_REFRESH')
             row.operator("bsetup.snap_driver_val", text="", icon='IMPORT')
+            
+            col.prop(props, "use_driver_hub")
 
 
         # --- DRIVEN SECTION ---
@@ -138,6 +151,12 @@ class BSETUP_PT_DriverTool(bpy.types.Panel):
              row.prop(props, "drive_rotation", toggle=True, text="Rot")
              row.prop(props, "drive_scale", toggle=True, text="Scale")
              
+             row = col.row(align=True)
+             row.prop(props, "pose_sdk_mode", expand=True)
+             if props.pose_sdk_mode == 'INFLUENCE':
+                 row = col.row(align=True)
+                 row.prop(props, "influence_mode", expand=True)
+             
              col.separator()
              col.prop(props, "pose_action_name", text="Action Name")
              
@@ -176,6 +195,13 @@ class BSETUP_PT_DriverTool(bpy.types.Panel):
                  
                  if not found_any:
                      box.label(text="No SDK Constraints", icon='INFO')
+                 
+                 if "_SDK_COMPILED" in active_pb:
+                     box.label(text=f"Compiled ({len(active_pb['_SDK_COMPILED'])} SDKs)", icon='LOCKED')
+                     
+                 row = box.row(align=True)
+                 row.operator("bsetup.compile_pose_stack", text="Compile", icon='LOCKED')
+                 row.operator("bsetup.decompile_pose_stack", text="Decompile", icon='UNLOCKED')
              else:
                  box.label(text="Select a Pose Bone", icon='INFO')
 
@@ -185,10 +211,14 @@ class BSETUP_PT_DriverTool(bpy.types.Panel):
         row.scale_y = 1.4
         row.operator("bsetup.add_driver_key", text="Key Driver", icon='KEY_HLT')
         row.operator("bsetup.mirror_driver", text="Mirror", icon='MOD_MIRROR')
+        layout.operator("bsetup.live_sdk_session", text="Live Edit", icon='REC')
+        layout.operator("bsetup.mirror_rig", text="Mirror Whole Rig", icon='MOD_MIRROR')
         
         layout.separator()
         row = layout.row()
         row.prop(props, "driver_interpolation", expand=True)
+        
+        layout.operator("bsetup.validate_driver_expressions", text="Validate Drivers", icon='CHECKMARK')
 
 
 class BSETUP_PT_ShapeEditor(bpy.types.Panel):
@@ -232,6 +262,9 @@ class BSETUP_PT_ShapeEditor(bpy.types.Panel):
         
         col.separator()
         col.operator("bsetup.mirror_shape_and_driver", text="Mirror Shape & Driver", icon='MOD_MIRROR')
+        col.operator("bsetup.mirror_all_shapes", text="Mirror All Shapes", icon='MOD_MIRROR')
+        linked = bool(obj.get("_sdk_mirror_link"))
+        col.operator("bsetup.toggle_mirror_link", text="Live Mirror Link: On" if linked else "Live Mirror Link", icon='LINKED' if linked else 'UNLINKED', depress=linked)
         
         # Asymmetry
         box = layout.box()
@@ -241,7 +274,10 @@ class BSETUP_PT_ShapeEditor(bpy.types.Panel):
         row = col.row(align=True)
         row.prop(props, "asym_shape_name", text="")
         row.operator("bsetup.create_asym_shape", text="Create Asym Shape", icon='ADD')
-        col.operator("bsetup.split_shape", text="Split Active Shape L/R")
+        row = col.row(align=True)
+        row.operator("bsetup.split_shape", text="Split Active Shape L/R").split_mode = 'MASK'
+        row.operator("bsetup.split_shape", text="Baked").split_mode = 'BAKED'
+        col.operator("bsetup.split_shape", text="Split Into Regions...").split_mode = 'GROUPS'
         
         # Combo
         box = layout.box()
@@ -252,9 +288,14 @@ class BSETUP_PT_ShapeEditor(bpy.types.Panel):
         if obj.data.shape_keys:
              col.prop_search(props, "combo_shape_a", obj.data.shape_keys, "key_blocks", text="Shape A")
              col.prop_search(props, "combo_shape_b", obj.data.shape_keys, "key_blocks", text="Shape B")
+             col.prop(props, "combo_extra_shapes", text="More")
              col.separator()
              col.prop(props, "combo_name", text="Name")
              col.operator("bsetup.add_combo_shape", text="Create Combo")
+             row = col.row(align=True)
+             row.operator("bsetup.sculpt_combo", text="Sculpt Combo", icon='SCULPTMODE_HLT')
+             row.operator("bsetup.commit_combo", text="Commit", icon='CHECKMARK')
+             col.operator("bsetup.build_combo_lattice", text="Build Combo Lattice...", icon='MOD_LATTICE')
         else:
             col.label(text="Need Shape Keys", icon='INFO')
 
@@ -267,10 +308,33 @@ class BSETUP_PT_ShapeEditor(bpy.types.Panel):
         if obj.data.shape_keys:
              col.prop_search(props, "ib_source", obj.data.shape_keys, "key_blocks", text="Parent")
              col.prop(props, "ib_value", text="Trigger At")
+             col.prop(props, "ib_chain", text="Chain")
+             col.prop(props, "ib_capture")
              col.operator("bsetup.create_in_between", text="Create")
         else:
             col.label(text="Need Shape Keys", icon='INFO')
 
+        # Bake
+        box = layout.box()
+        col = box.column(align=True)
+        col.label(text="Bake", icon='ACTION')
+        if obj.data.shape_keys:
+             row = col.row(align=True)
+             row.operator("bsetup.bake_shape_drivers", text="Bake Drivers to Action").mode = 'BAKE'
+             row.operator("bsetup.bake_shape_drivers", text="", icon='LOOP_BACK').mode = 'RESTORE'
+        else:
+            col.label(text="Need Shape Keys", icon='INFO')
+
+        # Library
+        box = layout.box()
+        col = box.column(align=True)
+        col.label(text="Shape Library", icon='ASSET_MANAGER')
+        col.operator("bsetup.shape_key_report", text="Shape Key Report", icon='INFO')
+        col.operator("bsetup.cleanup_shape_keys", text="Clean Up Shape Keys...", icon='BRUSH_DATA')
+        row = col.row(align=True)
+        row.operator("bsetup.export_shape_library", text="Export", icon='EXPORT')
+        row.operator("bsetup.import_shape_library", text="Import", icon='IMPORT')
+
 
 
 class BSETUP_PT_ColorSettings(bpy.types.Panel):